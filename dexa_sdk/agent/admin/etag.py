@@ -0,0 +1,187 @@
+"""Conditional requests and response cache for the admin list routes."""
+
+import typing
+from collections import OrderedDict
+
+from aiohttp import web
+from dexa_sdk.agreements.da.v1_0.records.da_qrcode_record import (
+    DataAgreementQRCodeRecord,
+)
+from dexa_sdk.agreements.da.v1_0.records.da_template_record import (
+    DataAgreementTemplateRecord,
+)
+from dexa_sdk.agreements.dda.v1_0.records.dda_template_record import (
+    DataDisclosureAgreementTemplateRecord,
+)
+from dexa_sdk.marketplace.records.publish_dda_record import PublishDDARecord
+from dexa_sdk.marketplace.records.published_dda_template_record import (
+    PublishedDDATemplateRecord,
+)
+from dexa_sdk.storage.record_versions import RecordVersions
+
+# Record types the responses of the GET routes are built from, by route path
+CACHED_ROUTES = {
+    "/v1/data-agreements": (DataAgreementTemplateRecord.RECORD_TYPE,),
+    "/v1/data-agreements/{template_id}/qr": (DataAgreementQRCodeRecord.RECORD_TYPE,),
+    "/v1/data-disclosure-agreements": (
+        DataDisclosureAgreementTemplateRecord.RECORD_TYPE,
+    ),
+    "/v1/data-disclosure-agreements/marketplace": (PublishDDARecord.RECORD_TYPE,),
+    "/v1/data-marketplace/published-dda": (PublishedDDATemplateRecord.RECORD_TYPE,),
+}
+
+# Default responses kept in the cache
+DEFAULT_RESPONSE_CACHE_SIZE = 64
+
+CachedResponse = typing.NamedTuple(
+    "CachedResponse",
+    [("etag", str), ("status", int), ("content_type", str), ("body", bytes)],
+)
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check the If-None-Match header against the entity tag
+
+    Args:
+        if_none_match (str): If-None-Match header value
+        etag (str): Quoted entity tag
+
+    Returns:
+        bool: True if any of the tags match, weak tags compare equal
+    """
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+class ResponseCache:
+    """Least recently used cache of the admin list responses."""
+
+    def __init__(self, max_size: int = DEFAULT_RESPONSE_CACHE_SIZE) -> None:
+        """Initialise response cache
+
+        Args:
+            max_size (int, optional): Responses kept. Defaults to 64.
+        """
+        self._max_size = max_size
+
+        # Cached responses by path and query string, most recently used last
+        self._responses: typing.OrderedDict[str, CachedResponse] = OrderedDict()
+
+        # Requests answered not modified, served from the cache and by the handler
+        self.not_modified = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str, etag: str) -> typing.Optional[CachedResponse]:
+        """Returns the cached response, if still current
+
+        Args:
+            key (str): Path and query string
+            etag (str): Current entity tag
+
+        Returns:
+            typing.Optional[CachedResponse]: cached response
+        """
+        cached = self._responses.get(key)
+        if not cached or cached.etag != etag:
+            return None
+
+        self._responses.move_to_end(key)
+        return cached
+
+    def put(self, key: str, cached: CachedResponse) -> None:
+        """Cache the response, evicting the least recently used
+
+        Args:
+            key (str): Path and query string
+            cached (CachedResponse): Response
+        """
+        self._responses[key] = cached
+        self._responses.move_to_end(key)
+        while len(self._responses) > self._max_size:
+            self._responses.popitem(last=False)
+
+    def metrics(self) -> dict:
+        """Returns response cache metrics
+
+        Returns:
+            dict: cached responses, hits, misses and not modified responses
+        """
+        return {
+            "size": len(self._responses),
+            "max_size": self._max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "not_modified": self.not_modified,
+        }
+
+
+def make_etag_middleware(
+    versions: RecordVersions, cache: ResponseCache
+) -> typing.Callable:
+    """Middleware answering the cached routes from the record type versions
+
+    Args:
+        versions (RecordVersions): Record type versions
+        cache (ResponseCache): Response cache
+
+    Returns:
+        typing.Callable: aiohttp middleware
+    """
+
+    @web.middleware
+    async def etag_middleware(request: web.BaseRequest, handler: typing.Coroutine):
+        resource = request.match_info.route.resource
+        record_types = (
+            CACHED_ROUTES.get(resource.canonical)
+            if request.method == "GET" and resource
+            else None
+        )
+        if not record_types:
+            return await handler(request)
+
+        # Tag is computed before the handler runs, a change saved meanwhile
+        # makes the stored tag stale rather than the response
+        key = request.path_qs
+        etag = versions.tag(record_types, key)
+
+        # Client copy is current, storage is not queried
+        if etag_matches(request.headers.get("If-None-Match", ""), etag):
+            cache.not_modified += 1
+            return web.Response(status=304, headers={"ETag": etag})
+
+        cached = cache.get(key, etag)
+        if cached:
+            cache.hits += 1
+            return web.Response(
+                status=cached.status,
+                body=cached.body,
+                content_type=cached.content_type,
+                headers={"ETag": etag},
+            )
+
+        cache.misses += 1
+        response = await handler(request)
+        if (
+            isinstance(response, web.Response)
+            and response.status == 200
+            and isinstance(response.body, bytes)
+        ):
+            cache.put(
+                key,
+                CachedResponse(
+                    etag, response.status, response.content_type, response.body
+                ),
+            )
+            response.headers["ETag"] = etag
+
+        return response
+
+    return etag_middleware
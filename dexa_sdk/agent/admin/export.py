@@ -0,0 +1,221 @@
+"""Streaming export of agreement instances and audit records as NDJSON."""
+
+import json
+import logging
+import typing
+
+from aiohttp import web
+from aiohttp_apispec import docs, querystring_schema
+from dexa_sdk.managers.ada_manager import V2ADAManager
+from dexa_sdk.managers.dexa_manager import DexaManager
+from dexa_sdk.utils import clean_and_get_field_from_dict
+from marshmallow import Schema, fields
+
+LOGGER = logging.getLogger(__name__)
+
+# Newline delimited JSON, a record per line
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+
+# Bytes buffered before writing to the response
+EXPORT_WRITE_SIZE = 64 * 1024
+
+# Records fetched from storage at a time
+EXPORT_PAGE_SIZE = 100
+
+
+class ExportDAInstancesQueryStringSchema(Schema):
+    """Query string schema for exporting data agreement instances."""
+
+    instance_id = fields.Str(required=False)
+    template_id = fields.Str(required=False)
+    template_version = fields.Str(required=False)
+    method_of_use = fields.Str(required=False)
+    third_party_data_sharing = fields.Str(required=False)
+    data_ex_id = fields.Str(required=False)
+    data_subject_did = fields.Str(required=False)
+
+
+class ExportDAPermissionsQueryStringSchema(Schema):
+    """Query string schema for exporting data agreement instance permissions."""
+
+    instance_id = fields.Str(required=False)
+
+
+class ExportPullDataRecordsQueryStringSchema(Schema):
+    """Query string schema for exporting pull data records."""
+
+    dda_instance_id = fields.Str(required=False)
+    dda_template_id = fields.Str(required=False)
+
+
+async def stream_ndjson(
+    request: web.BaseRequest, items: typing.AsyncIterator[dict], filename: str
+) -> web.StreamResponse:
+    """Write the items to a chunked response as newline delimited JSON
+
+    Lines are written as the items are read, waiting for the client to
+    read the response, so that only a buffer's worth is held in memory.
+
+    Args:
+        request (web.BaseRequest): aiohttp request object
+        items (typing.AsyncIterator[dict]): Items
+        filename (str): File name suggested to the client
+
+    Returns:
+        web.StreamResponse: the response
+    """
+    response = web.StreamResponse(
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+    response.content_type = NDJSON_CONTENT_TYPE
+    response.enable_chunked_encoding()
+    await response.prepare(request)
+
+    buffer = bytearray()
+    count = 0
+    try:
+        async for item in items:
+            buffer += json.dumps(item).encode() + b"\n"
+            count += 1
+            if len(buffer) >= EXPORT_WRITE_SIZE:
+                await response.write(bytes(buffer))
+                buffer.clear()
+    except Exception:
+        # Status is already sent, the response is left incomplete
+        LOGGER.exception("Error exporting %s after %d records", filename, count)
+        raise
+
+    if buffer:
+        await response.write(bytes(buffer))
+    await response.write_eof()
+
+    LOGGER.info("Exported %d records to %s", count, filename)
+
+    return response
+
+
+@docs(
+    tags=["auditor"],
+    summary="Export data agreement instances with permissions as NDJSON",
+)
+@querystring_schema(ExportDAInstancesQueryStringSchema())
+async def export_da_instances_handler(request: web.BaseRequest):
+    """
+    Request handler for exporting data agreement instances.
+
+    Args:
+        request: aiohttp request object
+
+    Returns:
+        The web response
+
+    """
+    context = request.app["request_context"]
+
+    template_id = clean_and_get_field_from_dict(request.query, "template_id")
+    template_version = clean_and_get_field_from_dict(request.query, "template_version")
+
+    # Validated before the response is prepared, status can't change later
+    if template_version and not template_id:
+        raise web.HTTPBadRequest(
+            reason="Template identifier is required to query by version"
+        )
+
+    # Initialise manager
+    mgr = V2ADAManager(context)
+
+    items = mgr.stream_data_agreement_instances(
+        instance_id=clean_and_get_field_from_dict(request.query, "instance_id"),
+        template_id=template_id,
+        template_version=template_version,
+        method_of_use=clean_and_get_field_from_dict(request.query, "method_of_use"),
+        third_party_data_sharing=clean_and_get_field_from_dict(
+            request.query, "third_party_data_sharing"
+        ),
+        data_ex_id=clean_and_get_field_from_dict(request.query, "data_ex_id"),
+        data_subject_did=clean_and_get_field_from_dict(
+            request.query, "data_subject_did"
+        ),
+        page_size=EXPORT_PAGE_SIZE,
+    )
+
+    return await stream_ndjson(request, items, "da-instances.ndjson")
+
+
+@docs(
+    tags=["auditor"],
+    summary="Export data agreement instance permissions as NDJSON",
+)
+@querystring_schema(ExportDAPermissionsQueryStringSchema())
+async def export_da_permissions_handler(request: web.BaseRequest):
+    """
+    Request handler for exporting data agreement instance permissions.
+
+    Args:
+        request: aiohttp request object
+
+    Returns:
+        The web response
+
+    """
+    context = request.app["request_context"]
+
+    # Initialise manager
+    mgr = V2ADAManager(context)
+
+    items = mgr.stream_da_instance_permissions(
+        instance_id=clean_and_get_field_from_dict(request.query, "instance_id"),
+        page_size=EXPORT_PAGE_SIZE,
+    )
+
+    return await stream_ndjson(request, items, "da-permissions.ndjson")
+
+
+@docs(
+    tags=["auditor"],
+    summary="Export pull data records as NDJSON",
+)
+@querystring_schema(ExportPullDataRecordsQueryStringSchema())
+async def export_pull_data_records_handler(request: web.BaseRequest):
+    """
+    Request handler for exporting pull data records.
+
+    Args:
+        request: aiohttp request object
+
+    Returns:
+        The web response
+
+    """
+    context = request.app["request_context"]
+
+    # Initialise manager
+    mgr = DexaManager(context)
+
+    items = mgr.stream_pull_data_records(
+        dda_instance_id=clean_and_get_field_from_dict(request.query, "dda_instance_id"),
+        dda_template_id=clean_and_get_field_from_dict(request.query, "dda_template_id"),
+        page_size=EXPORT_PAGE_SIZE,
+    )
+
+    return await stream_ndjson(request, items, "pulldata-records.ndjson")
+
+
+# Export routes
+ROUTES_EXPORT = [
+    web.get(
+        "/v1/auditor/data-agreements/instances/export",
+        export_da_instances_handler,
+        allow_head=False,
+    ),
+    web.get(
+        "/v1/auditor/data-agreements/permissions/export",
+        export_da_permissions_handler,
+        allow_head=False,
+    ),
+    web.get(
+        "/v1/auditor/data-disclosure-agreements/pulldata-records/export",
+        export_pull_data_records_handler,
+        allow_head=False,
+    ),
+]
@@ -6,23 +6,52 @@ import uuid
 from typing import Callable, Coroutine, Sequence, Set
 
 import aiohttp_cors
-from aiohttp import web
+from aiohttp import WSCloseCode, web
 from aries_cloudagent.admin.base_server import BaseAdminServer
 from aries_cloudagent.admin.error import AdminSetupError
 from aries_cloudagent.core.plugin_registry import PluginRegistry
 from aries_cloudagent.ledger.error import LedgerConfigError, LedgerTransactionError
 from aries_cloudagent.messaging.responder import BaseResponder
 from aries_cloudagent.transport.outbound.message import OutboundMessage
-from aries_cloudagent.transport.queue.basic import BasicMessageQueue
 from aries_cloudagent.utils.stats import Collector
 from aries_cloudagent.utils.task_queue import TaskQueue
 from aries_cloudagent.version import __version__
 from dexa_sdk.agent.admin.aiohttp_apispec.custom import custom_setup_aiohttp_apispec
+from dexa_sdk.agent.admin.etag import (
+    DEFAULT_RESPONSE_CACHE_SIZE,
+    ResponseCache,
+    make_etag_middleware,
+)
+from dexa_sdk.agent.admin.export import ROUTES_EXPORT
+from dexa_sdk.agent.admin.websocket import (
+    DEFAULT_WEBSOCKET_QUEUE_SIZE,
+    OVERFLOW_DROP_OLDEST,
+    WebsocketClientQueue,
+)
 from dexa_sdk.agent.config.injection_context import InjectionContext
+from dexa_sdk.agent.core.readiness import SubsystemReadiness
+from dexa_sdk.agent.core.task_lanes import LANE_BULK, TaskLanes
+from dexa_sdk.agent.transport.inbound.queue.base import BaseInboundQueue
+from dexa_sdk.agent.workers.coordinator import (
+    EVENT_ADMIN_NOTIFICATION,
+    EVENT_RECORD_CHANGED,
+    WorkerCoordinator,
+)
+from dexa_sdk.ledgers.ethereum.loader import inject_ethereum_client
+from dexa_sdk.managers.ada_manager import (
+    DA_TEMPLATE_BULK_PUBLISH_WEBHOOK_TOPIC,
+    V2ADAManager,
+)
 from dexa_sdk.managers.dexa_manager import DexaManager
+from dexa_sdk.storage.record_versions import RecordVersions
 from marshmallow import Schema, fields
 
-from aiohttp_apispec import docs, response_schema, validation_middleware
+from aiohttp_apispec import (
+    docs,
+    request_schema,
+    response_schema,
+    validation_middleware,
+)
 
 LOGGER = logging.getLogger(__name__)
 
@@ -51,6 +80,29 @@ class AdminStatusReadinessSchema(Schema):
     ready = fields.Boolean(description="Readiness status", example=True)
 
 
+class BulkPublishDATemplatesRequestSchema(Schema):
+    """Request schema for bulk publication of data agreement templates."""
+
+    template_ids = fields.List(
+        fields.Str(description="Template identifier"),
+        required=True,
+        description="Data agreement templates to be published",
+    )
+    concurrency = fields.Int(
+        required=False,
+        description="Templates published concurrently",
+        example=5,
+    )
+
+
+class BulkPublishDATemplatesResponseSchema(Schema):
+    """Response schema for bulk publication of data agreement templates."""
+
+    bulk_id = fields.Str(description="Bulk publication identifier")
+    total = fields.Int(description="Number of templates")
+    webhook_topic = fields.Str(description="Webhook topic for progress")
+
+
 class AdminResponder(BaseResponder):
     """Handle outgoing messages from message handlers."""
 
@@ -207,6 +259,7 @@ class AdminServer(BaseAdminServer):
         self.webhook_router = webhook_router
         self.webhook_targets = {}
         self.websocket_queues = {}
+        self.response_cache = None
         self.site = None
 
         self.context = context.start_scope("admin")
@@ -251,6 +304,19 @@ class AdminServer(BaseAdminServer):
 
             middlewares.append(check_token)
 
+        # Conditional requests and cached responses for the list routes,
+        # answered before the requests are queued
+        versions: RecordVersions = await self.context.inject(
+            RecordVersions, required=False
+        )
+        if versions and self.context.settings.get("dexa.admin_etag"):
+            self.response_cache = ResponseCache(
+                self.context.settings.get(
+                    "dexa.admin_response_cache_size", DEFAULT_RESPONSE_CACHE_SIZE
+                )
+            )
+            middlewares.append(make_etag_middleware(versions, self.response_cache))
+
         collector: Collector = await self.context.inject(Collector, required=False)
 
         if self.task_queue:
@@ -286,9 +352,16 @@ class AdminServer(BaseAdminServer):
                 web.get("/shutdown", self.shutdown_handler, allow_head=False),
                 web.get("/ws", self.websocket_handler, allow_head=False),
                 web.post("/webhooks/topic/{topic}/", self.webhook_handler),
+                web.post(
+                    "/v2/data-agreements/bulk-publish",
+                    self.bulk_publish_da_templates_handler,
+                ),
             ]
         )
 
+        # Streaming exports for auditors
+        app.add_routes(ROUTES_EXPORT)
+
         plugin_registry: PluginRegistry = await self.context.inject(
             PluginRegistry, required=False
         )
@@ -361,7 +434,39 @@ class AdminServer(BaseAdminServer):
         # order definitions alphabetically by dict key
         swagger_dict["definitions"] = sort_dict(swagger_dict["definitions"])
 
-        self.site = web.TCPSite(runner, host=self.host, port=self.port)
+        # Port is shared with other worker processes, if running in workers
+        self.site = web.TCPSite(
+            runner,
+            host=self.host,
+            port=self.port,
+            reuse_port=self.context.settings.get("dexa.reuse_port", False),
+        )
+
+        # Notifications from other workers for the websocket clients of this worker
+        coordinator = await self.context.inject(WorkerCoordinator, required=False)
+        if coordinator:
+            coordinator.subscribe(
+                EVENT_ADMIN_NOTIFICATION,
+                lambda event: self.send_websocket_notification(
+                    event["topic"], event["payload"]
+                ),
+            )
+
+            # Record changes are exchanged with other workers, invalidating
+            # the responses cached by them
+            versions: RecordVersions = await self.context.inject(
+                RecordVersions, required=False
+            )
+            if versions and self.response_cache:
+                versions.add_listener(
+                    lambda record_type: coordinator.publish(
+                        EVENT_RECORD_CHANGED, {"record_type": record_type}
+                    )
+                )
+                coordinator.subscribe(
+                    EVENT_RECORD_CHANGED,
+                    lambda event: versions.bump(event["record_type"], notify=False),
+                )
 
         try:
             await self.site.start()
@@ -430,6 +535,12 @@ class AdminServer(BaseAdminServer):
             status["timing"] = collector.results
         if self.conductor_stats:
             status["conductor"] = await self.conductor_stats()
+        if self.response_cache:
+            status["response_cache"] = self.response_cache.metrics()
+        status["websockets"] = {
+            socket_id: queue.metrics()
+            for socket_id, queue in self.websocket_queues.items()
+        }
         return web.json_response(status)
 
     @docs(tags=["server"], summary="Reset statistics")
@@ -478,6 +589,60 @@ class AdminServer(BaseAdminServer):
 
         return web.json_response({})
 
+    @docs(
+        tags=["data-agreements"],
+        summary="Publish data agreement templates in bulk",
+    )
+    @request_schema(BulkPublishDATemplatesRequestSchema())
+    @response_schema(BulkPublishDATemplatesResponseSchema(), 202)
+    async def bulk_publish_da_templates_handler(self, request: web.BaseRequest):
+        """
+        Request handler for bulk publication of data agreement templates.
+
+        Templates are published in the background, progress is reported
+        per template through webhooks.
+
+        Args:
+            request: aiohttp request object
+
+        Returns:
+            The web response
+
+        """
+
+        body = await request.json()
+        template_ids = body.get("template_ids", [])
+        concurrency = body.get("concurrency") or 5
+
+        if not template_ids or concurrency < 1:
+            raise web.HTTPBadRequest(reason="Invalid bulk publish request")
+
+        bulk_id = str(uuid.uuid4())
+
+        # Initialise manager
+        mgr = V2ADAManager(self.context)
+
+        coro = mgr.bulk_publish_da_templates_in_wallet(
+            template_ids, concurrency=concurrency, bulk_id=bulk_id
+        )
+        # Bulk lane, so that the publishing doesn't delay inbound messages
+        task_lanes: TaskLanes = await self.context.inject(TaskLanes, required=False)
+        if task_lanes:
+            task_lanes.put(LANE_BULK, coro)
+        elif self.task_queue:
+            self.task_queue.run(coro)
+        else:
+            asyncio.ensure_future(coro)
+
+        return web.json_response(
+            {
+                "bulk_id": bulk_id,
+                "total": len(template_ids),
+                "webhook_topic": DA_TEMPLATE_BULK_PUBLISH_WEBHOOK_TOPIC,
+            },
+            status=202,
+        )
+
     async def redirect_handler(self, request: web.BaseRequest):
         """Perform redirect to documentation."""
         raise web.HTTPFound("/api/doc")
@@ -516,7 +681,34 @@ class AdminServer(BaseAdminServer):
         """
         app_ready = self.app._state["ready"] and self.app._state["alive"]
         if app_ready:
-            return web.json_response({"ready": app_ready})
+            response = {"ready": app_ready}
+
+            # Not ready till the required subsystems are set up
+            readiness = await self.context.inject(SubsystemReadiness, required=False)
+            if readiness:
+                response["subsystems"] = readiness.snapshot()
+                if not readiness.ready:
+                    raise web.HTTPServiceUnavailable(reason="Subsystems not ready")
+
+            # Not ready for more messages if the inbound backlog is too deep
+            inbound_queue = await self.context.inject(BaseInboundQueue, required=False)
+            if inbound_queue:
+                response["inbound_queue"] = await inbound_queue.depth()
+                if not await inbound_queue.ready():
+                    raise web.HTTPServiceUnavailable(reason="Inbound queue is full")
+
+            # Warn if the accounts can't pay for anchoring transactions
+            eth_client = await inject_ethereum_client(self.context, required=False)
+            if eth_client:
+                low_balance = eth_client.account_state.low_balance()
+                if low_balance:
+                    response["warnings"] = [
+                        f"Balance of {name} account is below "
+                        f"{eth_client.account_state.min_balance} wei"
+                        for name in low_balance
+                    ]
+
+            return web.json_response(response)
         else:
             raise web.HTTPServiceUnavailable(reason="Service not ready")
 
@@ -550,7 +742,17 @@ class AdminServer(BaseAdminServer):
         ws = web.WebSocketResponse()
         await ws.prepare(request)
         socket_id = str(uuid.uuid4())
-        queue = BasicMessageQueue()
+
+        # Bounded queue, subscribed to the topics given, for e.g. ?topics=a,b
+        queue = WebsocketClientQueue(
+            self.context.settings.get(
+                "dexa.websocket_queue_size", DEFAULT_WEBSOCKET_QUEUE_SIZE
+            ),
+            self.context.settings.get(
+                "dexa.websocket_overflow_policy", OVERFLOW_DROP_OLDEST
+            ),
+            request.query.get("topics"),
+        )
         loop = asyncio.get_event_loop()
 
         if self.admin_insecure_mode:
@@ -605,6 +807,17 @@ class AdminServer(BaseAdminServer):
                             if self.admin_api_key and self.admin_api_key == msg_api_key:
                                 # authenticated via websocket message
                                 queue.authenticated = True
+                            if (
+                                isinstance(msg_received, dict)
+                                and "topics" in msg_received
+                            ):
+                                # subscribed via websocket message
+                                try:
+                                    queue.topic_filter = msg_received["topics"]
+                                except ValueError as err:
+                                    LOGGER.warning(
+                                        "Invalid websocket subscription: %s", err
+                                    )
 
                             receive = loop.create_task(ws.receive_json())
 
@@ -634,6 +847,12 @@ class AdminServer(BaseAdminServer):
             if not send.done():
                 send.cancel()
 
+            if queue.overflowed and not ws.closed:
+                await ws.close(
+                    code=WSCloseCode.TRY_AGAIN_LATER,
+                    message=b"Notifications not read in time",
+                )
+
         finally:
             del self.websocket_queues[socket_id]
 
@@ -664,6 +883,20 @@ class AdminServer(BaseAdminServer):
                         topic, payload, target.endpoint, target.max_attempts
                     )
 
-        for queue in self.websocket_queues.values():
-            if queue.authenticated or topic in ("ping", "settings"):
-                await queue.enqueue({"topic": topic, "payload": payload})
+        await self.send_websocket_notification(topic, payload)
+
+        # Websocket clients are connected to any of the worker processes
+        coordinator = await self.context.inject(WorkerCoordinator, required=False)
+        if coordinator:
+            await coordinator.publish(
+                EVENT_ADMIN_NOTIFICATION, {"topic": topic, "payload": payload}
+            )
+
+    async def send_websocket_notification(self, topic: str, payload: dict):
+        """Send notification to the websocket clients connected to this process."""
+        message = {"topic": topic, "payload": payload}
+
+        # Queued without waiting, a slow client only overflows its own queue
+        for queue in list(self.websocket_queues.values()):
+            if queue.accepts(topic):
+                queue.put(message)
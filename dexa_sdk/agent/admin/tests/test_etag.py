@@ -0,0 +1,84 @@
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+from aries_cloudagent.config.injection_context import InjectionContext
+from aries_cloudagent.storage.base import BaseStorage
+from aries_cloudagent.storage.basic import BasicStorage
+from asynctest import TestCase as AsyncTestCase
+from dexa_sdk.agent.admin.etag import ResponseCache, make_etag_middleware
+from dexa_sdk.marketplace.records.publish_dda_record import PublishDDARecord
+from dexa_sdk.storage.record_versions import RecordVersions
+
+
+class TestETagMiddleware(AsyncTestCase):
+    """Test conditional requests and response cache of the admin list routes"""
+
+    async def setUp(self):
+        self.context = InjectionContext()
+        self.context.injector.bind_instance(BaseStorage, BasicStorage())
+        self.versions = RecordVersions()
+        self.context.injector.bind_instance(RecordVersions, self.versions)
+        self.cache = ResponseCache(max_size=2)
+        self.queries = 0
+
+        async def list_handler(request):
+            self.queries += 1
+            records = await PublishDDARecord.query(self.context, {})
+            return web.json_response({"results": len(records)})
+
+        app = web.Application(
+            middlewares=[make_etag_middleware(self.versions, self.cache)]
+        )
+        app.add_routes(
+            [
+                web.get(
+                    "/v1/data-disclosure-agreements/marketplace",
+                    list_handler,
+                    allow_head=False,
+                ),
+                web.get("/status", list_handler, allow_head=False),
+            ]
+        )
+        self.client = TestClient(TestServer(app))
+        await self.client.start_server()
+
+    async def tearDown(self):
+        await self.client.close()
+
+    async def test_conditional_requests(self):
+        """Test responses are cached until a record of the type is saved"""
+
+        path = "/v1/data-disclosure-agreements/marketplace"
+        response = await self.client.get(path)
+        etag = response.headers["ETag"]
+        assert (await response.json()) == {"results": 0}
+
+        # Not modified, handler is not called
+        response = await self.client.get(path, headers={"If-None-Match": etag})
+        assert response.status == 304
+
+        # Served from the cache
+        response = await self.client.get(path)
+        assert (await response.json()) == {"results": 0}
+        assert self.queries == 1
+
+        # Saving a record invalidates the tag
+        await PublishDDARecord(connection_id="c", template_id="t").save(self.context)
+        assert self.versions.get(PublishDDARecord.RECORD_TYPE) == 1
+
+        response = await self.client.get(path, headers={"If-None-Match": etag})
+        assert response.status == 200
+        assert response.headers["ETag"] != etag
+        assert (await response.json()) == {"results": 1}
+        assert self.queries == 2
+
+        # Routes not listed are passed through
+        response = await self.client.get("/status")
+        assert "ETag" not in response.headers
+
+        assert self.cache.metrics() == {
+            "size": 1,
+            "max_size": 2,
+            "hits": 1,
+            "misses": 2,
+            "not_modified": 1,
+        }
@@ -0,0 +1,69 @@
+import json
+
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+from aries_cloudagent.config.injection_context import InjectionContext
+from aries_cloudagent.storage.base import BaseStorage
+from aries_cloudagent.storage.basic import BasicStorage
+from asynctest import TestCase as AsyncTestCase
+from dexa_sdk.agent.admin import export
+from dexa_sdk.agent.admin.export import NDJSON_CONTENT_TYPE, ROUTES_EXPORT
+from dexa_sdk.agreements.dda.v1_0.records.pull_data_record import PullDataRecord
+
+
+class TestExport(AsyncTestCase):
+    """Test streaming NDJSON exports"""
+
+    async def setUp(self):
+        self.context = InjectionContext()
+        self.context.injector.bind_instance(BaseStorage, BasicStorage())
+
+        app = web.Application()
+        app["request_context"] = self.context
+        app.add_routes(ROUTES_EXPORT)
+        self.client = TestClient(TestServer(app))
+        await self.client.start_server()
+
+    async def tearDown(self):
+        await self.client.close()
+
+    async def test_export_pull_data_records(self):
+        """Test records are written a line each, across several writes"""
+
+        for index in range(250):
+            await PullDataRecord(
+                dda_instance_id="i1" if index % 2 else "i2",
+                nonce=str(index),
+                state=PullDataRecord.STATE_REQUEST,
+            ).save(self.context)
+
+        # Small buffer and pages, to write the response in chunks
+        export.EXPORT_WRITE_SIZE, write_size = 1024, export.EXPORT_WRITE_SIZE
+        export.EXPORT_PAGE_SIZE, page_size = 10, export.EXPORT_PAGE_SIZE
+        try:
+            response = await self.client.get(
+                "/v1/auditor/data-disclosure-agreements/pulldata-records/export",
+                params={"dda_instance_id": "i1"},
+            )
+            body = await response.text()
+        finally:
+            export.EXPORT_WRITE_SIZE = write_size
+            export.EXPORT_PAGE_SIZE = page_size
+
+        assert response.status == 200
+        assert response.content_type == NDJSON_CONTENT_TYPE
+
+        records = [json.loads(line) for line in body.splitlines()]
+        assert len(records) == 125
+        assert {record["dda_instance_id"] for record in records} == {"i1"}
+        assert len({record["nonce"] for record in records}) == 125
+
+    async def test_export_da_instances_invalid_query(self):
+        """Test query is rejected before the response is streamed"""
+
+        response = await self.client.get(
+            "/v1/auditor/data-agreements/instances/export",
+            params={"template_version": "1.0.0"},
+        )
+
+        assert response.status == 400
@@ -0,0 +1,58 @@
+import asyncio
+
+from asynctest import TestCase as AsyncTestCase
+from dexa_sdk.agent.admin.websocket import OVERFLOW_DISCONNECT, WebsocketClientQueue
+
+
+class TestWebsocketClientQueue(AsyncTestCase):
+    """Test notification queue of admin websocket clients"""
+
+    async def test_drop_oldest(self):
+        """Test oldest notifications are dropped once the queue is full"""
+
+        queue = WebsocketClientQueue(max_size=2)
+        for index in range(3):
+            assert queue.put({"topic": "t", "payload": index})
+
+        assert (await queue.dequeue(timeout=1))["payload"] == 1
+        assert (await queue.dequeue(timeout=1))["payload"] == 2
+
+        metrics = queue.metrics()
+        assert metrics["dropped"] == 1
+        assert metrics["delivered"] == 2
+        assert metrics["queued"] == 0
+        assert metrics["lag_max"] >= 0.0
+
+    async def test_disconnect(self):
+        """Test client is disconnected once the queue is full"""
+
+        queue = WebsocketClientQueue(max_size=1, overflow_policy=OVERFLOW_DISCONNECT)
+        assert queue.put({"topic": "t"})
+        assert not queue.put({"topic": "t"})
+        assert queue.overflowed
+
+        with self.assertRaises(asyncio.CancelledError):
+            await queue.dequeue(timeout=1)
+
+    async def test_topic_filter(self):
+        """Test notifications are filtered by the topics subscribed to"""
+
+        queue = WebsocketClientQueue(topics=["a"])
+        assert queue.accepts("ping")
+        assert not queue.accepts("a")
+
+        queue.authenticated = True
+        assert queue.accepts("a")
+        assert not queue.accepts("b")
+
+        queue.topic_filter = ["*"]
+        assert queue.accepts("b")
+
+        # Comma separated topics, as in the query string
+        queue.topic_filter = "connections, basicmessages"
+        assert queue.topic_filter == {"connections", "basicmessages"}
+        assert queue.accepts("connections")
+        assert not queue.accepts("c")
+
+        with self.assertRaises(ValueError):
+            queue.topic_filter = {"topic": "connections"}
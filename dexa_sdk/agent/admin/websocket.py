@@ -0,0 +1,200 @@
+"""Bounded notification queues of the admin websocket clients."""
+
+import asyncio
+import logging
+import time
+import typing
+
+from aries_cloudagent.transport.queue.basic import BasicMessageQueue
+
+LOGGER = logging.getLogger(__name__)
+
+# Overflow policies, when a client doesn't read notifications in time
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+OVERFLOW_DISCONNECT = "disconnect"
+OVERFLOW_POLICIES = (OVERFLOW_DROP_OLDEST, OVERFLOW_DISCONNECT)
+
+# Default notifications queued per client
+DEFAULT_WEBSOCKET_QUEUE_SIZE = 100
+
+# Topics sent to every client, regardless of the authentication and filter
+UNFILTERED_TOPICS = ("ping", "settings")
+
+
+def parse_topics(
+    topics: typing.Union[str, typing.Sequence[str], None]
+) -> typing.Optional[typing.List[str]]:
+    """Parse the topics subscribed to
+
+    Args:
+        topics (typing.Union[str, typing.Sequence[str], None]): Comma
+            separated topics or list of topics
+
+    Raises:
+        ValueError: If the topics are neither a string nor a list of strings
+
+    Returns:
+        typing.Optional[typing.List[str]]: topics, None if not provided
+    """
+    if topics is None:
+        return None
+
+    if isinstance(topics, str):
+        topics = topics.split(",")
+    elif not isinstance(topics, (list, tuple, set)) or not all(
+        isinstance(topic, str) for topic in topics
+    ):
+        raise ValueError("Topics must be a string or a list of strings")
+
+    return [topic.strip() for topic in topics if topic.strip()]
+
+
+class WebsocketClientQueue(BasicMessageQueue):
+    """Notification queue of an admin websocket client.
+
+    Notifications are queued without waiting, so that a client reading
+    slowly doesn't hold back the others. Once the queue is full, the oldest
+    notification is dropped or the client is disconnected.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_WEBSOCKET_QUEUE_SIZE,
+        overflow_policy: str = OVERFLOW_DROP_OLDEST,
+        topics: typing.Union[str, typing.Sequence[str]] = None,
+    ):
+        """Initialise websocket client queue
+
+        Args:
+            max_size (int, optional): Notifications queued. Defaults to 100.
+            overflow_policy (str, optional): Policy once the queue is full.
+                Defaults to drop oldest.
+            topics (typing.Union[str, typing.Sequence[str]], optional): Topics
+                subscribed to, comma separated or a list, all if not provided.
+        """
+        self._max_size = max_size
+        self._overflow_policy = overflow_policy
+        super().__init__()
+
+        self.topic_filter = topics
+
+        # Set if the client is disconnected for not reading in time
+        self.overflowed = False
+
+        # Notifications delivered and dropped
+        self._delivered = 0
+        self._dropped = 0
+
+        # Seconds from queueing to delivery of the notifications
+        self._lag_last = 0.0
+        self._lag_max = 0.0
+
+    def make_queue(self) -> asyncio.Queue:
+        """Create the bounded queue instance."""
+        return asyncio.Queue(self._max_size)
+
+    @property
+    def topic_filter(self) -> typing.Optional[typing.Set[str]]:
+        """Accessor for the topics subscribed to, None if all"""
+        return self._topic_filter
+
+    @topic_filter.setter
+    def topic_filter(self, topics: typing.Union[str, typing.Sequence[str]]):
+        """Setter for the topics subscribed to, comma separated or a list
+
+        Raises:
+            ValueError: If the topics are neither a string nor a list of strings
+        """
+        topics = parse_topics(topics)
+        topics = set(topics) if topics else None
+        if topics and "*" in topics:
+            topics = None
+        self._topic_filter = topics
+
+    def accepts(self, topic: str) -> bool:
+        """Whether notifications of the topic are sent to the client
+
+        Args:
+            topic (str): Notification topic
+
+        Returns:
+            bool: True if sent
+        """
+        if topic in UNFILTERED_TOPICS:
+            return True
+
+        return self.authenticated and (
+            not self._topic_filter or topic in self._topic_filter
+        )
+
+    def put(self, message: dict) -> bool:
+        """Queue the notification without waiting, applying the overflow policy
+
+        Args:
+            message (dict): Notification
+
+        Returns:
+            bool: True if queued
+        """
+        if self.stop_event.is_set():
+            return False
+
+        if self.queue.full():
+            if self._overflow_policy == OVERFLOW_DISCONNECT:
+                LOGGER.warning("Disconnecting websocket client, queue is full")
+                self.overflowed = True
+                self.stop()
+                return False
+
+            self.queue.get_nowait()
+            self._dropped += 1
+
+        self.queue.put_nowait((time.monotonic(), message))
+
+        return True
+
+    async def enqueue(self, message: dict):
+        """Queue the notification without waiting
+
+        Args:
+            message (dict): Notification
+        """
+        self.put(message)
+
+    async def dequeue(self, *, timeout: int = None) -> typing.Optional[dict]:
+        """Dequeue a notification, recording the lag
+
+        Returns:
+            typing.Optional[dict]: notification
+
+        Raises:
+            asyncio.CancelledError if the queue has been stopped
+            asyncio.TimeoutError if the timeout is reached
+        """
+        queued = await super().dequeue(timeout=timeout)
+        if queued is None:
+            return None
+
+        enqueued_at, message = queued
+        self._delivered += 1
+        self._lag_last = time.monotonic() - enqueued_at
+        self._lag_max = max(self._lag_max, self._lag_last)
+
+        return message
+
+    def metrics(self) -> dict:
+        """Returns queue metrics of the client
+
+        Returns:
+            dict: queued, delivered and dropped notifications and lag in seconds
+        """
+        return {
+            "authenticated": self.authenticated,
+            "topics": sorted(self._topic_filter) if self._topic_filter else None,
+            "queued": self.queue.qsize(),
+            "max_size": self._max_size,
+            "delivered": self._delivered,
+            "dropped": self._dropped,
+            "lag_last": self._lag_last,
+            "lag_max": self._lag_max,
+        }
@@ -5,6 +5,7 @@ import functools
 import logging
 import os
 import signal
+import tempfile
 from typing import Coroutine, Sequence
 
 from configargparse import ArgumentParser
@@ -15,13 +16,25 @@ except ImportError:
     uvloop = None
 
 from aries_cloudagent.config import argparse as arg
+from aries_cloudagent.config.error import ArgsParseError
 from aries_cloudagent.config.util import common_config
 from dexa_sdk.agent.config import argparse as custom_arg
 from dexa_sdk.agent.config.default_context import DefaultContextBuilder
 from dexa_sdk.agent.core.conductor import Conductor
+from dexa_sdk.agent.workers.shared_queue import SharedQueue
+from dexa_sdk.agent.workers.supervisor import Supervisor
 
 LOGGER = logging.getLogger(__name__)
 
+# Inbound transports listening with SO_REUSEPORT in worker mode
+REUSE_PORT_TRANSPORTS = {
+    "http": "dexa_sdk.agent.transport.inbound.http",
+    "ws": "dexa_sdk.agent.transport.inbound.ws",
+}
+
+# Wallet types persisted outside the process, hence shared by the workers
+SHARED_WALLET_TYPES = ("indy",)
+
 
 async def start_app(conductor: Conductor):
     """Start up."""
@@ -63,6 +76,15 @@ def execute(argv: Sequence[str] = None):
         webhook_urls.append(webhook_url)
         settings["admin.webhook_urls"] = webhook_urls
 
+    if settings.get("dexa.workers", 1) > 1:
+        run_workers(settings)
+    else:
+        run_agent(settings)
+
+
+def run_agent(settings: dict):
+    """Run the agent in this process."""
+
     # Create the Conductor instance
     context_builder = DefaultContextBuilder(settings)
     conductor = Conductor(context_builder)
@@ -76,6 +98,70 @@ def execute(argv: Sequence[str] = None):
     run_loop(start_app(conductor), shutdown_app(conductor))
 
 
+def run_worker(settings: dict, worker_id: int):
+    """Run the agent in a worker process."""
+
+    # Ctrl-C is handled by the supervisor, workers are stopped by SIGTERM
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    settings = dict(settings)
+    settings["dexa.worker_id"] = worker_id
+    run_agent(settings)
+
+
+def check_shared_wallet(settings: dict):
+    """Ensure the workers share the wallet.
+
+    Inbound messages are unpacked by whichever worker receives them and
+    anchoring jobs are processed by the leader, hence the DIDs, connections
+    and records must be in storage shared by all the workers.
+
+    Args:
+        settings (dict): Settings
+
+    Raises:
+        ArgsParseError: If the wallet is local to each worker process
+    """
+    wallet_type = settings.get("wallet.type") or "basic"
+    if wallet_type not in SHARED_WALLET_TYPES:
+        raise ArgsParseError(
+            f"Running {settings['dexa.workers']} workers requires a persistent "
+            f"wallet shared by the workers (--wallet-type indy, optionally "
+            f"with postgres storage), the '{wallet_type}' wallet is in-memory "
+            "per process"
+        )
+
+
+def run_workers(settings: dict):
+    """Run the agent in worker processes sharing the ports."""
+    workers = settings["dexa.workers"]
+
+    # Workers must see the same DIDs, connections and outbox entries
+    check_shared_wallet(settings)
+
+    # Workers listen on the same ports with SO_REUSEPORT
+    settings["dexa.reuse_port"] = True
+    settings["transport.inbound_configs"] = [
+        [REUSE_PORT_TRANSPORTS.get(module, module), *config]
+        for module, *config in settings["transport.inbound_configs"]
+    ]
+
+    # Local stand-in for the queue shared by the workers
+    queue_path = settings.get("dexa.shared_queue_path") or os.path.join(
+        tempfile.mkdtemp(prefix="dexa-workers-"), "shared_queue.db"
+    )
+    settings["dexa.shared_queue_path"] = queue_path
+    queue = SharedQueue(queue_path)
+
+    LOGGER.info("Starting %d workers, shared queue at %s", workers, queue_path)
+
+    supervisor = Supervisor(functools.partial(run_worker, settings), workers, queue)
+    try:
+        supervisor.run()
+    finally:
+        queue.close()
+
+
 def run_loop(startup: Coroutine, shutdown: Coroutine):
     """Execute the application, handling signals and ctrl-c."""
 
@@ -0,0 +1,28 @@
+from aries_cloudagent.config.error import ArgsParseError
+from asynctest import TestCase as AsyncTestCase
+from asynctest import mock as async_mock
+from dexa_sdk.agent.commands import start as test_module
+
+
+class TestStart(AsyncTestCase):
+    """Test agent entrypoint"""
+
+    def test_workers_require_shared_wallet(self):
+        """Test workers are not started with a wallet local to each process"""
+
+        settings = {
+            "dexa.workers": 2,
+            "transport.inbound_configs": [["http", "0.0.0.0", 8000]],
+        }
+
+        with async_mock.patch.object(test_module, "Supervisor") as supervisor:
+            # Default wallet is in-memory
+            with self.assertRaises(ArgsParseError):
+                test_module.run_workers(dict(settings))
+
+            with self.assertRaises(ArgsParseError):
+                test_module.run_workers(dict(settings, **{"wallet.type": "basic"}))
+
+            supervisor.assert_not_called()
+
+        test_module.check_shared_wallet(dict(settings, **{"wallet.type": "indy"}))
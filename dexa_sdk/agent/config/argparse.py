@@ -46,7 +46,269 @@ class DexaGroup(ArgumentGroup):
             type=str,
             metavar="<eth-node-rpc>",
             env_var="ETH_NODE_RPC",
-            help="Ethereum node RPC endpoint",
+            help=(
+                "Ethereum node RPC endpoint(s), comma separated. Reads are routed "
+                "to the fastest healthy node and writes fail over in order."
+            ),
+        )
+
+        parser.add_argument(
+            "--eth-min-balance",
+            type=int,
+            metavar="<eth-min-balance>",
+            env_var="ETH_MIN_BALANCE",
+            help=(
+                "Account balance (wei) below which readiness check warns. Default: 0"
+            ),
+        )
+
+        parser.add_argument(
+            "--eth-account-poll-interval",
+            type=float,
+            metavar="<eth-account-poll-interval>",
+            env_var="ETH_ACCOUNT_POLL_INTERVAL",
+            help=(
+                "Interval in seconds for refreshing account balances and nonces. "
+                "Default: 30"
+            ),
+        )
+
+        parser.add_argument(
+            "--ethereum-executor-workers",
+            type=int,
+            metavar="<ethereum-executor-workers>",
+            env_var="ETHEREUM_EXECUTOR_WORKERS",
+            help="Threads for blocking ethereum calls, for e.g. signing. Default: 4",
+        )
+
+        parser.add_argument(
+            "--canonicalisation-executor-workers",
+            type=int,
+            metavar="<canonicalisation-executor-workers>",
+            env_var="CANONICALISATION_EXECUTOR_WORKERS",
+            help="Threads for JSON-LD canonicalisation of agreements. Default: 2",
+        )
+
+        parser.add_argument(
+            "--http-sync-executor-workers",
+            type=int,
+            metavar="<http-sync-executor-workers>",
+            env_var="HTTP_SYNC_EXECUTOR_WORKERS",
+            help="Threads for blocking HTTP requests. Default: 4",
+        )
+
+        parser.add_argument(
+            "--workers",
+            type=int,
+            metavar="<workers>",
+            env_var="WORKERS",
+            help=(
+                "Number of worker processes sharing the inbound and admin ports. "
+                "Crashed workers are restarted. More than one worker requires "
+                "a persistent wallet ('indy'). Default: 1"
+            ),
+        )
+
+        parser.add_argument(
+            "--shared-queue-path",
+            type=str,
+            metavar="<shared-queue-path>",
+            env_var="SHARED_QUEUE_PATH",
+            help=(
+                "SQLite database for jobs and notifications shared by the worker "
+                "processes. Default: temporary file"
+            ),
+        )
+
+        parser.add_argument(
+            "--inbound-queue",
+            type=str,
+            metavar="<inbound-queue>",
+            env_var="INBOUND_QUEUE",
+            help=(
+                "Inbound message queue, 'local', 'sqlite' or class path. "
+                "Default: 'sqlite' if running in workers, else 'local'"
+            ),
+        )
+
+        parser.add_argument(
+            "--inbound-queue-path",
+            type=str,
+            metavar="<inbound-queue-path>",
+            env_var="INBOUND_QUEUE_PATH",
+            help="SQLite database of the inbound queue. Default: shared queue path",
+        )
+
+        parser.add_argument(
+            "--inbound-offload-threshold",
+            type=int,
+            metavar="<inbound-offload-threshold>",
+            env_var="INBOUND_OFFLOAD_THRESHOLD",
+            help=(
+                "Pending inbound messages from which new messages are offloaded "
+                "to the inbound queue. Default: 0 (disabled)"
+            ),
+        )
+
+        parser.add_argument(
+            "--inbound-queue-max-depth",
+            type=int,
+            metavar="<inbound-queue-max-depth>",
+            env_var="INBOUND_QUEUE_MAX_DEPTH",
+            help=(
+                "Pending inbound messages from which readiness check fails. "
+                "Default: 0 (unbounded)"
+            ),
+        )
+
+        parser.add_argument(
+            "--outbound-coalesce-window",
+            type=float,
+            metavar="<outbound-coalesce-window>",
+            env_var="OUTBOUND_COALESCE_WINDOW",
+            help=(
+                "Seconds outbound messages to the same endpoint are grouped "
+                "before delivery. Default: 0 (disabled)"
+            ),
+        )
+
+        parser.add_argument(
+            "--outbound-endpoint-max-active",
+            type=int,
+            metavar="<outbound-endpoint-max-active>",
+            env_var="OUTBOUND_ENDPOINT_MAX_ACTIVE",
+            help="Maximum concurrent deliveries per outbound endpoint. Default: 8",
+        )
+
+        parser.add_argument(
+            "--outbound-keepalive-timeout",
+            type=float,
+            metavar="<outbound-keepalive-timeout>",
+            env_var="OUTBOUND_KEEPALIVE_TIMEOUT",
+            help="Seconds idle outbound connections are kept open. Default: 60",
+        )
+
+        parser.add_argument(
+            "--webhook-batch-size",
+            type=int,
+            metavar="<webhook-batch-size>",
+            env_var="WEBHOOK_BATCH_SIZE",
+            help=(
+                "Webhook events posted together per target, as an array to the "
+                "'batch' topic. Default: 0, every event is posted on its own"
+            ),
+        )
+
+        parser.add_argument(
+            "--webhook-batch-window",
+            type=float,
+            metavar="<webhook-batch-window>",
+            env_var="WEBHOOK_BATCH_WINDOW",
+            help=(
+                "Seconds webhook events are held for a batch, if not full. "
+                "Default: 0.5"
+            ),
+        )
+
+        parser.add_argument(
+            "--webhook-target-max-active",
+            type=int,
+            metavar="<webhook-target-max-active>",
+            env_var="WEBHOOK_TARGET_MAX_ACTIVE",
+            help=(
+                "Maximum concurrent webhook deliveries per target. "
+                "Default: OUTBOUND_ENDPOINT_MAX_ACTIVE or 8"
+            ),
+        )
+
+        parser.add_argument(
+            "--interactive-task-max-active",
+            type=int,
+            metavar="<interactive-task-max-active>",
+            env_var="INTERACTIVE_TASK_MAX_ACTIVE",
+            help=(
+                "Maximum concurrent inbound message handlers. "
+                "Default: DISPATCHER_MAX_ACTIVE or 50"
+            ),
+        )
+
+        parser.add_argument(
+            "--background-task-max-active",
+            type=int,
+            metavar="<background-task-max-active>",
+            env_var="BACKGROUND_TASK_MAX_ACTIVE",
+            help=(
+                "Maximum concurrent background tasks, for e.g. blockchain "
+                "anchoring. Default: 10"
+            ),
+        )
+
+        parser.add_argument(
+            "--bulk-task-max-active",
+            type=int,
+            metavar="<bulk-task-max-active>",
+            env_var="BULK_TASK_MAX_ACTIVE",
+            help="Maximum concurrent bulk admin operations. Default: 2",
+        )
+
+        parser.add_argument(
+            "--loop-monitor",
+            action="store_true",
+            env_var="LOOP_MONITOR",
+            help=(
+                "Monitor event loop lag and record callbacks blocking the loop, "
+                "reported in the status and on the 'loop_monitor' websocket topic"
+            ),
+        )
+
+        parser.add_argument(
+            "--loop-slow-callback-threshold",
+            type=float,
+            metavar="<loop-slow-callback-threshold>",
+            env_var="LOOP_SLOW_CALLBACK_THRESHOLD",
+            help=(
+                "Seconds from which a callback blocking the loop is recorded. "
+                "Default: 0.1"
+            ),
+        )
+
+        parser.add_argument(
+            "--admin-etag",
+            action="store_true",
+            env_var="ADMIN_ETAG",
+            help=(
+                "Tag the responses of the admin list routes, for e.g. data agreement "
+                "templates, with the versions of the records, answering conditional "
+                "requests with 304 and caching the responses"
+            ),
+        )
+
+        parser.add_argument(
+            "--admin-response-cache-size",
+            type=int,
+            metavar="<admin-response-cache-size>",
+            env_var="ADMIN_RESPONSE_CACHE_SIZE",
+            help="Admin list responses kept in the cache. Default: 64",
+        )
+
+        parser.add_argument(
+            "--websocket-queue-size",
+            type=int,
+            metavar="<websocket-queue-size>",
+            env_var="WEBSOCKET_QUEUE_SIZE",
+            help="Notifications queued per admin websocket client. Default: 100",
+        )
+
+        parser.add_argument(
+            "--websocket-overflow-policy",
+            type=str,
+            choices=("drop_oldest", "disconnect"),
+            metavar="<websocket-overflow-policy>",
+            env_var="WEBSOCKET_OVERFLOW_POLICY",
+            help=(
+                "Policy once the queue of an admin websocket client is full, "
+                "'drop_oldest' or 'disconnect'. Default: 'drop_oldest'"
+            ),
         )
 
         parser.add_argument(
@@ -81,6 +343,17 @@ class DexaGroup(ArgumentGroup):
             help="Contract ABI URL",
         )
 
+        parser.add_argument(
+            "--jsonld-canonicaliser",
+            type=str,
+            metavar="<jsonld-canonicaliser>",
+            env_var="JSONLD_CANONICALISER",
+            help=(
+                "JSON-LD canonicaliser (URDNA2015) used for did:mydata "
+                "identifiers, for e.g. 'pyld' or a registered backend. Default: 'pyld'"
+            ),
+        )
+
     def get_settings(self, args: Namespace):
         """Extract dexa settings."""
         settings = {}
@@ -92,6 +365,71 @@ class DexaGroup(ArgumentGroup):
         )
 
         settings["dexa.eth_node_rpc"] = args.eth_node_rpc
+        settings["dexa.eth_min_balance"] = (
+            args.eth_min_balance if args.eth_min_balance else 0
+        )
+        settings["dexa.eth_account_poll_interval"] = (
+            args.eth_account_poll_interval if args.eth_account_poll_interval else 30
+        )
+        if args.ethereum_executor_workers:
+            settings["dexa.ethereum_executor_workers"] = args.ethereum_executor_workers
+        if args.canonicalisation_executor_workers:
+            settings[
+                "dexa.canonicalisation_executor_workers"
+            ] = args.canonicalisation_executor_workers
+        if args.http_sync_executor_workers:
+            settings[
+                "dexa.http_sync_executor_workers"
+            ] = args.http_sync_executor_workers
+        settings["dexa.workers"] = args.workers if args.workers else 1
+        if args.shared_queue_path:
+            settings["dexa.shared_queue_path"] = args.shared_queue_path
+        if args.inbound_queue:
+            settings["dexa.inbound_queue"] = args.inbound_queue
+        if args.inbound_queue_path:
+            settings["dexa.inbound_queue_path"] = args.inbound_queue_path
+        if args.inbound_offload_threshold:
+            settings["dexa.inbound_offload_threshold"] = args.inbound_offload_threshold
+        if args.inbound_queue_max_depth:
+            settings["dexa.inbound_queue_max_depth"] = args.inbound_queue_max_depth
+        if args.outbound_coalesce_window:
+            settings["dexa.outbound_coalesce_window"] = args.outbound_coalesce_window
+        if args.outbound_endpoint_max_active:
+            settings[
+                "dexa.outbound_endpoint_max_active"
+            ] = args.outbound_endpoint_max_active
+        if args.outbound_keepalive_timeout:
+            settings[
+                "dexa.outbound_keepalive_timeout"
+            ] = args.outbound_keepalive_timeout
+        if args.webhook_batch_size:
+            settings["dexa.webhook_batch_size"] = args.webhook_batch_size
+        if args.webhook_batch_window:
+            settings["dexa.webhook_batch_window"] = args.webhook_batch_window
+        if args.webhook_target_max_active:
+            settings["dexa.webhook_target_max_active"] = args.webhook_target_max_active
+        if args.interactive_task_max_active:
+            settings[
+                "dexa.interactive_task_max_active"
+            ] = args.interactive_task_max_active
+        if args.background_task_max_active:
+            settings[
+                "dexa.background_task_max_active"
+            ] = args.background_task_max_active
+        if args.bulk_task_max_active:
+            settings["dexa.bulk_task_max_active"] = args.bulk_task_max_active
+        settings["dexa.loop_monitor"] = args.loop_monitor
+        if args.loop_slow_callback_threshold:
+            settings[
+                "dexa.loop_slow_callback_threshold"
+            ] = args.loop_slow_callback_threshold
+        settings["dexa.admin_etag"] = args.admin_etag
+        if args.admin_response_cache_size:
+            settings["dexa.admin_response_cache_size"] = args.admin_response_cache_size
+        if args.websocket_queue_size:
+            settings["dexa.websocket_queue_size"] = args.websocket_queue_size
+        if args.websocket_overflow_policy:
+            settings["dexa.websocket_overflow_policy"] = args.websocket_overflow_policy
         settings["dexa.org_eth_private_key"] = args.org_eth_private_key
         settings[
             "dexa.intermediary_eth_private_key"
@@ -101,6 +439,10 @@ class DexaGroup(ArgumentGroup):
             args.contract_abi_url if args.contract_abi_url else default_contract_abi_url
         )
 
+        settings["dexa.jsonld_canonicaliser"] = (
+            args.jsonld_canonicaliser if args.jsonld_canonicaliser else "pyld"
+        )
+
         # Fetch ABI from URL and store it in settings
         req = requests.get(settings["dexa.contract_abi_url"])
         abi = req.json()
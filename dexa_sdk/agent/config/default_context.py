@@ -35,7 +35,16 @@ from aries_cloudagent.wallet.base import BaseWallet
 from aries_cloudagent.wallet.provider import WalletProvider
 from dexa_sdk.agent.config.injection_context import InjectionContext
 from dexa_sdk.agent.core.plugin_registry import PluginRegistry as CustomPluginRegistry
-from dexa_sdk.ledgers.ethereum.core import EthereumClient
+from dexa_sdk.jsonld.canonicalisers import set_default_canonicaliser
+from dexa_sdk.ledgers.ethereum.loader import load_ethereum_client
+from dexa_sdk.storage.record_versions import RecordVersions
+from dexa_sdk.utils.executor_pools import (
+    DEFAULT_POOL_WORKERS,
+    POOL_CANONICALISATION,
+    POOL_ETHEREUM,
+    POOL_HTTP_SYNC,
+    ExecutorPools,
+)
 
 LOGGER = logging.getLogger(__name__)
 
@@ -63,6 +72,9 @@ class DefaultContextBuilder(ContextBuilder):
         # Global protocol registry
         context.injector.bind_instance(ProtocolRegistry, ProtocolRegistry())
 
+        # Record type versions, for the cached admin responses
+        context.injector.bind_instance(RecordVersions, RecordVersions())
+
         await self.bind_providers(context)
         await self.load_plugins(context)
 
@@ -167,7 +179,34 @@ class DefaultContextBuilder(ContextBuilder):
             BaseIntroductionService, DemoIntroductionService(context)
         )
 
-        # Provide ethereum client.
+        # JSON-LD canonicaliser for did:mydata identifiers
+        if context.settings.get("dexa.jsonld_canonicaliser"):
+            set_default_canonicaliser(context.settings["dexa.jsonld_canonicaliser"])
+
+        # Executor pools for blocking calls, sized separately so that
+        # a stalled ethereum node doesn't starve other blocking work.
+        context.injector.bind_instance(
+            ExecutorPools,
+            ExecutorPools(
+                {
+                    POOL_ETHEREUM: context.settings.get(
+                        "dexa.ethereum_executor_workers",
+                        DEFAULT_POOL_WORKERS[POOL_ETHEREUM],
+                    ),
+                    POOL_CANONICALISATION: context.settings.get(
+                        "dexa.canonicalisation_executor_workers",
+                        DEFAULT_POOL_WORKERS[POOL_CANONICALISATION],
+                    ),
+                    POOL_HTTP_SYNC: context.settings.get(
+                        "dexa.http_sync_executor_workers",
+                        DEFAULT_POOL_WORKERS[POOL_HTTP_SYNC],
+                    ),
+                }
+            ),
+        )
+
+        # Provide ethereum client, web3 is imported here rather than on startup
+        EthereumClient = load_ethereum_client()
         context.injector.bind_instance(EthereumClient, EthereumClient(context))
 
     async def load_plugins(self, context: InjectionContext):
@@ -2,7 +2,13 @@
 import logging
 
 from aries_cloudagent.config.injection_context import InjectionContext
-from dexa_sdk.ledgers.ethereum.core import EthereumClient
+from aries_cloudagent.connections.models.connection_record import ConnectionRecord
+from aries_cloudagent.storage.error import StorageNotFoundError
+from dexa_sdk.agent.workers.coordinator import WorkerCoordinator
+from dexa_sdk.ledgers.ethereum.loader import inject_ethereum_client
+from dexa_sdk.ledgers.ethereum.records.anchor_outbox_record import AnchorOutboxRecord
+from dexa_sdk.managers.ada_manager import V2ADAManager
+from dexa_sdk.managers.dexa_manager import DexaManager
 
 LOGGER = logging.getLogger(__name__)
 
@@ -13,7 +19,116 @@ async def smartcontract_config(context: InjectionContext):
     Args:
         context (InjectionContext): Injection context to be used.
     """
-    eth_client: EthereumClient = await context.inject(EthereumClient)
+    eth_client = await inject_ethereum_client(context)
+
+    # Start refreshing account balances and nonces
+    await eth_client.account_state.start()
+
+    # Transactions are signed by the leader only, if running in workers
+    coordinator = await context.inject(WorkerCoordinator, required=False)
+    if coordinator and not coordinator.is_leader:
+        eth_client.mark_whitelisted()
+        return
 
     # Add organisation to whitelist
     await eth_client.add_organisation()
+
+
+async def resume_anchor_outbox_entry(
+    context: InjectionContext, record: AnchorOutboxRecord
+):
+    """Resume anchoring for the outbox entry.
+
+    Entry is claimed first, so that an entry recovered on startup and also
+    submitted as a job is anchored once.
+
+    Args:
+        context (InjectionContext): Injection context to be used.
+        record (AnchorOutboxRecord): Outbox entry
+    """
+    if not record.claim():
+        LOGGER.info("Anchoring outbox entry %s is in flight", record.outbox_id)
+        return
+
+    try:
+        # Entry might be finished since it was read
+        record = await AnchorOutboxRecord.retrieve_by_id(context, record.outbox_id)
+    except StorageNotFoundError:
+        record.release()
+        return
+
+    if record.state in (
+        AnchorOutboxRecord.STATE_COMPLETED,
+        AnchorOutboxRecord.STATE_FAILED,
+    ):
+        record.release()
+        return
+
+    try:
+        await start_anchoring(context, record)
+    except Exception:
+        record.release()
+        raise
+
+
+async def start_anchoring(context: InjectionContext, record: AnchorOutboxRecord):
+    """Start anchoring task for the claimed outbox entry.
+
+    Args:
+        context (InjectionContext): Injection context to be used.
+        record (AnchorOutboxRecord): Outbox entry
+    """
+    if record.kind == AnchorOutboxRecord.KIND_DA_INSTANCE:
+        await V2ADAManager(context).anchor_da_instance_to_blockchain_async_task(
+            record.reference_id, record
+        )
+    elif record.kind == AnchorOutboxRecord.KIND_DDA_INSTANCE:
+        await DexaManager(context).anchor_dda_instance_to_blockchain_async_task(
+            record.reference_id, record
+        )
+    elif record.kind == AnchorOutboxRecord.KIND_ACCESS_TOKEN:
+        connection_record = await ConnectionRecord.retrieve_by_id(
+            context, record.payload["connection_id"]
+        )
+        await DexaManager(context).add_token_to_blockchain_async_task(
+            connection_record,
+            record.payload["jwt"],
+            record.payload["nonce"],
+            record,
+        )
+
+
+async def process_anchor_outbox_job(context: InjectionContext, payload: dict):
+    """Anchor the outbox entry submitted by a worker to the shared queue.
+
+    Args:
+        context (InjectionContext): Injection context to be used.
+        payload (dict): Job payload with the outbox entry identifier
+    """
+    record = await AnchorOutboxRecord.retrieve_by_id(context, payload["outbox_id"])
+
+    await resume_anchor_outbox_entry(context, record)
+
+
+async def anchoring_outbox_recovery(context: InjectionContext):
+    """Resume anchoring outbox entries left unfinished by a previous run.
+
+    Args:
+        context (InjectionContext): Injection context to be used.
+    """
+    purged = await AnchorOutboxRecord.purge_completed(context)
+    if purged:
+        LOGGER.info("Deleted %d completed anchoring outbox entries", purged)
+
+    records = await AnchorOutboxRecord.query_unfinished(context)
+
+    if records:
+        LOGGER.info("Resuming %d anchoring outbox entries", len(records))
+
+    for record in records:
+        try:
+            await resume_anchor_outbox_entry(context, record)
+        except Exception:
+            LOGGER.exception(
+                "Unable to resume anchoring outbox entry %s", record.outbox_id
+            )
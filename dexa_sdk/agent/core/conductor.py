@@ -6,6 +6,8 @@ over the network, communicating with the ledger, passing messages to handlers,
 instantiating concrete implementations of required modules and storing data in the wallet.
 """
 
+import asyncio
+import functools
 import hashlib
 import logging
 
@@ -24,17 +26,50 @@ from aries_cloudagent.protocols.connections.v1_0.manager import (
 from aries_cloudagent.transport.inbound.manager import InboundTransportManager
 from aries_cloudagent.transport.inbound.message import InboundMessage
 from aries_cloudagent.transport.outbound.base import OutboundDeliveryError
-from aries_cloudagent.transport.outbound.manager import (
-    OutboundTransportManager,
-    QueuedOutboundMessage,
-)
+from aries_cloudagent.transport.outbound.manager import QueuedOutboundMessage
 from aries_cloudagent.transport.outbound.message import OutboundMessage
 from aries_cloudagent.transport.wire_format import BaseWireFormat
 from aries_cloudagent.utils.stats import Collector
 from aries_cloudagent.utils.task_queue import CompletedTask, TaskQueue
 from dexa_sdk.agent.admin.server import AdminServer
-from dexa_sdk.agent.config.dexa import smartcontract_config
+from dexa_sdk.agent.config.dexa import (
+    anchoring_outbox_recovery,
+    process_anchor_outbox_job,
+    smartcontract_config,
+)
 from dexa_sdk.agent.config.injection_context import InjectionContext
+from dexa_sdk.agent.core.loop_monitor import (
+    DEFAULT_SLOW_CALLBACK_THRESHOLD,
+    LoopMonitor,
+)
+from dexa_sdk.agent.core.readiness import (
+    SUBSYSTEM_ANCHORING_RECOVERY,
+    SUBSYSTEM_LEDGER,
+    SUBSYSTEM_SMART_CONTRACT,
+    SUBSYSTEM_TRANSPORTS,
+    SUBSYSTEM_WALLET,
+    SubsystemReadiness,
+)
+from dexa_sdk.agent.core.task_lanes import (
+    DEFAULT_LANE_MAX_ACTIVE,
+    LANE_BACKGROUND,
+    LANE_BULK,
+    LANE_INTERACTIVE,
+    TaskLanes,
+)
+from dexa_sdk.agent.transport.inbound.queue.base import (
+    BaseInboundQueue,
+    load_inbound_queue,
+)
+from dexa_sdk.agent.transport.outbound.manager import (
+    CoalescingOutboundTransportManager,
+)
+from dexa_sdk.agent.workers.coordinator import (
+    JOB_ANCHOR_OUTBOX_ENTRY,
+    WorkerCoordinator,
+)
+from dexa_sdk.ledgers.ethereum.loader import inject_ethereum_client
+from dexa_sdk.utils.executor_pools import ExecutorPools
 
 LOGGER = logging.getLogger(__name__)
 
@@ -62,38 +97,94 @@ class Conductor:
         self.context_builder = context_builder
         self.dispatcher: Dispatcher = None
         self.inbound_transport_manager: InboundTransportManager = None
-        self.outbound_transport_manager: OutboundTransportManager = None
+        self.outbound_transport_manager: CoalescingOutboundTransportManager = None
+        self.task_lanes: TaskLanes = None
+        self.coordinator: WorkerCoordinator = None
+        self.inbound_queue: BaseInboundQueue = None
+        self.loop_monitor: LoopMonitor = None
+        self.readiness: SubsystemReadiness = None
 
     async def setup(self):
         """Initialize the global request context."""
 
         context = await self.context_builder.build()
 
+        # Monitor the event loop from the start, setup makes blocking calls too
+        if context.settings.get("dexa.loop_monitor"):
+            self.loop_monitor = LoopMonitor(
+                threshold=context.settings.get(
+                    "dexa.loop_slow_callback_threshold",
+                    DEFAULT_SLOW_CALLBACK_THRESHOLD,
+                ),
+                notify=self.notify_slow_callback,
+            )
+            self.loop_monitor.start()
+            context.injector.bind_instance(LoopMonitor, self.loop_monitor)
+
+        # Subsystems are set up concurrently, or in the background on start
+        self.readiness = SubsystemReadiness()
+        context.injector.bind_instance(SubsystemReadiness, self.readiness)
+
         self.dispatcher = Dispatcher(context)
         await self.dispatcher.setup()
 
+        # Separate lanes for inbound messages, background and bulk tasks,
+        # interactive lane replaces the dispatcher task queue.
+        self.task_lanes = TaskLanes(
+            {
+                LANE_INTERACTIVE: context.settings.get(
+                    "dexa.interactive_task_max_active",
+                    self.dispatcher.task_queue.max_active,
+                ),
+                LANE_BACKGROUND: context.settings.get(
+                    "dexa.background_task_max_active",
+                    DEFAULT_LANE_MAX_ACTIVE[LANE_BACKGROUND],
+                ),
+                LANE_BULK: context.settings.get(
+                    "dexa.bulk_task_max_active", DEFAULT_LANE_MAX_ACTIVE[LANE_BULK]
+                ),
+            },
+            trace_fns={LANE_INTERACTIVE: self.dispatcher.log_task},
+        )
+        self.dispatcher.task_queue = self.task_lanes.get(LANE_INTERACTIVE).task_queue
+        context.injector.bind_instance(TaskLanes, self.task_lanes)
+
+        # Coordinate jobs and notifications with other worker processes
+        if context.settings.get("dexa.worker_id") is not None:
+            self.coordinator = WorkerCoordinator(
+                context.settings["dexa.shared_queue_path"],
+                context.settings["dexa.worker_id"],
+            )
+            if self.coordinator.is_leader:
+                self.coordinator.register_job_handler(
+                    JOB_ANCHOR_OUTBOX_ENTRY,
+                    functools.partial(process_anchor_outbox_job, context),
+                )
+            context.injector.bind_instance(WorkerCoordinator, self.coordinator)
+
+        # Queue for offloading inbound messages if this instance is busy
+        self.inbound_queue = load_inbound_queue(context)
+        context.injector.bind_instance(BaseInboundQueue, self.inbound_queue)
+
         wire_format = await context.inject(BaseWireFormat, required=False)
         if wire_format and hasattr(wire_format, "task_queue"):
             wire_format.task_queue = self.dispatcher.task_queue
 
-        # Register all inbound transports
+        # Inbound transports
         self.inbound_transport_manager = InboundTransportManager(
             context, self.inbound_message_router, self.handle_not_returned
         )
-        await self.inbound_transport_manager.setup()
 
-        # Register all outbound transports
-        self.outbound_transport_manager = OutboundTransportManager(
+        # Outbound transports, messages are coalesced per endpoint
+        self.outbound_transport_manager = CoalescingOutboundTransportManager(
             context, self.handle_not_delivered
         )
-        await self.outbound_transport_manager.setup()
 
-        # Configure the wallet
-        public_did = await wallet_config(context)
-
-        # Configure the ledger
-        if not await ledger_config(context, public_did):
-            LOGGER.warning("No ledger configured")
+        # Register the transports while the wallet and ledger are configured
+        await asyncio.gather(
+            self.readiness.track(SUBSYSTEM_TRANSPORTS, self.setup_transports()),
+            self.setup_wallet_and_ledger(context),
+        )
 
         # Admin API
         if context.settings.get("admin.enabled"):
@@ -143,16 +234,49 @@ class Conductor:
                 ),
             )
 
-        # Configure smart contract
-        await smartcontract_config(context)
-
         self.context = context
 
+    async def setup_transports(self):
+        """Register the inbound and outbound transports."""
+        await asyncio.gather(
+            self.inbound_transport_manager.setup(),
+            self.outbound_transport_manager.setup(),
+        )
+
+    async def setup_wallet_and_ledger(self, context: InjectionContext):
+        """
+        Configure the wallet, and the ledger with the public DID of the wallet.
+
+        Args:
+            context: The application context
+        """
+        public_did = await self.readiness.track(
+            SUBSYSTEM_WALLET, wallet_config(context)
+        )
+
+        if not await self.readiness.track(
+            SUBSYSTEM_LEDGER, ledger_config(context, public_did)
+        ):
+            LOGGER.warning("No ledger configured")
+
     async def start(self) -> None:
         """Start the agent."""
 
         context = self.context
 
+        # Whitelisting waits for a mined block, organisation transactions
+        # wait for it instead of holding back the startup.
+        self.readiness.run_in_background(
+            SUBSYSTEM_SMART_CONTRACT, smartcontract_config(context)
+        )
+
+        # Dispatch messages offloaded by other instances
+        interactive_lane = self.task_lanes.get(LANE_INTERACTIVE)
+        await self.inbound_queue.start(
+            self.dispatch_inbound_message,
+            lambda: interactive_lane.task_queue.current_pending,
+        )
+
         # Start up transports
         try:
             await self.inbound_transport_manager.start()
@@ -226,17 +350,49 @@ class Conductor:
             except Exception:
                 LOGGER.exception("Error creating invitation")
 
+        if self.coordinator:
+            # Anchoring is resumed by the leader, queued jobs are covered by it
+            if self.coordinator.is_leader:
+                await self.coordinator.purge(JOB_ANCHOR_OUTBOX_ENTRY)
+                self.readiness.run_in_background(
+                    SUBSYSTEM_ANCHORING_RECOVERY, anchoring_outbox_recovery(context)
+                )
+
+            await self.coordinator.start()
+        else:
+            # Resume anchoring left unfinished by previous run
+            self.readiness.run_in_background(
+                SUBSYSTEM_ANCHORING_RECOVERY, anchoring_outbox_recovery(context)
+            )
+
     async def stop(self, timeout=1.0):
         """Stop the agent."""
         shutdown = TaskQueue()
         if self.dispatcher:
             shutdown.run(self.dispatcher.complete())
+        if self.task_lanes:
+            shutdown.run(self.task_lanes.complete())
+        if self.inbound_queue:
+            shutdown.run(self.inbound_queue.stop())
+        if self.coordinator:
+            shutdown.run(self.coordinator.stop())
+        if self.loop_monitor:
+            shutdown.run(self.loop_monitor.stop())
+        if self.readiness:
+            shutdown.run(self.readiness.stop())
         if self.admin_server:
             shutdown.run(self.admin_server.stop())
         if self.inbound_transport_manager:
             shutdown.run(self.inbound_transport_manager.stop())
         if self.outbound_transport_manager:
             shutdown.run(self.outbound_transport_manager.stop())
+        if self.context:
+            eth_client = await inject_ethereum_client(self.context, required=False)
+            if eth_client:
+                shutdown.run(eth_client.close())
+            pools = await self.context.inject(ExecutorPools, required=False)
+            if pools:
+                pools.shutdown()
         await shutdown.complete(timeout)
 
     def inbound_message_router(
@@ -257,9 +413,30 @@ class Conductor:
                 message.transport_type,
             )
 
-        # Note: at this point we could send the message to a shared queue
-        # if this pod is too busy to process it
+        # Offload to other instances if this one is too busy, responses
+        # to be returned over the session are processed here.
+        if (
+            self.inbound_queue
+            and self.inbound_queue.busy()
+            and not message.receipt.direct_response_requested
+        ):
+            asyncio.ensure_future(self.offload_inbound_message(message))
+            return
+
+        self.dispatch_inbound_message(message)
+
+    async def offload_inbound_message(self, message: InboundMessage):
+        """Offload the inbound message, dispatched locally if not accepted."""
+        try:
+            if await self.inbound_queue.offload(message):
+                return
+        except Exception:
+            LOGGER.exception("Unable to offload inbound message")
+
+        self.dispatch_inbound_message(message)
 
+    def dispatch_inbound_message(self, message: InboundMessage):
+        """Dispatch the inbound message in this instance."""
         try:
             self.dispatcher.queue_message(
                 message,
@@ -313,6 +490,38 @@ class Conductor:
                 stats["out_encode"] += 1
             if m.state == QueuedOutboundMessage.STATE_DELIVER:
                 stats["out_deliver"] += 1
+
+        # Outbound batch sizes and delivery latency
+        stats["outbound"] = self.outbound_transport_manager.metrics()
+
+        # Setup state of the subsystems
+        stats["subsystems"] = self.readiness.snapshot()
+
+        # Event loop lag and slow callbacks
+        if self.loop_monitor:
+            stats["loop"] = self.loop_monitor.metrics()
+
+        # Concurrency and queue wait times per task lane
+        stats["task_lanes"] = self.task_lanes.metrics()
+
+        # Pending inbound messages, locally and in the shared queue
+        stats["inbound_queue"] = await self.inbound_queue.depth()
+
+        # Shared queue of the worker processes
+        if self.coordinator:
+            stats["worker"] = await self.coordinator.metrics()
+
+        # Ethereum RPC endpoint metrics
+        eth_client = await inject_ethereum_client(self.context, required=False)
+        if eth_client:
+            stats["eth_rpc"] = eth_client.rpc_metrics()
+            stats["eth_accounts"] = eth_client.account_state.snapshot()
+
+        # Busy threads and queue depth of the executor pools
+        pools = await self.context.inject(ExecutorPools, required=False)
+        if pools:
+            stats["executors"] = pools.metrics()
+
         return stats
 
     async def outbound_message_router(
@@ -392,6 +601,17 @@ class Conductor:
         """Handle a message that failed delivery via outbound transports."""
         self.inbound_transport_manager.return_undelivered(outbound)
 
+    async def notify_slow_callback(self, topic: str, record: dict):
+        """
+        Notify admin websocket clients of a callback which blocked the loop.
+
+        Args:
+            topic: The websocket topic
+            record: The slow callback record
+        """
+        if self.admin_server:
+            await self.admin_server.send_websocket_notification(topic, record)
+
     def webhook_router(
         self, topic: str, payload: dict, endpoint: str, max_attempts: int = None
     ):
@@ -0,0 +1,180 @@
+"""Event loop lag and slow callback monitor."""
+
+import asyncio
+import datetime
+import logging
+import sys
+import threading
+import time
+import traceback
+import typing
+from collections import deque
+
+LOGGER = logging.getLogger(__name__)
+
+# Admin websocket topic for slow callbacks
+LOOP_MONITOR_TOPIC = "loop_monitor"
+
+# Default seconds from which a callback blocking the loop is recorded
+DEFAULT_SLOW_CALLBACK_THRESHOLD = 0.1
+
+# Slow callbacks kept for the status
+MAX_SLOW_CALLBACKS = 20
+
+
+class LoopMonitor:
+    """Measures event loop scheduling lag and records slow callbacks.
+
+    A sampler task wakes up on an interval, the delay in waking up is the
+    scheduling lag. A watchdog thread captures the stack of the loop thread
+    if the sampler is late by more than the threshold, i.e. a callback is
+    blocking the loop, for e.g. a synchronous HTTP request.
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.25,
+        threshold: float = DEFAULT_SLOW_CALLBACK_THRESHOLD,
+        notify: typing.Callable = None,
+    ) -> None:
+        """Initialise loop monitor
+
+        Args:
+            interval (float, optional): Seconds between samples. Defaults to 0.25.
+            threshold (float, optional): Seconds from which callbacks are recorded.
+            notify (typing.Callable, optional): Coroutine function called with
+                the slow callback record.
+        """
+        self._interval = interval
+        self._threshold = threshold
+        self._notify = notify
+
+        # Expected wake up of the sampler, read by the watchdog thread
+        self._expected_at: float = None
+
+        # Stack of the stalled loop thread, captured by the watchdog thread
+        self._stalled_stack: typing.List[str] = None
+        self._lock = threading.Lock()
+
+        # Lag samples, in seconds
+        self._samples = 0
+        self._lag_last = 0.0
+        self._lag_total = 0.0
+        self._lag_max = 0.0
+
+        # Slow callbacks, latest last
+        self._slow_callbacks = deque(maxlen=MAX_SLOW_CALLBACKS)
+        self._slow_callback_count = 0
+
+        self._task: typing.Optional[asyncio.Task] = None
+        self._watchdog: typing.Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+
+    def _watch(self, loop_thread_id: int) -> None:
+        """Capture the stack of the loop thread while the loop is blocked
+
+        Args:
+            loop_thread_id (int): Identifier of the thread running the loop
+        """
+        while not self._stopping.wait(self._threshold / 2):
+            expected_at = self._expected_at
+            if expected_at is None:
+                continue
+
+            # Sampler is late, something is blocking the loop
+            if time.monotonic() - expected_at > self._threshold:
+                with self._lock:
+                    if self._stalled_stack is not None:
+                        continue
+                    frame = sys._current_frames().get(loop_thread_id)
+                    if frame:
+                        self._stalled_stack = traceback.format_stack(frame)
+
+    async def _sample(self) -> None:
+        """Measure the delay in waking up on an interval"""
+        while True:
+            self._expected_at = time.monotonic() + self._interval
+            await asyncio.sleep(self._interval)
+            lag = max(time.monotonic() - self._expected_at, 0.0)
+
+            self._samples += 1
+            self._lag_last = lag
+            self._lag_total += lag
+            self._lag_max = max(self._lag_max, lag)
+
+            with self._lock:
+                stack, self._stalled_stack = self._stalled_stack, None
+
+            if lag > self._threshold:
+                await self._record_slow_callback(lag, stack)
+
+    async def _record_slow_callback(
+        self, duration: float, stack: typing.List[str] = None
+    ) -> None:
+        """Record and notify the callback which blocked the loop
+
+        Args:
+            duration (float): Seconds the loop was blocked
+            stack (typing.List[str], optional): Stack captured while blocked
+        """
+        record = {
+            "recorded_at": datetime.datetime.utcnow().isoformat(),
+            "duration": duration,
+            "stack": stack or [],
+        }
+        self._slow_callbacks.append(record)
+        self._slow_callback_count += 1
+
+        LOGGER.warning(
+            "Event loop blocked for %.3f s%s",
+            duration,
+            ":\n" + "".join(stack) if stack else "",
+        )
+
+        if self._notify:
+            try:
+                await self._notify(LOOP_MONITOR_TOPIC, record)
+            except Exception:
+                LOGGER.exception("Error notifying slow callback")
+
+    def start(self) -> None:
+        """Start sampling the running loop and the watchdog thread"""
+        if self._task and not self._task.done():
+            return
+
+        self._stopping.clear()
+        self._task = asyncio.get_event_loop().create_task(self._sample())
+        self._watchdog = threading.Thread(
+            target=self._watch,
+            args=(threading.get_ident(),),
+            name="dexa-loop-monitor",
+            daemon=True,
+        )
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        """Stop sampling and the watchdog thread"""
+        self._stopping.set()
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        self._expected_at = None
+
+    def metrics(self) -> dict:
+        """Returns loop monitor metrics
+
+        Returns:
+            dict: scheduling lag in seconds and the latest slow callbacks
+        """
+        return {
+            "threshold": self._threshold,
+            "lag_last": self._lag_last,
+            "lag_avg": self._lag_total / self._samples if self._samples else 0.0,
+            "lag_max": self._lag_max,
+            "slow_callbacks": self._slow_callback_count,
+            "recent_slow_callbacks": list(self._slow_callbacks),
+        }
@@ -0,0 +1,197 @@
+"""Readiness of the agent subsystems, set up concurrently or in the background."""
+
+import asyncio
+import logging
+import time
+import typing
+
+LOGGER = logging.getLogger(__name__)
+
+# Subsystems
+SUBSYSTEM_TRANSPORTS = "transports"
+SUBSYSTEM_WALLET = "wallet"
+SUBSYSTEM_LEDGER = "ledger"
+SUBSYSTEM_SMART_CONTRACT = "smart_contract"
+SUBSYSTEM_ANCHORING_RECOVERY = "anchoring_recovery"
+
+# Subsystem states
+STATE_PENDING = "pending"
+STATE_READY = "ready"
+STATE_FAILED = "failed"
+
+
+class SubsystemReadiness:
+    """Tracks the setup of the agent subsystems.
+
+    Agent is ready once the required subsystems are ready, subsystems
+    set up in the background, for e.g. smart contract registration,
+    are reported without holding back the readiness.
+    """
+
+    def __init__(self) -> None:
+        """Initialise subsystem readiness"""
+
+        # Subsystem state, requirement, setup duration and error by name
+        self._subsystems: typing.Dict[str, dict] = {}
+
+        # Set once the subsystem is ready, by name
+        self._events: typing.Dict[str, asyncio.Event] = {}
+
+        # Background setup tasks
+        self._tasks: typing.List[asyncio.Task] = []
+
+    def register(self, name: str, required: bool = True) -> None:
+        """Register a subsystem pending setup
+
+        Args:
+            name (str): Subsystem name
+            required (bool, optional): Required for the agent to be ready.
+                Defaults to True.
+        """
+        self._subsystems[name] = {
+            "state": STATE_PENDING,
+            "required": required,
+            "started_at": time.monotonic(),
+            "duration": None,
+            "error": None,
+        }
+        self._events.setdefault(name, asyncio.Event())
+
+    def _finish(self, name: str, state: str, error: str = None) -> None:
+        """Record the outcome of the subsystem setup
+
+        Args:
+            name (str): Subsystem name
+            state (str): Subsystem state
+            error (str, optional): Setup error
+        """
+        if name not in self._subsystems:
+            self.register(name)
+
+        subsystem = self._subsystems[name]
+        subsystem["state"] = state
+        subsystem["duration"] = time.monotonic() - subsystem["started_at"]
+        subsystem["error"] = error
+
+        # Waiters are released on failure too, setup is not retried
+        self._events[name].set()
+
+    def mark_ready(self, name: str) -> None:
+        """Mark the subsystem ready
+
+        Args:
+            name (str): Subsystem name
+        """
+        self._finish(name, STATE_READY)
+
+    def mark_failed(self, name: str, error: str) -> None:
+        """Mark the subsystem failed
+
+        Args:
+            name (str): Subsystem name
+            error (str): Setup error
+        """
+        self._finish(name, STATE_FAILED, error)
+
+    async def track(
+        self, name: str, coro: typing.Awaitable, required: bool = True
+    ) -> typing.Any:
+        """Set up the subsystem, recording the outcome
+
+        Args:
+            name (str): Subsystem name
+            coro (typing.Awaitable): Setup coroutine
+            required (bool, optional): Required for the agent to be ready.
+                Defaults to True.
+
+        Returns:
+            typing.Any: result of the setup coroutine
+        """
+        self.register(name, required)
+        try:
+            result = await coro
+        except Exception as err:
+            self.mark_failed(name, str(err))
+            raise
+        self.mark_ready(name)
+
+        return result
+
+    def run_in_background(
+        self, name: str, coro: typing.Awaitable, required: bool = False
+    ) -> asyncio.Task:
+        """Set up the subsystem in a background task
+
+        Args:
+            name (str): Subsystem name
+            coro (typing.Awaitable): Setup coroutine
+            required (bool, optional): Required for the agent to be ready.
+                Defaults to False.
+
+        Returns:
+            asyncio.Task: setup task
+        """
+        self.register(name, required)
+
+        async def setup():
+            try:
+                await self.track(name, coro, required)
+            except Exception:
+                LOGGER.exception("Unable to set up %s", name)
+
+        task = asyncio.get_event_loop().create_task(setup())
+        self._tasks.append(task)
+
+        return task
+
+    async def wait(self, name: str, timeout: float = None) -> bool:
+        """Wait for the subsystem setup to finish
+
+        Args:
+            name (str): Subsystem name
+            timeout (float, optional): Timeout in seconds
+
+        Returns:
+            bool: True if the subsystem is ready
+        """
+        event = self._events.setdefault(name, asyncio.Event())
+        await asyncio.wait_for(event.wait(), timeout)
+
+        return self._subsystems[name]["state"] == STATE_READY
+
+    @property
+    def ready(self) -> bool:
+        """Whether the required subsystems are ready
+
+        Returns:
+            bool: True if ready
+        """
+        return all(
+            subsystem["state"] == STATE_READY
+            for subsystem in self._subsystems.values()
+            if subsystem["required"]
+        )
+
+    def snapshot(self) -> typing.Dict[str, dict]:
+        """Returns state of the subsystems
+
+        Returns:
+            typing.Dict[str, dict]: state, requirement, setup duration in seconds
+                and error by subsystem
+        """
+        return {
+            name: {
+                key: value
+                for key, value in subsystem.items()
+                if key != "started_at" and (key != "error" or value)
+            }
+            for name, subsystem in self._subsystems.items()
+        }
+
+    async def stop(self) -> None:
+        """Cancel the background setup tasks"""
+        for task in self._tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
@@ -0,0 +1,221 @@
+"""Task queues with independent concurrency limits per priority lane."""
+
+import asyncio
+import time
+import typing
+
+from aries_cloudagent.utils.task_queue import CompletedTask, PendingTask, TaskQueue
+
+# Inbound DIDComm messages, users may be waiting for the response
+LANE_INTERACTIVE = "interactive"
+
+# Blockchain anchoring and other work without anyone waiting
+LANE_BACKGROUND = "background"
+
+# Bulk admin operations, for e.g. publishing templates in bulk
+LANE_BULK = "bulk"
+
+# Default concurrency limits
+DEFAULT_LANE_MAX_ACTIVE = {
+    LANE_INTERACTIVE: 50,
+    LANE_BACKGROUND: 10,
+    LANE_BULK: 2,
+}
+
+
+class TaskLane:
+    """Task queue for a lane, tracking the time tasks waited to be started."""
+
+    def __init__(
+        self, name: str, max_active: int, trace_fn: typing.Callable = None
+    ) -> None:
+        """Initialise task lane
+
+        Args:
+            name (str): Lane name
+            max_active (int): Maximum number of tasks run concurrently
+            trace_fn (typing.Callable, optional): Callback for completed tasks
+        """
+
+        # Lane name
+        self._name = name
+
+        # Callback for completed tasks
+        self._trace_fn = trace_fn
+
+        # Queue wait times of started tasks
+        self._waited = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+        # Timed, so that queued and unqueued times are recorded for tasks
+        self._task_queue = TaskQueue(
+            max_active=max_active, timed=True, trace_fn=self._task_completed
+        )
+
+    @property
+    def name(self) -> str:
+        """Accessor for lane name
+
+        Returns:
+            str: lane name
+        """
+        return self._name
+
+    @property
+    def task_queue(self) -> TaskQueue:
+        """Accessor for task queue
+
+        Returns:
+            TaskQueue: task queue
+        """
+        return self._task_queue
+
+    def _task_completed(self, completed: CompletedTask) -> None:
+        """Record queue wait time of the completed task
+
+        Args:
+            completed (CompletedTask): Completed task
+        """
+        timing = completed.timing or {}
+
+        # Tasks started right away are not queued
+        wait = timing["unqueued"] - timing["queued"] if "queued" in timing else 0.0
+
+        self._waited += 1
+        self._wait_total += wait
+        self._wait_max = max(self._wait_max, wait)
+
+        if self._trace_fn:
+            self._trace_fn(completed)
+
+    def put(
+        self,
+        coro: typing.Coroutine,
+        task_complete: typing.Callable = None,
+        ident: str = None,
+    ) -> PendingTask:
+        """Add a new task to the lane, delaying execution if busy.
+
+        Args:
+            coro (typing.Coroutine): The coroutine to run
+            task_complete (typing.Callable, optional): Callback on completion
+            ident (str, optional): A string identifier for the task
+
+        Returns:
+            PendingTask: a future resolving to the asyncio task once started
+        """
+        return self._task_queue.put(coro, task_complete, ident)
+
+    def metrics(self) -> dict:
+        """Returns lane metrics
+
+        Returns:
+            dict: concurrency, task counters and queue wait times in seconds
+        """
+        task_queue = self._task_queue
+
+        # Wait time of the task at the head of the queue
+        oldest = task_queue.pending_tasks[0] if task_queue.pending_tasks else None
+        wait_oldest = (
+            time.perf_counter() - oldest.queued_time
+            if oldest and oldest.queued_time
+            else 0.0
+        )
+
+        return {
+            "max_active": task_queue.max_active,
+            "active": task_queue.current_active,
+            "pending": task_queue.current_pending,
+            "done": task_queue.total_done,
+            "failed": task_queue.total_failed,
+            "wait_avg": self._wait_total / self._waited if self._waited else 0.0,
+            "wait_max": self._wait_max,
+            "wait_oldest": wait_oldest,
+        }
+
+
+class TaskLanes:
+    """Separate task queues for interactive, background and bulk work.
+
+    A burst of background work, for e.g. blockchain anchoring, only
+    occupies its own lane and doesn't delay inbound messages.
+    """
+
+    def __init__(
+        self,
+        max_active: typing.Dict[str, int] = None,
+        trace_fns: typing.Dict[str, typing.Callable] = None,
+    ) -> None:
+        """Initialise task lanes
+
+        Args:
+            max_active (typing.Dict[str, int], optional): Concurrency limits by lane.
+                Lanes not specified use the defaults.
+            trace_fns (typing.Dict[str, typing.Callable], optional): Callbacks for
+                completed tasks by lane.
+        """
+        max_active = {**DEFAULT_LANE_MAX_ACTIVE, **(max_active or {})}
+        trace_fns = trace_fns or {}
+
+        self._lanes: typing.Dict[str, TaskLane] = {
+            name: TaskLane(name, limit, trace_fns.get(name))
+            for name, limit in max_active.items()
+        }
+
+    def get(self, name: str) -> TaskLane:
+        """Returns lane by name
+
+        Args:
+            name (str): Lane name
+
+        Returns:
+            TaskLane: lane
+        """
+        assert name in self._lanes, f"Task lane '{name}' not found."
+
+        return self._lanes[name]
+
+    def put(
+        self,
+        name: str,
+        coro: typing.Coroutine,
+        task_complete: typing.Callable = None,
+        ident: str = None,
+    ) -> PendingTask:
+        """Add a new task to the lane, delaying execution if busy.
+
+        Args:
+            name (str): Lane name
+            coro (typing.Coroutine): The coroutine to run
+            task_complete (typing.Callable, optional): Callback on completion
+            ident (str, optional): A string identifier for the task
+
+        Returns:
+            PendingTask: a future resolving to the asyncio task once started
+        """
+        return self.get(name).put(coro, task_complete, ident)
+
+    def metrics(self) -> typing.Dict[str, dict]:
+        """Returns metrics of all the lanes
+
+        Returns:
+            typing.Dict[str, dict]: lane metrics by name
+        """
+        return {name: lane.metrics() for name, lane in self._lanes.items()}
+
+    async def complete(self, timeout: float = None) -> None:
+        """Wait for, or cancel tasks in the lanes other than interactive.
+
+        Interactive lane is completed by the dispatcher.
+
+        Args:
+            timeout (float, optional): Timeout in seconds
+        """
+        await asyncio.gather(
+            *[
+                lane.task_queue.complete(timeout)
+                for name, lane in self._lanes.items()
+                if name != LANE_INTERACTIVE
+            ]
+        )
@@ -0,0 +1,40 @@
+import asyncio
+import time
+
+from asynctest import TestCase as AsyncTestCase
+from dexa_sdk.agent.core.loop_monitor import LOOP_MONITOR_TOPIC, LoopMonitor
+
+
+def block_loop(seconds: float):
+    """Synchronous work on the loop"""
+    time.sleep(seconds)
+
+
+class TestLoopMonitor(AsyncTestCase):
+    """Test loop monitor"""
+
+    async def test_slow_callback(self):
+        """Test blocking callback is recorded with its stack"""
+
+        notifications = []
+
+        async def notify(topic, record):
+            notifications.append((topic, record))
+
+        monitor = LoopMonitor(interval=0.05, threshold=0.1, notify=notify)
+        monitor.start()
+
+        await asyncio.sleep(0.1)
+        asyncio.get_event_loop().call_soon(block_loop, 0.3)
+        await asyncio.sleep(0.2)
+
+        await monitor.stop()
+
+        metrics = monitor.metrics()
+        assert metrics["slow_callbacks"] == 1
+        assert metrics["lag_max"] >= 0.2
+
+        record = metrics["recent_slow_callbacks"][0]
+        assert "block_loop" in "".join(record["stack"])
+
+        assert notifications == [(LOOP_MONITOR_TOPIC, record)]
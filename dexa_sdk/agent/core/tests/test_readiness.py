@@ -0,0 +1,50 @@
+import asyncio
+
+from asynctest import TestCase as AsyncTestCase
+from dexa_sdk.agent.core.readiness import (
+    STATE_FAILED,
+    STATE_PENDING,
+    STATE_READY,
+    SubsystemReadiness,
+)
+
+
+class TestSubsystemReadiness(AsyncTestCase):
+    """Test subsystem readiness"""
+
+    async def test_track(self):
+        """Test required subsystems gate the readiness"""
+
+        readiness = SubsystemReadiness()
+
+        assert await readiness.track("wallet", asyncio.sleep(0, result="did"))
+        assert readiness.ready
+
+        async def fail():
+            raise ValueError("No ledger")
+
+        with self.assertRaises(ValueError):
+            await readiness.track("ledger", fail())
+
+        assert not readiness.ready
+        snapshot = readiness.snapshot()
+        assert snapshot["wallet"]["state"] == STATE_READY
+        assert snapshot["ledger"]["state"] == STATE_FAILED
+        assert snapshot["ledger"]["error"] == "No ledger"
+
+    async def test_run_in_background(self):
+        """Test background subsystem doesn't hold back the readiness"""
+
+        readiness = SubsystemReadiness()
+        release = asyncio.Event()
+
+        readiness.run_in_background("smart_contract", release.wait())
+        await asyncio.sleep(0)
+
+        assert readiness.ready
+        assert readiness.snapshot()["smart_contract"]["state"] == STATE_PENDING
+
+        release.set()
+        assert await readiness.wait("smart_contract", timeout=1)
+
+        await readiness.stop()
@@ -0,0 +1,46 @@
+import asyncio
+
+from asynctest import TestCase as AsyncTestCase
+from dexa_sdk.agent.core.task_lanes import (
+    LANE_BACKGROUND,
+    LANE_BULK,
+    LANE_INTERACTIVE,
+    TaskLanes,
+)
+
+
+class TestTaskLanes(AsyncTestCase):
+    """Test task lanes"""
+
+    async def test_lanes_have_independent_limits(self):
+        """Test saturated background lane doesn't delay interactive tasks"""
+
+        lanes = TaskLanes({LANE_BACKGROUND: 1, LANE_BULK: 1})
+        release = asyncio.Event()
+
+        # Fill the background lane
+        lanes.put(LANE_BACKGROUND, release.wait())
+        lanes.put(LANE_BACKGROUND, release.wait())
+
+        async def interactive():
+            return "done"
+
+        pending = lanes.put(LANE_INTERACTIVE, interactive())
+        task = await asyncio.wait_for(pending, timeout=1)
+        assert await task == "done"
+
+        metrics = lanes.metrics()
+        assert metrics[LANE_BACKGROUND]["active"] == 1
+        assert metrics[LANE_BACKGROUND]["pending"] == 1
+        assert metrics[LANE_BACKGROUND]["wait_oldest"] > 0
+
+        release.set()
+        await lanes.get(LANE_BACKGROUND).task_queue.flush()
+
+        metrics = lanes.metrics()
+        assert metrics[LANE_BACKGROUND]["done"] == 2
+        assert metrics[LANE_BACKGROUND]["wait_max"] > 0
+        assert metrics[LANE_INTERACTIVE]["done"] == 1
+        assert metrics[LANE_INTERACTIVE]["wait_max"] == 0
+
+        await lanes.complete()
@@ -0,0 +1,32 @@
+"""Http transport sharing the port with other worker processes."""
+
+from aiohttp import web
+from aries_cloudagent.transport.inbound import http
+from aries_cloudagent.transport.inbound.base import InboundTransportSetupError
+
+
+class ReusePortHttpTransport(http.HttpTransport):
+    """Http transport listening with SO_REUSEPORT.
+
+    Kernel balances the connections between the worker processes.
+    """
+
+    async def start(self) -> None:
+        """
+        Start this transport.
+
+        Raises:
+            InboundTransportSetupError: If there was an error starting the webserver
+
+        """
+        app = await self.make_application()
+        runner = web.AppRunner(app)
+        await runner.setup()
+        self.site = web.TCPSite(runner, host=self.host, port=self.port, reuse_port=True)
+        try:
+            await self.site.start()
+        except OSError:
+            raise InboundTransportSetupError(
+                "Unable to start webserver with host "
+                + f"'{self.host}' and port '{self.port}'\n"
+            )
@@ -0,0 +1,213 @@
+"""Base class for inbound message queues."""
+
+import typing
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from aries_cloudagent.config.injection_context import InjectionContext
+from aries_cloudagent.transport.inbound.message import InboundMessage
+from aries_cloudagent.transport.inbound.receipt import MessageReceipt
+from aries_cloudagent.utils.classloader import ClassLoader
+
+# Inbound queue implementations by name
+INBOUND_QUEUES = {
+    "local": "dexa_sdk.agent.transport.inbound.queue.local.LocalInboundQueue",
+    "sqlite": "dexa_sdk.agent.transport.inbound.queue.sqlite.SQLiteInboundQueue",
+}
+
+
+def serialize_inbound_message(message: InboundMessage) -> dict:
+    """Serialize inbound message, for dispatching it in another process
+
+    Args:
+        message (InboundMessage): Inbound message
+
+    Returns:
+        dict: JSON serialisable message
+    """
+    receipt = message.receipt
+    payload = message.payload
+
+    return {
+        "payload": payload.decode() if isinstance(payload, bytes) else payload,
+        "connection_id": message.connection_id,
+        "transport_type": message.transport_type,
+        "receipt": {
+            "connection_id": receipt.connection_id,
+            "direct_response_mode": receipt.direct_response_mode,
+            "in_time": receipt.in_time.isoformat() if receipt.in_time else None,
+            "raw_message": receipt.raw_message,
+            "recipient_verkey": receipt.recipient_verkey,
+            "recipient_did": receipt.recipient_did,
+            "recipient_did_public": receipt.recipient_did_public,
+            "sender_did": receipt.sender_did,
+            "sender_verkey": receipt.sender_verkey,
+            "thread_id": receipt.thread_id,
+        },
+    }
+
+
+def deserialize_inbound_message(value: dict) -> InboundMessage:
+    """Deserialize inbound message, session is not available in this process
+
+    Args:
+        value (dict): Serialized message
+
+    Returns:
+        InboundMessage: Inbound message
+    """
+    receipt = dict(value["receipt"])
+    if receipt["in_time"]:
+        receipt["in_time"] = datetime.fromisoformat(receipt["in_time"])
+
+    return InboundMessage(
+        value["payload"],
+        MessageReceipt(**receipt),
+        connection_id=value["connection_id"],
+        transport_type=value["transport_type"],
+    )
+
+
+class BaseInboundQueue(ABC):
+    """Queue of inbound messages awaiting dispatch.
+
+    Messages are offloaded to the queue if this instance is busy, and
+    dispatched by the instances with capacity.
+    """
+
+    def __init__(self, context: InjectionContext) -> None:
+        """Initialise inbound queue
+
+        Args:
+            context (InjectionContext): Injection context
+        """
+        self._context = context
+
+        # Local backlog from which messages are offloaded, disabled if 0
+        self._offload_threshold = context.settings.get(
+            "dexa.inbound_offload_threshold", 0
+        )
+
+        # Backlog above which the instance reports not ready, unbounded if 0
+        self._max_depth = context.settings.get("dexa.inbound_queue_max_depth", 0)
+
+        # Messages awaiting local dispatch
+        self._local_depth: typing.Callable[[], int] = lambda: 0
+
+        # Dispatches the message locally
+        self._dispatch: typing.Optional[typing.Callable] = None
+
+    @property
+    def offload_threshold(self) -> int:
+        """Accessor for offload threshold
+
+        Returns:
+            int: local backlog from which messages are offloaded
+        """
+        return self._offload_threshold
+
+    @property
+    def max_depth(self) -> int:
+        """Accessor for maximum backlog of ready instance
+
+        Returns:
+            int: maximum backlog
+        """
+        return self._max_depth
+
+    def local_depth(self) -> int:
+        """Messages awaiting local dispatch
+
+        Returns:
+            int: local backlog
+        """
+        return self._local_depth()
+
+    def busy(self) -> bool:
+        """Whether messages are to be offloaded to other instances
+
+        Returns:
+            bool: True if local backlog reached the offload threshold
+        """
+        return bool(self._offload_threshold) and (
+            self.local_depth() >= self._offload_threshold
+        )
+
+    async def depth(self) -> dict:
+        """Local and shared backlog
+
+        Returns:
+            dict: messages awaiting local dispatch and in the shared queue
+        """
+        return {"local": self.local_depth(), "shared": await self.shared_depth()}
+
+    async def ready(self) -> bool:
+        """Whether the instance is ready to receive more messages
+
+        Returns:
+            bool: False if the backlog is above the maximum
+        """
+        if not self._max_depth:
+            return True
+
+        depth = await self.depth()
+
+        return depth["local"] + depth["shared"] < self._max_depth
+
+    async def start(
+        self,
+        dispatch: typing.Callable[[InboundMessage], None],
+        local_depth: typing.Callable[[], int],
+    ) -> None:
+        """Start dispatching the messages offloaded by other instances
+
+        Args:
+            dispatch (typing.Callable[[InboundMessage], None]): Dispatches locally
+            local_depth (typing.Callable[[], int]): Messages awaiting local dispatch
+        """
+        self._dispatch = dispatch
+        self._local_depth = local_depth
+
+    async def stop(self) -> None:
+        """Stop dispatching the offloaded messages"""
+
+    @abstractmethod
+    async def offload(self, message: InboundMessage) -> bool:
+        """Offload the message to other instances
+
+        Args:
+            message (InboundMessage): Inbound message
+
+        Returns:
+            bool: False if the message is to be dispatched locally
+        """
+
+    @abstractmethod
+    async def shared_depth(self) -> int:
+        """Messages in the shared queue
+
+        Returns:
+            int: shared backlog
+        """
+
+
+def load_inbound_queue(context: InjectionContext) -> BaseInboundQueue:
+    """Load the configured inbound queue
+
+    Shared queue is used by default if running in worker processes.
+
+    Args:
+        context (InjectionContext): Injection context
+
+    Returns:
+        BaseInboundQueue: inbound queue
+    """
+    default = (
+        "sqlite" if context.settings.get("dexa.worker_id") is not None else "local"
+    )
+    name = context.settings.get("dexa.inbound_queue") or default
+
+    # Name of the implementation or class path
+    queue_class = ClassLoader.load_class(INBOUND_QUEUES.get(name, name))
+
+    return queue_class(context)
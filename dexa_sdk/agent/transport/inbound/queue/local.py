@@ -0,0 +1,30 @@
+"""In-process inbound queue."""
+
+from aries_cloudagent.transport.inbound.message import InboundMessage
+from dexa_sdk.agent.transport.inbound.queue.base import BaseInboundQueue
+
+
+class LocalInboundQueue(BaseInboundQueue):
+    """Inbound queue without peers, messages are dispatched locally.
+
+    Backlog is the local one, reported for readiness.
+    """
+
+    async def offload(self, message: InboundMessage) -> bool:
+        """No peers to offload the message to
+
+        Args:
+            message (InboundMessage): Inbound message
+
+        Returns:
+            bool: False, message is dispatched locally
+        """
+        return False
+
+    async def shared_depth(self) -> int:
+        """No shared queue
+
+        Returns:
+            int: 0
+        """
+        return 0
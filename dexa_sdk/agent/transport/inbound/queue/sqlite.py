@@ -0,0 +1,162 @@
+"""Inbound queue shared by local processes, backed by SQLite."""
+
+import asyncio
+import logging
+import typing
+from concurrent.futures import ThreadPoolExecutor
+
+from aries_cloudagent.config.injection_context import InjectionContext
+from aries_cloudagent.transport.inbound.message import InboundMessage
+from dexa_sdk.agent.transport.inbound.queue.base import (
+    BaseInboundQueue,
+    deserialize_inbound_message,
+    serialize_inbound_message,
+)
+from dexa_sdk.agent.workers.shared_queue import SharedQueue
+
+LOGGER = logging.getLogger(__name__)
+
+# Shared queue topic for the inbound messages
+TOPIC_INBOUND_MESSAGE = "inbound_message"
+
+
+class SQLiteInboundQueue(BaseInboundQueue):
+    """Inbound queue shared by the processes on this host.
+
+    Local stand-in for a networked queue, for e.g. between the worker
+    processes. Instances below the offload threshold claim the messages
+    offloaded by busy ones.
+    """
+
+    def __init__(self, context: InjectionContext) -> None:
+        """Initialise inbound queue
+
+        Args:
+            context (InjectionContext): Injection context
+        """
+        super().__init__(context)
+
+        # Defaults to the queue shared by the worker processes
+        path = context.settings.get("dexa.inbound_queue_path") or context.settings.get(
+            "dexa.shared_queue_path"
+        )
+        assert path, "Inbound queue path is not configured."
+
+        # Identifies the claiming instance, jobs are released if it crashes
+        self._worker_id = context.settings.get("dexa.worker_id", 0)
+
+        # Poll interval
+        self._poll_interval = context.settings.get(
+            "dexa.inbound_queue_poll_interval", 0.05
+        )
+
+        # Shared queue, blocking calls are run in a dedicated thread
+        self._queue = SharedQueue(path)
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="dexa-inbound-queue"
+        )
+
+        # Messages offloaded and claimed by this instance
+        self.offloaded = 0
+        self.claimed = 0
+
+        # Poller task
+        self._task: typing.Optional[asyncio.Task] = None
+
+    async def _run(self, fn: typing.Callable, *args) -> typing.Any:
+        """Run blocking shared queue call in the queue thread"""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self._executor, fn, *args)
+
+    async def offload(self, message: InboundMessage) -> bool:
+        """Add the message to the shared queue
+
+        Args:
+            message (InboundMessage): Inbound message
+
+        Returns:
+            bool: True, message is dispatched by an instance with capacity
+        """
+        await self._run(
+            self._queue.put, TOPIC_INBOUND_MESSAGE, serialize_inbound_message(message)
+        )
+        self.offloaded += 1
+
+        return True
+
+    async def shared_depth(self) -> int:
+        """Messages in the shared queue
+
+        Returns:
+            int: shared backlog
+        """
+        return await self._run(self._queue.depth, [TOPIC_INBOUND_MESSAGE])
+
+    async def claim(self) -> int:
+        """Claim and dispatch messages up to the offload threshold
+
+        Returns:
+            int: number of messages dispatched
+        """
+        capacity = (
+            self.offload_threshold - self.local_depth()
+            if self.offload_threshold
+            else 10
+        )
+        if capacity <= 0:
+            return 0
+
+        jobs = await self._run(
+            self._queue.claim, [TOPIC_INBOUND_MESSAGE], self._worker_id, capacity
+        )
+        for job in jobs:
+            try:
+                self._dispatch(deserialize_inbound_message(job.payload))
+            except Exception:
+                LOGGER.exception("Error dispatching offloaded message %s", job.job_id)
+
+            # Dispatch is queued, hence removed from the shared queue
+            await self._run(self._queue.ack, job.job_id)
+
+        self.claimed += len(jobs)
+
+        return len(jobs)
+
+    async def _poll(self) -> None:
+        """Claim messages on an interval"""
+        while True:
+            try:
+                if not await self.claim():
+                    await asyncio.sleep(self._poll_interval)
+            except Exception:
+                LOGGER.exception("Error claiming offloaded messages")
+                await asyncio.sleep(self._poll_interval)
+
+    async def start(
+        self,
+        dispatch: typing.Callable[[InboundMessage], None],
+        local_depth: typing.Callable[[], int],
+    ) -> None:
+        """Start dispatching the messages offloaded by other instances
+
+        Args:
+            dispatch (typing.Callable[[InboundMessage], None]): Dispatches locally
+            local_depth (typing.Callable[[], int]): Messages awaiting local dispatch
+        """
+        await super().start(dispatch, local_depth)
+
+        if not self._task or self._task.done():
+            self._task = asyncio.get_event_loop().create_task(self._poll())
+
+    async def stop(self) -> None:
+        """Stop dispatching the offloaded messages and close the shared queue"""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+        await self._run(self._queue.close)
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,97 @@
+import asyncio
+import os
+import tempfile
+from datetime import datetime
+
+from aries_cloudagent.config.injection_context import InjectionContext
+from aries_cloudagent.transport.inbound.message import InboundMessage
+from aries_cloudagent.transport.inbound.receipt import MessageReceipt
+from asynctest import TestCase as AsyncTestCase
+from dexa_sdk.agent.transport.inbound.queue.base import (
+    deserialize_inbound_message,
+    load_inbound_queue,
+    serialize_inbound_message,
+)
+from dexa_sdk.agent.transport.inbound.queue.local import LocalInboundQueue
+from dexa_sdk.agent.transport.inbound.queue.sqlite import SQLiteInboundQueue
+
+
+class TestInboundQueue(AsyncTestCase):
+    """Test inbound queues"""
+
+    def create_message(self) -> InboundMessage:
+        return InboundMessage(
+            '{"@type": "ping"}',
+            MessageReceipt(
+                connection_id="connection-1",
+                in_time=datetime.utcnow(),
+                sender_verkey="sender",
+                recipient_verkey="recipient",
+                thread_id="thread-1",
+            ),
+            connection_id="connection-1",
+            transport_type="http",
+        )
+
+    async def test_serialize_inbound_message(self):
+        """Test inbound message serialization"""
+
+        message = self.create_message()
+        value = deserialize_inbound_message(serialize_inbound_message(message))
+
+        assert value.payload == message.payload
+        assert value.connection_id == "connection-1"
+        assert value.receipt.in_time == message.receipt.in_time
+        assert value.receipt.sender_verkey == "sender"
+        assert value.receipt.thread_id == "thread-1"
+
+    async def test_local_queue_readiness(self):
+        """Test local backlog drives readiness"""
+
+        context = InjectionContext(settings={"dexa.inbound_queue_max_depth": 2})
+        queue = load_inbound_queue(context)
+        assert isinstance(queue, LocalInboundQueue)
+
+        backlog = 1
+        await queue.start(lambda message: None, lambda: backlog)
+
+        assert not queue.busy()
+        assert await queue.ready()
+        assert not await queue.offload(self.create_message())
+
+        backlog = 2
+        assert not await queue.ready()
+
+    async def test_sqlite_queue_offload(self):
+        """Test busy instance offloads messages to the peer"""
+
+        path = os.path.join(tempfile.mkdtemp(), "inbound_queue.db")
+        settings = {
+            "dexa.inbound_queue": "sqlite",
+            "dexa.inbound_queue_path": path,
+            "dexa.inbound_offload_threshold": 2,
+        }
+
+        busy = load_inbound_queue(InjectionContext(settings=settings))
+        peer = load_inbound_queue(InjectionContext(settings=settings))
+        assert isinstance(busy, SQLiteInboundQueue)
+
+        busy_dispatched = []
+        peer_dispatched = []
+        await busy.start(busy_dispatched.append, lambda: 2)
+
+        assert busy.busy()
+        assert await busy.offload(self.create_message())
+        assert (await busy.depth())["shared"] == 1
+
+        # Peer with capacity claims the message
+        await peer.start(peer_dispatched.append, lambda: 1)
+        await asyncio.sleep(0.2)
+
+        await busy.stop()
+        await peer.stop()
+
+        assert busy_dispatched == []
+        assert len(peer_dispatched) == 1
+        assert peer_dispatched[0].receipt.thread_id == "thread-1"
+        assert peer.claimed == 1
@@ -0,0 +1,36 @@
+"""Http outbound transport keeping connections alive between deliveries."""
+
+from aiohttp import ClientSession, DummyCookieJar, TCPConnector
+from aries_cloudagent.transport.outbound import http
+from aries_cloudagent.transport.stats import StatsTracer
+
+
+class KeepAliveHttpTransport(http.HttpTransport):
+    """Http transport reusing connections to an endpoint.
+
+    Connections per host are limited to the deliveries run concurrently
+    for an endpoint, idle connections are kept open for the next batch.
+    """
+
+    # Maximum connections per host
+    limit_per_host = 8
+
+    # Seconds idle connections are kept open
+    keepalive_timeout = 60.0
+
+    async def start(self):
+        """Start the transport."""
+        session_args = {}
+        self.connector = TCPConnector(
+            limit=200,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+        )
+        if self.collector:
+            session_args["trace_configs"] = [
+                StatsTracer(self.collector, "outbound-http:")
+            ]
+        session_args["cookie_jar"] = DummyCookieJar()
+        session_args["connector"] = self.connector
+        self.client_session = ClientSession(**session_args)
+        return self
@@ -0,0 +1,526 @@
+"""Outbound transport manager coalescing messages per endpoint."""
+
+import asyncio
+import json
+import logging
+import random
+import time
+import typing
+from urllib.parse import urlparse
+
+from aries_cloudagent.config.injection_context import InjectionContext
+from aries_cloudagent.transport.outbound.base import (
+    BaseOutboundTransport,
+    OutboundDeliveryError,
+)
+from aries_cloudagent.transport.outbound.manager import (
+    OutboundTransportManager,
+    QueuedOutboundMessage,
+)
+from aries_cloudagent.transport.outbound.message import OutboundMessage
+from aries_cloudagent.utils.classloader import ClassLoader
+from aries_cloudagent.utils.stats import Collector
+from aries_cloudagent.utils.task_queue import CompletedTask
+
+LOGGER = logging.getLogger(__name__)
+
+# Outbound transports replaced by keep-alive variants
+KEEP_ALIVE_TRANSPORTS = {
+    "http": "dexa_sdk.agent.transport.outbound.http",
+}
+
+# Default concurrent deliveries per endpoint
+DEFAULT_ENDPOINT_MAX_ACTIVE = 8
+
+# Default seconds idle connections are kept open
+DEFAULT_KEEPALIVE_TIMEOUT = 60.0
+
+# Batch is released early once it reaches this size
+MAX_BATCH_SIZE = 100
+
+# Topic of the webhooks carrying an array of events, posted to <target>/topic/batch/
+WEBHOOK_BATCH_TOPIC = "batch"
+
+# Default seconds webhook events are held for batching
+DEFAULT_WEBHOOK_BATCH_WINDOW = 0.5
+
+# Seconds before the first webhook retry, doubled per attempt up to the maximum
+WEBHOOK_RETRY_BASE_DELAY = 1.0
+WEBHOOK_RETRY_MAX_DELAY = 60.0
+
+
+def endpoint_key(endpoint: str) -> str:
+    """Connection level key of the endpoint, paths share the connections
+
+    Args:
+        endpoint (str): Endpoint URL
+
+    Returns:
+        str: scheme and network location of the endpoint
+    """
+    parsed = urlparse(endpoint or "")
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
+def webhook_retry_delay(attempt: int) -> float:
+    """Seconds before retrying a webhook, doubled per attempt with jitter
+
+    Args:
+        attempt (int): Failed attempts so far, from 1
+
+    Returns:
+        float: delay, between half and all of the backoff
+    """
+    delay = min(WEBHOOK_RETRY_BASE_DELAY * 2 ** (attempt - 1), WEBHOOK_RETRY_MAX_DELAY)
+    return random.uniform(delay / 2, delay)
+
+
+class EndpointSlots:
+    """Limits the deliveries run concurrently for an endpoint."""
+
+    def __init__(self, max_active: int) -> None:
+        """Initialise endpoint slots
+
+        Args:
+            max_active (int): Maximum concurrent deliveries
+        """
+        self._semaphore = asyncio.Semaphore(max_active)
+
+        # Deliveries running and waiting for a slot
+        self.active = 0
+        self.waiting = 0
+
+    async def __aenter__(self) -> "EndpointSlots":
+        self.waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        self.active += 1
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        self.active -= 1
+        self._semaphore.release()
+
+
+class CoalescingOutboundTransportManager(OutboundTransportManager):
+    """Outbound transport manager grouping messages for the same endpoint.
+
+    Messages queued for an endpoint within the coalesce window are released
+    together, in order, and delivered over the connections kept alive for
+    the endpoint. Deliveries per endpoint are bounded, so that a burst of
+    messages to one endpoint doesn't open a connection per message.
+
+    Webhook events can likewise be batched per target, posted as an array
+    to the 'batch' topic of the target.
+    """
+
+    def __init__(
+        self, context: InjectionContext, handle_not_delivered: typing.Callable = None
+    ):
+        """Initialise coalescing outbound transport manager
+
+        Args:
+            context (InjectionContext): The application context
+            handle_not_delivered (typing.Callable, optional): Handler for
+                undelivered messages
+        """
+        super().__init__(context, handle_not_delivered)
+
+        settings = context.settings
+
+        # Seconds messages are held for coalescing, 0 releases right away
+        self._window = settings.get("dexa.outbound_coalesce_window", 0.0)
+
+        # Concurrent deliveries and idle connection timeout per endpoint
+        self._endpoint_max_active = settings.get(
+            "dexa.outbound_endpoint_max_active", DEFAULT_ENDPOINT_MAX_ACTIVE
+        )
+        self._keepalive_timeout = settings.get(
+            "dexa.outbound_keepalive_timeout", DEFAULT_KEEPALIVE_TIMEOUT
+        )
+
+        # Messages held for coalescing and their release timers, by endpoint
+        self._batches: typing.Dict[str, typing.List[QueuedOutboundMessage]] = {}
+        self._timers: typing.Dict[str, asyncio.TimerHandle] = {}
+
+        # Delivery slots by endpoint
+        self._slots: typing.Dict[str, EndpointSlots] = {}
+
+        # Batch sizes
+        self._batches_released = 0
+        self._batched_messages = 0
+        self._batch_size_max = 0
+
+        # Latency from queueing to delivery, in seconds
+        self._delivered = 0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+
+        # Webhook events per batch, 0 posts every event on its own
+        self._webhook_batch_size = settings.get("dexa.webhook_batch_size", 0)
+        self._webhook_batch_window = settings.get(
+            "dexa.webhook_batch_window", DEFAULT_WEBHOOK_BATCH_WINDOW
+        )
+
+        # Concurrent deliveries per webhook target
+        self._webhook_max_active = settings.get(
+            "dexa.webhook_target_max_active", self._endpoint_max_active
+        )
+
+        # Webhook events held for batching, their release timers and
+        # maximum attempts, by target
+        self._webhook_batches: typing.Dict[str, typing.List[dict]] = {}
+        self._webhook_timers: typing.Dict[str, asyncio.TimerHandle] = {}
+        self._webhook_max_attempts: typing.Dict[str, int] = {}
+
+        # Webhook deliveries, retries and latency from queueing, in seconds
+        self._webhook_posts = 0
+        self._webhook_events = 0
+        self._webhook_delivered = 0
+        self._webhook_retries = 0
+        self._webhook_failed = 0
+        self._webhook_latency_total = 0.0
+        self._webhook_latency_max = 0.0
+
+    def register(self, module: str) -> str:
+        """Register an outbound transport, using keep-alive variants if available
+
+        Args:
+            module (str): Module name to register
+
+        Returns:
+            str: transport identifier
+        """
+        if module not in KEEP_ALIVE_TRANSPORTS:
+            return super().register(module)
+
+        # Absolute module path, not resolved relative to the aries transports
+        return self.register_class(
+            ClassLoader.load_subclass_of(
+                BaseOutboundTransport, KEEP_ALIVE_TRANSPORTS[module]
+            )
+        )
+
+    async def start_transport(self, transport_id: str):
+        """Start a registered transport, sizing the connection pool per endpoint
+
+        Args:
+            transport_id (str): Transport identifier
+        """
+        transport = self.registered_transports[transport_id]()
+        transport.collector = await self.context.inject(Collector, required=False)
+        if hasattr(transport, "limit_per_host"):
+            transport.limit_per_host = self._endpoint_max_active
+            transport.keepalive_timeout = self._keepalive_timeout
+        await transport.start()
+        self.running_transports[transport_id] = transport
+
+    def enqueue_message(self, context: InjectionContext, outbound: OutboundMessage):
+        """Add an outbound message to the batch of its endpoint
+
+        Args:
+            context (InjectionContext): The context of the request
+            outbound (OutboundMessage): The outbound message to deliver
+
+        Raises:
+            OutboundDeliveryError: if there is no transport for the targets
+        """
+        # Pick the first target with a running transport
+        targets = [outbound.target] if outbound.target else (outbound.target_list or [])
+        transport_id = None
+        for target in targets:
+            try:
+                transport_id = self.get_running_transport_for_endpoint(target.endpoint)
+            except OutboundDeliveryError:
+                pass
+            if transport_id:
+                break
+        if not transport_id:
+            raise OutboundDeliveryError("No supported transport for outbound message")
+
+        queued = QueuedOutboundMessage(context, outbound, target, transport_id)
+        queued.retries = self.MAX_RETRY_COUNT
+        queued.enqueued_at = time.perf_counter()
+
+        if not self._window:
+            self._release([queued])
+            return
+
+        # Hold the message till the window of the endpoint closes
+        key = endpoint_key(queued.endpoint)
+        batch = self._batches.setdefault(key, [])
+        batch.append(queued)
+
+        if len(batch) >= MAX_BATCH_SIZE:
+            self.flush_batch(key)
+        elif key not in self._timers:
+            self._timers[key] = self.loop.call_later(
+                self._window, self.flush_batch, key
+            )
+
+    def flush_batch(self, key: str) -> None:
+        """Release the messages held for the endpoint
+
+        Args:
+            key (str): Endpoint key
+        """
+        timer = self._timers.pop(key, None)
+        if timer:
+            timer.cancel()
+
+        batch = self._batches.pop(key, [])
+        if batch:
+            self._release(batch)
+
+    def _release(self, batch: typing.List[QueuedOutboundMessage]) -> None:
+        """Hand the batch over for encoding and delivery, in order
+
+        Args:
+            batch (typing.List[QueuedOutboundMessage]): Queued messages
+        """
+        self._batches_released += 1
+        self._batched_messages += len(batch)
+        self._batch_size_max = max(self._batch_size_max, len(batch))
+
+        self.outbound_new.extend(batch)
+        self.process_queued()
+
+    def enqueue_webhook(
+        self, topic: str, payload: dict, endpoint: str, max_attempts: int = None
+    ):
+        """Add a webhook event to the batch of its target, if batching
+
+        Args:
+            topic (str): The webhook topic
+            payload (dict): The webhook payload
+            endpoint (str): The webhook target
+            max_attempts (int, optional): Override the maximum number of attempts
+
+        Raises:
+            OutboundDeliveryError: if the associated transport is not running
+        """
+        if not self._webhook_batch_size:
+            self._queue_webhook(
+                f"{endpoint}/topic/{topic}/", payload, endpoint, max_attempts, 1
+            )
+            return
+
+        # Raises early, if there is no transport for the target
+        self.get_running_transport_for_endpoint(endpoint)
+
+        # Hold the event till the batch of the target is full or the window closes
+        batch = self._webhook_batches.setdefault(endpoint, [])
+        batch.append({"topic": topic, "payload": payload})
+        self._webhook_max_attempts[endpoint] = max_attempts
+
+        if len(batch) >= self._webhook_batch_size:
+            self.flush_webhooks(endpoint)
+        elif endpoint not in self._webhook_timers:
+            self._webhook_timers[endpoint] = self.loop.call_later(
+                self._webhook_batch_window, self.flush_webhooks, endpoint
+            )
+
+    def flush_webhooks(self, endpoint: str) -> None:
+        """Post the webhook events held for the target as an array
+
+        Args:
+            endpoint (str): The webhook target
+        """
+        timer = self._webhook_timers.pop(endpoint, None)
+        if timer:
+            timer.cancel()
+
+        batch = self._webhook_batches.pop(endpoint, [])
+        if not batch:
+            return
+
+        try:
+            self._queue_webhook(
+                f"{endpoint}/topic/{WEBHOOK_BATCH_TOPIC}/",
+                batch,
+                endpoint,
+                self._webhook_max_attempts.pop(endpoint, None),
+                len(batch),
+            )
+        except OutboundDeliveryError:
+            LOGGER.warning(
+                "Cannot queue %d webhook events for delivery, no supported transport",
+                len(batch),
+            )
+
+    def _queue_webhook(
+        self,
+        url: str,
+        payload: typing.Union[dict, list],
+        endpoint: str,
+        max_attempts: int,
+        events: int,
+    ) -> None:
+        """Queue the webhook post for delivery
+
+        Args:
+            url (str): Webhook URL
+            payload (typing.Union[dict, list]): Event payload, or array of events
+            endpoint (str): The webhook target
+            max_attempts (int): Maximum number of attempts, 5 if None
+            events (int): Number of events posted
+
+        Raises:
+            OutboundDeliveryError: if the associated transport is not running
+        """
+        transport_id = self.get_running_transport_for_endpoint(endpoint)
+        queued = QueuedOutboundMessage(None, None, None, transport_id)
+        queued.endpoint = url
+        queued.payload = json.dumps(payload)
+        queued.state = QueuedOutboundMessage.STATE_PENDING
+        queued.retries = 4 if max_attempts is None else max_attempts - 1
+        queued.enqueued_at = time.perf_counter()
+        queued.webhook_events = events
+        queued.webhook_attempts = 1
+
+        self._webhook_posts += 1
+        self._webhook_events += events
+
+        self.outbound_new.append(queued)
+        self.process_queued()
+
+    def _get_slots(self, queued: QueuedOutboundMessage) -> EndpointSlots:
+        """Returns delivery slots of the endpoint, webhook targets are capped apart
+
+        Args:
+            queued (QueuedOutboundMessage): Queued message
+
+        Returns:
+            EndpointSlots: delivery slots
+        """
+        if hasattr(queued, "webhook_events"):
+            key = f"webhook:{endpoint_key(queued.endpoint)}"
+            max_active = self._webhook_max_active
+        else:
+            key = endpoint_key(queued.endpoint)
+            max_active = self._endpoint_max_active
+
+        if key not in self._slots:
+            self._slots[key] = EndpointSlots(max_active)
+        return self._slots[key]
+
+    async def _deliver(self, queued: QueuedOutboundMessage) -> None:
+        """Deliver the message once a slot of the endpoint is free
+
+        Args:
+            queued (QueuedOutboundMessage): Queued message
+        """
+        transport = self.get_transport_instance(queued.transport_id)
+        async with self._get_slots(queued):
+            await transport.handle_message(
+                queued.context, queued.payload, queued.endpoint
+            )
+
+    def deliver_queued_message(self, queued: QueuedOutboundMessage) -> asyncio.Task:
+        """Kick off delivery of a queued message
+
+        Args:
+            queued (QueuedOutboundMessage): Queued message
+
+        Returns:
+            asyncio.Task: delivery task
+        """
+        queued.task = self.task_queue.run(
+            self._deliver(queued),
+            lambda completed: self.finished_deliver(queued, completed),
+        )
+        return queued.task
+
+    def finished_deliver(self, queued: QueuedOutboundMessage, completed: CompletedTask):
+        """Handle completion of queued message delivery, recording the latency
+
+        Args:
+            queued (QueuedOutboundMessage): Queued message
+            completed (CompletedTask): Completed delivery task
+        """
+        webhook = hasattr(queued, "webhook_events")
+        enqueued_at = getattr(queued, "enqueued_at", None)
+        if enqueued_at and not completed.exc_info:
+            latency = time.perf_counter() - enqueued_at
+            if webhook:
+                self._webhook_delivered += 1
+                self._webhook_latency_total += latency
+                self._webhook_latency_max = max(self._webhook_latency_max, latency)
+            else:
+                self._delivered += 1
+                self._latency_total += latency
+                self._latency_max = max(self._latency_max, latency)
+
+        super().finished_deliver(queued, completed)
+
+        if not webhook or not completed.exc_info:
+            return
+
+        # Webhooks are retried with a jittered backoff, not a fixed delay,
+        # so that retries to a recovering target are spread out
+        if queued.state == QueuedOutboundMessage.STATE_RETRY:
+            queued.retry_at = time.perf_counter() + webhook_retry_delay(
+                queued.webhook_attempts
+            )
+            queued.webhook_attempts += 1
+            self._webhook_retries += 1
+        else:
+            self._webhook_failed += 1
+
+    async def stop(self, wait: bool = True):
+        """Release the held messages and stop the transports
+
+        Args:
+            wait (bool, optional): Wait for the queued messages. Defaults to True.
+        """
+        for key in list(self._batches.keys()):
+            self.flush_batch(key)
+        for endpoint in list(self._webhook_batches.keys()):
+            self.flush_webhooks(endpoint)
+
+        await super().stop(wait)
+
+    def metrics(self) -> dict:
+        """Returns coalescing and delivery metrics
+
+        Returns:
+            dict: batch sizes, delivery latency in seconds and busy endpoints
+        """
+        return {
+            "coalesce_window": self._window,
+            "held": sum(len(batch) for batch in self._batches.values()),
+            "batches": self._batches_released,
+            "batch_size_avg": (
+                self._batched_messages / self._batches_released
+                if self._batches_released
+                else 0.0
+            ),
+            "batch_size_max": self._batch_size_max,
+            "delivered": self._delivered,
+            "latency_avg": (
+                self._latency_total / self._delivered if self._delivered else 0.0
+            ),
+            "latency_max": self._latency_max,
+            "endpoints": {
+                key: {"active": slots.active, "waiting": slots.waiting}
+                for key, slots in self._slots.items()
+                if slots.active or slots.waiting
+            },
+            "webhooks": {
+                "batch_size": self._webhook_batch_size,
+                "held": sum(len(batch) for batch in self._webhook_batches.values()),
+                "posts": self._webhook_posts,
+                "events": self._webhook_events,
+                "delivered": self._webhook_delivered,
+                "retries": self._webhook_retries,
+                "failed": self._webhook_failed,
+                "latency_avg": (
+                    self._webhook_latency_total / self._webhook_delivered
+                    if self._webhook_delivered
+                    else 0.0
+                ),
+                "latency_max": self._webhook_latency_max,
+            },
+        }
@@ -0,0 +1,148 @@
+import asyncio
+import json
+
+from aries_cloudagent.config.injection_context import InjectionContext
+from aries_cloudagent.connections.models.connection_target import ConnectionTarget
+from aries_cloudagent.transport.outbound.base import BaseOutboundTransport
+from aries_cloudagent.transport.outbound.message import OutboundMessage
+from asynctest import TestCase as AsyncTestCase
+from dexa_sdk.agent.transport.outbound.http import KeepAliveHttpTransport
+from dexa_sdk.agent.transport.outbound.manager import (
+    WEBHOOK_RETRY_MAX_DELAY,
+    CoalescingOutboundTransportManager,
+    endpoint_key,
+    webhook_retry_delay,
+)
+
+
+class RecordingTransport(BaseOutboundTransport):
+    """Outbound transport recording the delivered payloads"""
+
+    schemes = ("http",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.delivered = []
+        self.endpoints = []
+        self.active = 0
+        self.max_active = 0
+
+    async def start(self):
+        pass
+
+    async def stop(self):
+        pass
+
+    async def handle_message(self, context, payload, endpoint):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        self.delivered.append(payload)
+        self.endpoints.append(endpoint)
+
+
+class TestCoalescingOutboundTransportManager(AsyncTestCase):
+    """Test coalescing outbound transport manager"""
+
+    def create_message(self, payload: str, endpoint: str) -> OutboundMessage:
+        return OutboundMessage(
+            payload=payload,
+            enc_payload=payload,
+            target=ConnectionTarget(endpoint=endpoint),
+        )
+
+    async def test_coalesce_per_endpoint(self):
+        """Test messages to an endpoint are batched and deliveries bounded"""
+
+        context = InjectionContext(
+            settings={
+                "dexa.outbound_coalesce_window": 0.05,
+                "dexa.outbound_endpoint_max_active": 2,
+            }
+        )
+        manager = CoalescingOutboundTransportManager(context)
+        transport_id = manager.register_class(RecordingTransport)
+        await manager.start_transport(transport_id)
+        transport = manager.get_transport_instance(transport_id)
+
+        for index in range(5):
+            manager.enqueue_message(
+                context, self.create_message(str(index), "http://agent-1/a")
+            )
+        manager.enqueue_message(context, self.create_message("x", "http://agent-2"))
+
+        # Held till the window closes
+        assert manager.metrics()["held"] == 6
+
+        await asyncio.sleep(0.1)
+        await manager.flush()
+
+        assert transport.delivered.count("x") == 1
+        assert sorted(transport.delivered) == ["0", "1", "2", "3", "4", "x"]
+        assert transport.max_active <= 3
+
+        metrics = manager.metrics()
+        assert metrics["held"] == 0
+        assert metrics["batches"] == 2
+        assert metrics["batch_size_max"] == 5
+        assert metrics["delivered"] == 6
+        assert metrics["latency_max"] >= 0.05
+
+        await manager.stop()
+
+    async def test_keep_alive_transport(self):
+        """Test http transport is replaced by the keep-alive variant"""
+
+        context = InjectionContext(settings={"dexa.outbound_endpoint_max_active": 4})
+        manager = CoalescingOutboundTransportManager(context)
+        transport_id = manager.register("http")
+        await manager.start_transport(transport_id)
+
+        transport = manager.get_transport_instance(transport_id)
+        assert isinstance(transport, KeepAliveHttpTransport)
+        assert transport.connector.limit_per_host == 4
+
+        await manager.stop()
+
+        assert endpoint_key("https://agent:8080/path") == "https://agent:8080"
+
+    async def test_webhook_batches(self):
+        """Test webhook events are posted per target as arrays"""
+
+        context = InjectionContext(
+            settings={
+                "dexa.webhook_batch_size": 3,
+                "dexa.webhook_batch_window": 0.05,
+            }
+        )
+        manager = CoalescingOutboundTransportManager(context)
+        transport_id = manager.register_class(RecordingTransport)
+        await manager.start_transport(transport_id)
+        transport = manager.get_transport_instance(transport_id)
+
+        # Full batch is posted right away, the rest once the window closes
+        for index in range(4):
+            manager.enqueue_webhook("topic", {"index": index}, "http://controller")
+
+        await asyncio.sleep(0.1)
+        await manager.flush()
+
+        assert transport.endpoints == ["http://controller/topic/batch/"] * 2
+        assert [len(json.loads(payload)) for payload in transport.delivered] == [3, 1]
+        assert json.loads(transport.delivered[1]) == [
+            {"topic": "topic", "payload": {"index": 3}}
+        ]
+
+        metrics = manager.metrics()["webhooks"]
+        assert metrics["posts"] == 2
+        assert metrics["events"] == 4
+        assert metrics["delivered"] == 2
+        assert metrics["retries"] == 0
+
+        await manager.stop()
+
+        for attempt in range(1, 10):
+            delay = webhook_retry_delay(attempt)
+            assert delay <= WEBHOOK_RETRY_MAX_DELAY
+            assert delay >= min(2 ** (attempt - 1), WEBHOOK_RETRY_MAX_DELAY) / 2
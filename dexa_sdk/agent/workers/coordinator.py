@@ -0,0 +1,249 @@
+"""Coordinates background jobs and notifications between worker processes."""
+
+import asyncio
+import logging
+import time
+import typing
+from concurrent.futures import ThreadPoolExecutor
+
+from dexa_sdk.agent.workers.shared_queue import SharedEvent, SharedJob, SharedQueue
+
+LOGGER = logging.getLogger(__name__)
+
+# Anchoring outbox entries, processed by the worker owning the ethereum accounts
+JOB_ANCHOR_OUTBOX_ENTRY = "anchor_outbox_entry"
+
+# Admin notifications, delivered to websocket clients of every worker
+EVENT_ADMIN_NOTIFICATION = "admin_notification"
+
+# Record types changed, invalidating the admin responses cached by every worker
+EVENT_RECORD_CHANGED = "record_changed"
+
+# Worker processing the jobs which must not run concurrently in processes,
+# for e.g. transactions signed by the same account.
+LEADER_WORKER_ID = 0
+
+# Seconds events are kept for the workers to read them
+EVENT_RETENTION = 60.0
+
+
+class WorkerCoordinator:
+    """Claims jobs from the shared queue and delivers broadcast events.
+
+    Runs in every worker process, polling the shared queue in the background.
+    """
+
+    def __init__(
+        self,
+        queue_path: str,
+        worker_id: int,
+        poll_interval: float = 0.1,
+    ) -> None:
+        """Initialise worker coordinator
+
+        Args:
+            queue_path (str): Shared queue database path
+            worker_id (int): Worker identifier
+            poll_interval (float, optional): Seconds between polls. Defaults to 0.1.
+        """
+
+        # Worker identifier
+        self._worker_id = worker_id
+
+        # Poll interval
+        self._poll_interval = poll_interval
+
+        # Shared queue, blocking calls are run in a dedicated thread
+        self._queue = SharedQueue(queue_path)
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="dexa-shared-queue"
+        )
+
+        # Job handlers by topic
+        self._job_handlers: typing.Dict[str, typing.Callable] = {}
+
+        # Event subscribers by topic
+        self._subscribers: typing.Dict[str, typing.List[typing.Callable]] = {}
+
+        # Last event read from the queue
+        self._last_event_id = 0
+
+        # Counters
+        self._jobs_submitted = 0
+        self._jobs_processed = 0
+        self._jobs_failed = 0
+        self._events_received = 0
+
+        # Poller task
+        self._task: typing.Optional[asyncio.Task] = None
+
+    @property
+    def worker_id(self) -> int:
+        """Accessor for worker identifier
+
+        Returns:
+            int: worker identifier
+        """
+        return self._worker_id
+
+    @property
+    def is_leader(self) -> bool:
+        """Whether the worker processes jobs which must not run concurrently
+
+        Returns:
+            bool: True for the leader worker
+        """
+        return self._worker_id == LEADER_WORKER_ID
+
+    async def _run(self, fn: typing.Callable, *args) -> typing.Any:
+        """Run blocking shared queue call in the queue thread"""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self._executor, fn, *args)
+
+    def register_job_handler(self, topic: str, handler: typing.Callable) -> None:
+        """Process the jobs of the topic in this worker
+
+        Args:
+            topic (str): Job topic
+            handler (typing.Callable): Coroutine function called with the job payload
+        """
+        self._job_handlers[topic] = handler
+
+    def subscribe(self, topic: str, callback: typing.Callable) -> None:
+        """Receive events of the topic published by other workers
+
+        Args:
+            topic (str): Event topic
+            callback (typing.Callable): Coroutine function called with the event payload
+        """
+        self._subscribers.setdefault(topic, []).append(callback)
+
+    async def submit(self, topic: str, payload: dict) -> int:
+        """Add a job to the shared queue, processed by a worker handling the topic
+
+        Args:
+            topic (str): Job topic
+            payload (dict): Job payload, JSON serialisable
+
+        Returns:
+            int: job identifier
+        """
+        job_id = await self._run(self._queue.put, topic, payload)
+        self._jobs_submitted += 1
+
+        return job_id
+
+    async def purge(self, topic: str) -> int:
+        """Remove the jobs of the topic from the shared queue
+
+        Args:
+            topic (str): Job topic
+
+        Returns:
+            int: number of jobs removed
+        """
+        return await self._run(self._queue.purge, topic)
+
+    async def publish(self, topic: str, payload: dict) -> None:
+        """Broadcast an event to the other workers
+
+        Args:
+            topic (str): Event topic
+            payload (dict): Event payload, JSON serialisable
+        """
+        await self._run(self._queue.publish, topic, self._worker_id, payload)
+
+    async def _process_job(self, job: SharedJob) -> None:
+        """Process the claimed job, job is removed from the queue afterwards
+
+        Args:
+            job (SharedJob): Claimed job
+        """
+        try:
+            await self._job_handlers[job.topic](job.payload)
+            self._jobs_processed += 1
+        except Exception:
+            self._jobs_failed += 1
+            LOGGER.exception("Error processing shared job %s", job.job_id)
+        finally:
+            await self._run(self._queue.ack, job.job_id)
+
+    async def _deliver_event(self, event: SharedEvent) -> None:
+        """Deliver the event to the subscribers
+
+        Args:
+            event (SharedEvent): Event
+        """
+        self._events_received += 1
+        for callback in self._subscribers.get(event.topic, []):
+            try:
+                await callback(event.payload)
+            except Exception:
+                LOGGER.exception("Error delivering shared event %s", event.event_id)
+
+    async def poll(self) -> None:
+        """Claim jobs and read events from the shared queue once"""
+        jobs = await self._run(
+            self._queue.claim, list(self._job_handlers.keys()), self._worker_id
+        )
+        for job in jobs:
+            asyncio.ensure_future(self._process_job(job))
+
+        events = await self._run(self._queue.events_since, self._last_event_id)
+        for event in events:
+            self._last_event_id = event.event_id
+            if event.origin != self._worker_id:
+                await self._deliver_event(event)
+
+    async def _poll_loop(self) -> None:
+        """Poll the shared queue on an interval"""
+        pruned_at = time.monotonic()
+        while True:
+            try:
+                await self.poll()
+
+                # Events are read by all the workers within the retention
+                if self.is_leader and time.monotonic() - pruned_at > EVENT_RETENTION:
+                    await self._run(self._queue.prune_events, EVENT_RETENTION)
+                    pruned_at = time.monotonic()
+            except Exception:
+                LOGGER.exception("Error polling shared queue")
+
+            await asyncio.sleep(self._poll_interval)
+
+    async def start(self) -> None:
+        """Start polling the shared queue, skipping events published earlier"""
+        if self._task and not self._task.done():
+            return
+
+        self._last_event_id = await self._run(self._queue.last_event_id)
+        self._task = asyncio.get_event_loop().create_task(self._poll_loop())
+
+    async def stop(self) -> None:
+        """Stop polling and close the shared queue"""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+        await self._run(self._queue.close)
+        self._executor.shutdown(wait=False)
+
+    async def metrics(self) -> dict:
+        """Returns coordinator metrics
+
+        Returns:
+            dict: worker identifier, queue depth and job counters
+        """
+        return {
+            "worker_id": self._worker_id,
+            "leader": self.is_leader,
+            "queue_depth": await self._run(self._queue.depth),
+            "jobs_submitted": self._jobs_submitted,
+            "jobs_processed": self._jobs_processed,
+            "jobs_failed": self._jobs_failed,
+            "events_received": self._events_received,
+        }
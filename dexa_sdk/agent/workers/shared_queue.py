@@ -0,0 +1,256 @@
+"""Shared queue for worker processes, backed by a local SQLite database."""
+
+import json
+import sqlite3
+import threading
+import time
+import typing
+from collections import namedtuple
+
+# Job states
+JOB_STATE_PENDING = "pending"
+JOB_STATE_CLAIMED = "claimed"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    topic TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    state TEXT NOT NULL,
+    worker_id INTEGER,
+    created_at REAL NOT NULL,
+    claimed_at REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_topic_state ON jobs (topic, state);
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    topic TEXT NOT NULL,
+    origin INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+"""
+
+SharedJob = namedtuple("SharedJob", "job_id topic payload")
+
+SharedEvent = namedtuple("SharedEvent", "event_id topic origin payload")
+
+
+class SharedQueue:
+    """Local stand-in for a shared queue between worker processes.
+
+    Jobs are claimed by one worker, events are broadcast to all the workers.
+    Calls are blocking, hence to be run in an executor from the event loop.
+    """
+
+    def __init__(self, path: str, timeout: float = 5.0) -> None:
+        """Initialise shared queue
+
+        Args:
+            path (str): SQLite database path, shared by the workers
+            timeout (float, optional): Seconds to wait for the database lock.
+                Defaults to 5.0.
+        """
+
+        # Database path
+        self._path = path
+
+        # Connection is shared by the threads of the process
+        self._conn = sqlite3.connect(
+            path, timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+        self._lock = threading.Lock()
+
+        with self._lock:
+            # Write-ahead log, readers don't block the writer
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(SCHEMA)
+
+    @property
+    def path(self) -> str:
+        """Accessor for database path
+
+        Returns:
+            str: database path
+        """
+        return self._path
+
+    def put(self, topic: str, payload: dict) -> int:
+        """Add a job to the queue
+
+        Args:
+            topic (str): Job topic
+            payload (dict): Job payload
+
+        Returns:
+            int: job identifier
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO jobs (topic, payload, state, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (topic, json.dumps(payload), JOB_STATE_PENDING, time.time()),
+            )
+            return cursor.lastrowid
+
+    def claim(
+        self, topics: typing.Sequence[str], worker_id: int, limit: int = 10
+    ) -> typing.List[SharedJob]:
+        """Claim pending jobs, each job is claimed by one worker only
+
+        Args:
+            topics (typing.Sequence[str]): Job topics handled by the worker
+            worker_id (int): Worker identifier
+            limit (int, optional): Maximum number of jobs. Defaults to 10.
+
+        Returns:
+            typing.List[SharedJob]: claimed jobs
+        """
+        if not topics:
+            return []
+
+        placeholders = ",".join("?" for _ in topics)
+
+        with self._lock:
+            # Lock the database for writing before selecting the jobs
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._conn.execute(
+                    f"SELECT id, topic, payload FROM jobs WHERE state = ? "
+                    f"AND topic IN ({placeholders}) ORDER BY id LIMIT ?",
+                    (JOB_STATE_PENDING, *topics, limit),
+                ).fetchall()
+                self._conn.executemany(
+                    "UPDATE jobs SET state = ?, worker_id = ?, claimed_at = ? "
+                    "WHERE id = ?",
+                    [
+                        (JOB_STATE_CLAIMED, worker_id, time.time(), row[0])
+                        for row in rows
+                    ],
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        return [SharedJob(row[0], row[1], json.loads(row[2])) for row in rows]
+
+    def ack(self, job_id: int) -> None:
+        """Remove the processed job
+
+        Args:
+            job_id (int): Job identifier
+        """
+        with self._lock:
+            self._conn.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+
+    def release_worker(self, worker_id: int) -> int:
+        """Return the jobs claimed by the worker to the queue, for e.g. on crash
+
+        Args:
+            worker_id (int): Worker identifier
+
+        Returns:
+            int: number of jobs released
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET state = ?, worker_id = NULL, claimed_at = NULL "
+                "WHERE state = ? AND worker_id = ?",
+                (JOB_STATE_PENDING, JOB_STATE_CLAIMED, worker_id),
+            )
+            return cursor.rowcount
+
+    def purge(self, topic: str) -> int:
+        """Remove the jobs of the topic
+
+        Args:
+            topic (str): Job topic
+
+        Returns:
+            int: number of jobs removed
+        """
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM jobs WHERE topic = ?", (topic,))
+            return cursor.rowcount
+
+    def depth(self, topics: typing.Sequence[str] = None) -> int:
+        """Number of pending jobs
+
+        Args:
+            topics (typing.Sequence[str], optional): Job topics, all if not provided
+
+        Returns:
+            int: number of pending jobs
+        """
+        query = "SELECT COUNT(*) FROM jobs WHERE state = ?"
+        params = [JOB_STATE_PENDING]
+        if topics:
+            query += f" AND topic IN ({','.join('?' for _ in topics)})"
+            params.extend(topics)
+
+        with self._lock:
+            return self._conn.execute(query, params).fetchone()[0]
+
+    def publish(self, topic: str, origin: int, payload: dict) -> int:
+        """Broadcast an event to all the workers
+
+        Args:
+            topic (str): Event topic
+            origin (int): Identifier of the publishing worker
+            payload (dict): Event payload
+
+        Returns:
+            int: event identifier
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO events (topic, origin, payload, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (topic, origin, json.dumps(payload), time.time()),
+            )
+            return cursor.lastrowid
+
+    def last_event_id(self) -> int:
+        """Identifier of the latest event
+
+        Returns:
+            int: event identifier, 0 if there are no events
+        """
+        with self._lock:
+            return self._conn.execute("SELECT MAX(id) FROM events").fetchone()[0] or 0
+
+    def events_since(self, event_id: int, limit: int = 100) -> typing.List[SharedEvent]:
+        """Events published after the event
+
+        Args:
+            event_id (int): Event identifier
+            limit (int, optional): Maximum number of events. Defaults to 100.
+
+        Returns:
+            typing.List[SharedEvent]: events
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, topic, origin, payload FROM events WHERE id > ? "
+                "ORDER BY id LIMIT ?",
+                (event_id, limit),
+            ).fetchall()
+
+        return [SharedEvent(row[0], row[1], row[2], json.loads(row[3])) for row in rows]
+
+    def prune_events(self, max_age: float) -> None:
+        """Remove events delivered to all the workers
+
+        Args:
+            max_age (float): Age in seconds
+        """
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM events WHERE created_at < ?", (time.time() - max_age,)
+            )
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
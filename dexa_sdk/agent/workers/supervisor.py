@@ -0,0 +1,166 @@
+"""Supervisor running the agent in multiple worker processes."""
+
+import logging
+import multiprocessing
+import signal
+import time
+import typing
+from multiprocessing.connection import wait
+
+from dexa_sdk.agent.workers.shared_queue import SharedQueue
+
+LOGGER = logging.getLogger(__name__)
+
+# Workers running shorter than this are considered crash looping
+MIN_HEALTHY_UPTIME = 10.0
+
+
+class Supervisor:
+    """Forks the worker processes and restarts them if they crash.
+
+    Restarts are delayed with exponential backoff while a worker crashes
+    shortly after starting. Jobs claimed by a crashed worker are returned
+    to the shared queue.
+    """
+
+    def __init__(
+        self,
+        target: typing.Callable[[int], None],
+        workers: int,
+        queue: SharedQueue,
+        restart_delay: float = 1.0,
+        max_restart_delay: float = 30.0,
+        stop_timeout: float = 10.0,
+    ) -> None:
+        """Initialise supervisor
+
+        Args:
+            target (typing.Callable[[int], None]): Runs the worker, called with
+                the worker identifier in the worker process
+            workers (int): Number of workers
+            queue (SharedQueue): Shared queue of the workers
+            restart_delay (float, optional): Initial restart delay in seconds.
+            max_restart_delay (float, optional): Maximum restart delay in seconds.
+            stop_timeout (float, optional): Seconds to wait for workers to stop.
+        """
+        self._target = target
+        self._workers = workers
+        self._queue = queue
+        self._restart_delay = restart_delay
+        self._max_restart_delay = max_restart_delay
+        self._stop_timeout = stop_timeout
+
+        # Fork, so that the parsed settings are inherited by the workers
+        self._mp_context = multiprocessing.get_context("fork")
+
+        # Worker processes by identifier
+        self._processes: typing.Dict[int, multiprocessing.Process] = {}
+
+        # Start times, restart delays and scheduled restarts by identifier
+        self._started_at: typing.Dict[int, float] = {}
+        self._delays: typing.Dict[int, float] = {}
+        self._restarts: typing.Dict[int, float] = {}
+
+        # Restarts of crashed workers
+        self.restart_count = 0
+
+        self._stopping = False
+
+    def start_worker(self, worker_id: int) -> None:
+        """Start the worker process
+
+        Args:
+            worker_id (int): Worker identifier
+        """
+        process = self._mp_context.Process(
+            target=self._target, args=(worker_id,), name=f"dexa-worker-{worker_id}"
+        )
+        process.start()
+
+        self._processes[worker_id] = process
+        self._started_at[worker_id] = time.monotonic()
+
+        LOGGER.info("Started worker %d (pid %d)", worker_id, process.pid)
+
+    def handle_exit(self, worker_id: int) -> None:
+        """Schedule restart of the exited worker
+
+        Args:
+            worker_id (int): Worker identifier
+        """
+        process = self._processes.pop(worker_id)
+        uptime = time.monotonic() - self._started_at[worker_id]
+
+        LOGGER.error(
+            "Worker %d (pid %d) exited with code %s after %.1f s",
+            worker_id,
+            process.pid,
+            process.exitcode,
+            uptime,
+        )
+
+        # Jobs claimed by the worker are processed by the restarted worker
+        released = self._queue.release_worker(worker_id)
+        if released:
+            LOGGER.info("Released %d jobs claimed by worker %d", released, worker_id)
+
+        # Back off if the worker is crash looping
+        if uptime < MIN_HEALTHY_UPTIME:
+            delay = min(
+                self._delays.get(worker_id, self._restart_delay / 2) * 2,
+                self._max_restart_delay,
+            )
+        else:
+            delay = self._restart_delay
+        self._delays[worker_id] = delay
+        self._restarts[worker_id] = time.monotonic() + delay
+
+    def stop(self, *args) -> None:
+        """Stop supervising, workers are terminated by the run loop"""
+        self._stopping = True
+
+    def run(self) -> None:
+        """Run the workers till stopped by SIGTERM or SIGINT"""
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+        for worker_id in range(self._workers):
+            self.start_worker(worker_id)
+
+        while not self._stopping:
+            sentinels = {
+                process.sentinel: worker_id
+                for worker_id, process in self._processes.items()
+            }
+            if not sentinels:
+                time.sleep(0.5)
+            for sentinel in wait(list(sentinels.keys()), timeout=0.5):
+                self._processes[sentinels[sentinel]].join()
+                self.handle_exit(sentinels[sentinel])
+
+            # Restart the workers due
+            now = time.monotonic()
+            for worker_id, restart_at in list(self._restarts.items()):
+                if restart_at <= now and not self._stopping:
+                    del self._restarts[worker_id]
+                    self.restart_count += 1
+                    self.start_worker(worker_id)
+
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        """Terminate the workers, killing them if they don't stop in time"""
+        LOGGER.info("Stopping %d workers", len(self._processes))
+
+        for process in self._processes.values():
+            if process.is_alive():
+                process.terminate()
+
+        deadline = time.monotonic() + self._stop_timeout
+        for process in self._processes.values():
+            process.join(max(deadline - time.monotonic(), 0))
+            if process.is_alive():
+                process.kill()
+                process.join()
+
+        self._processes = {}
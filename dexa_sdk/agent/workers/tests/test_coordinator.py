@@ -0,0 +1,55 @@
+import asyncio
+import os
+import tempfile
+
+from asynctest import TestCase as AsyncTestCase
+from dexa_sdk.agent.workers.coordinator import WorkerCoordinator
+
+
+class TestWorkerCoordinator(AsyncTestCase):
+    """Test worker coordinator"""
+
+    async def setUp(self) -> None:
+        path = os.path.join(tempfile.mkdtemp(), "shared_queue.db")
+        self.leader = WorkerCoordinator(path, 0)
+        self.worker = WorkerCoordinator(path, 1)
+
+    async def tearDown(self) -> None:
+        await self.leader.stop()
+        await self.worker.stop()
+
+    async def test_jobs_and_events(self):
+        """Test job is processed by the worker handling it, events by others"""
+
+        processed = []
+        received = {0: [], 1: []}
+
+        async def handler(payload):
+            processed.append(payload)
+
+        self.leader.register_job_handler("anchor", handler)
+
+        def subscriber(worker_id):
+            async def callback(payload):
+                received[worker_id].append(payload)
+
+            return callback
+
+        for coordinator in (self.leader, self.worker):
+            coordinator.subscribe("notification", subscriber(coordinator.worker_id))
+            await coordinator.start()
+
+        await self.worker.submit("anchor", {"outbox_id": "1"})
+        await self.worker.publish("notification", {"topic": "ping"})
+
+        await self.worker.poll()
+        await self.leader.poll()
+        await asyncio.sleep(0.1)
+
+        assert processed == [{"outbox_id": "1"}]
+        assert received == {0: [{"topic": "ping"}], 1: []}
+
+        metrics = await self.leader.metrics()
+        assert metrics["leader"]
+        assert metrics["jobs_processed"] == 1
+        assert metrics["queue_depth"] == 0
@@ -0,0 +1,53 @@
+import os
+import tempfile
+
+from asynctest import TestCase as AsyncTestCase
+from dexa_sdk.agent.workers.shared_queue import SharedQueue
+
+
+class TestSharedQueue(AsyncTestCase):
+    """Test shared queue"""
+
+    async def setUp(self) -> None:
+        self.path = os.path.join(tempfile.mkdtemp(), "shared_queue.db")
+        self.queue = SharedQueue(self.path)
+
+        # Another process would open its own connection
+        self.other = SharedQueue(self.path)
+
+    async def tearDown(self) -> None:
+        self.queue.close()
+        self.other.close()
+
+    async def test_job_is_claimed_once(self):
+        """Test job is claimed by one worker only"""
+
+        job_id = self.queue.put("anchor", {"outbox_id": "1"})
+
+        jobs = self.other.claim(["anchor"], worker_id=1)
+        assert [job.job_id for job in jobs] == [job_id]
+        assert jobs[0].payload == {"outbox_id": "1"}
+
+        assert self.queue.claim(["anchor"], worker_id=0) == []
+        assert self.queue.depth() == 0
+
+        # Jobs of crashed worker are returned to the queue
+        assert self.queue.release_worker(1) == 1
+        assert self.queue.depth(["anchor"]) == 1
+
+        jobs = self.queue.claim(["anchor"], worker_id=0)
+        self.queue.ack(jobs[0].job_id)
+        assert self.queue.release_worker(0) == 0
+
+    async def test_events(self):
+        """Test events are read by all the workers"""
+
+        last_event_id = self.other.last_event_id()
+
+        self.queue.publish("notification", 0, {"topic": "ping"})
+
+        for queue in (self.queue, self.other):
+            events = queue.events_since(last_event_id)
+            assert len(events) == 1
+            assert events[0].origin == 0
+            assert events[0].payload == {"topic": "ping"}
@@ -0,0 +1,39 @@
+import os
+import tempfile
+
+from asynctest import TestCase as AsyncTestCase
+from dexa_sdk.agent.workers.shared_queue import SharedQueue
+from dexa_sdk.agent.workers.supervisor import Supervisor
+
+
+def crashing_worker(worker_id: int):
+    os._exit(1)
+
+
+class TestSupervisor(AsyncTestCase):
+    """Test supervisor"""
+
+    async def test_restart_crashed_worker(self):
+        """Test crashed worker is restarted and its jobs are released"""
+
+        queue = SharedQueue(os.path.join(tempfile.mkdtemp(), "shared_queue.db"))
+        supervisor = Supervisor(crashing_worker, 1, queue, restart_delay=0.1)
+
+        queue.put("anchor", {"outbox_id": "1"})
+        queue.claim(["anchor"], worker_id=0)
+
+        supervisor.start_worker(0)
+        supervisor._processes[0].join()
+        supervisor.handle_exit(0)
+
+        assert queue.depth(["anchor"]) == 1
+        assert 0 in supervisor._restarts
+
+        # Crash looping workers are restarted with backoff
+        supervisor.start_worker(0)
+        supervisor._processes[0].join()
+        supervisor.handle_exit(0)
+        assert supervisor._delays[0] == 0.2
+
+        supervisor.shutdown()
+        queue.close()
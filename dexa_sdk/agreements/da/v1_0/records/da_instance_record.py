@@ -402,6 +402,25 @@ class DataAgreementInstanceRecord(BaseRecord):
 
         return instances[0]
 
+    @staticmethod
+    async def fetch_by_mydata_did(
+        context: InjectionContext, mydata_did: str
+    ) -> typing.Optional["DataAgreementInstanceRecord"]:
+        """Fetch by did:mydata identifier
+
+        Args:
+            context (InjectionContext): Injection context to be used.
+            mydata_did (str): did:mydata identifier anchored to the blockchain
+
+        Returns:
+            DataAgreementInstanceRecord: Data agreement instance record if found.
+        """
+
+        tag_filter = {"mydata_did": mydata_did}
+        instances = await DataAgreementInstanceRecord.query(context, tag_filter)
+
+        return instances[0] if instances else None
+
     async def get_connection_record(
         self, context: InjectionContext
     ) -> ConnectionRecord:
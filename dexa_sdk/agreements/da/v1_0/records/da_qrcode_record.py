@@ -1,11 +1,12 @@
 from aries_cloudagent.config.injection_context import InjectionContext
 from aries_cloudagent.connections.models.connection_record import ConnectionRecord
 from aries_cloudagent.messaging.models.base_record import BaseRecord, BaseRecordSchema
+from dexa_sdk.storage.record_versions import VersionedRecordMixin
 from marshmallow import fields
 from mydata_did.v1_0.utils.util import bool_to_str
 
 
-class DataAgreementQRCodeRecord(BaseRecord):
+class DataAgreementQRCodeRecord(VersionedRecordMixin, BaseRecord):
     """Data agreement QR code record"""
 
     class Meta:
@@ -5,13 +5,14 @@ from aries_cloudagent.messaging.models.base_record import BaseRecord, BaseRecord
 from aries_cloudagent.messaging.valid import UUIDFour
 from dexa_sdk.agreements.da.v1_0.models.da_models import DataAgreementModel
 from dexa_sdk.agreements.da.v1_0.records.personal_data_record import PersonalDataRecord
+from dexa_sdk.storage.record_versions import VersionedRecordMixin
 from dexa_sdk.utils import bump_major_for_semver_string
 from loguru import logger
 from marshmallow import EXCLUDE, fields, validate
 from mydata_did.v1_0.utils.util import bool_to_str, str_to_bool
 
 
-class DataAgreementTemplateRecord(BaseRecord):
+class DataAgreementTemplateRecord(VersionedRecordMixin, BaseRecord):
     """Data agreement template record to be persisted in the storage"""
 
     class Meta:
@@ -389,6 +389,25 @@ class DataDisclosureAgreementInstanceRecord(BaseRecord):
 
         return instance_record
 
+    @classmethod
+    async def fetch_by_mydata_did(
+        cls, context: InjectionContext, mydata_did: str
+    ) -> typing.Optional["DataDisclosureAgreementInstanceRecord"]:
+        """Fetch by did:mydata identifier.
+
+        Args:
+            context (InjectionContext): Injection context to be used.
+            mydata_did (str): did:mydata identifier anchored to the blockchain
+
+        Returns:
+            DataDisclosureAgreementInstanceRecord: DDA instance record if found.
+        """
+
+        tag_filter = {"mydata_did": mydata_did}
+        instances = await cls.query(context, tag_filter)
+
+        return instances[0] if instances else None
+
     async def fetch_controller_details(
         self, context: InjectionContext
     ) -> ConnectionControllerDetailsRecord:
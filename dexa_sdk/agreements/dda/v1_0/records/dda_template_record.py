@@ -17,12 +17,13 @@ from dexa_sdk.agreements.dda.v1_0.models.dda_models import (
 from dexa_sdk.data_controller.records.controller_details_record import (
     ControllerDetailsRecord,
 )
+from dexa_sdk.storage.record_versions import VersionedRecordMixin
 from dexa_sdk.utils import bump_major_for_semver_string
 from marshmallow import EXCLUDE, fields, validate
 from mydata_did.v1_0.utils.util import bool_to_str, str_to_bool
 
 
-class DataDisclosureAgreementTemplateRecord(BaseRecord):
+class DataDisclosureAgreementTemplateRecord(VersionedRecordMixin, BaseRecord):
     """Data disclosure agreement template record to be persisted in the storage"""
 
     class Meta:
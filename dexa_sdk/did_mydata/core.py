@@ -3,11 +3,14 @@ import binascii
 import typing
 
 from aries_cloudagent.messaging.models.base import BaseModel
+from dexa_sdk.did_mydata.exceptions import InvalidDidMyDataException
+from dexa_sdk.jsonld.canonicalisers import BaseCanonicaliser, get_canonicaliser
 from dexa_sdk.jsonld.core import jsonld_context_fingerprint
 from dexa_sdk.utils import jcs_rfc8785
-from merklelib import MerkleTree
-from multibase import encode
-from pyld import jsonld
+
+# Merkle and multibase backends are imported on first use
+if typing.TYPE_CHECKING:
+    from merklelib import MerkleTree
 
 
 class DIDMyDataBuilder:
@@ -18,14 +21,18 @@ class DIDMyDataBuilder:
         *,
         artefact: BaseModel,
         did: str = None,
+        canonicaliser: BaseCanonicaliser = None,
     ) -> None:
         """
 
         Args:
             artefact (BaseModel): MyData artefact for .e.g. DA, DDA
             did (str, optional): did:mydata identifier. Defaults to None.
+            canonicaliser (BaseCanonicaliser, optional): JSON-LD canonicaliser.
+                Defaults to the configured canonicaliser.
         """
         self._artefact = artefact
+        self._canonicaliser = canonicaliser or get_canonicaliser()
         self._mydata_did = did
         self._merkle_tree = None
 
@@ -37,22 +44,13 @@ class DIDMyDataBuilder:
             typing.List[str]: n-quads statements
         """
 
-        # Config for JSONLD normalisation
-        config = {"algorithm": "URDNA2015", "format": "application/n-quads"}
-
         # Obtains the dictionary representation of the document
         doc = self._artefact.serialize()
 
         # Convert the doc to nquads statements
-        normalized = jsonld.normalize(doc, config)
-
-        # Split normalised string into multiple statements
-        normalized = normalized.split("\n")
-
-        # Return the statements
-        return normalized[:-1]
+        return self._canonicaliser.nquads(doc)
 
-    def build_merkle_tree(self) -> MerkleTree:
+    def build_merkle_tree(self) -> "MerkleTree":
         """Build merkle tree from nquads statements about the artefact
 
         Returns:
@@ -62,6 +60,8 @@ class DIDMyDataBuilder:
         data = self.nquads()
 
         # Build merkle tree
+        from merklelib import MerkleTree
+
         mt = MerkleTree(data)
 
         # Store the merkle tree in the instance
@@ -86,10 +86,17 @@ class DIDMyDataBuilder:
         """
         return base64.urlsafe_b64encode(self.jcs()).decode()
 
-    def generate_did(self, context_type="DataAgreement") -> str:
+    def generate_did(
+        self, context_type="DataAgreement", agreement_type: str = None
+    ) -> str:
         """
         Generate the did:mydata identifier for the agreement
 
+        Args:
+            context_type (str, optional): JSONLD context type of the agreement.
+            agreement_type (str, optional): SHA2-256 fingerprint of the JSONLD
+                context, fetched from remote if not provided.
+
         Returns:
             did (str): did:mydata identifier
         """
@@ -101,7 +108,7 @@ class DIDMyDataBuilder:
         mr = mt.merkle_root
 
         # Obtain SHA2-256 fingerprint for agreement JSONLD context
-        at = jsonld_context_fingerprint(context_type=context_type)
+        at = agreement_type or jsonld_context_fingerprint(context_type=context_type)
 
         # Create did:mydata v2 identifier
         mydata_did = DidMyData(agreement_type=at, agreement_merkle_root=mr)
@@ -135,7 +142,7 @@ class DIDMyDataBuilder:
         self._mydata_did = did
 
     @property
-    def merkle_tree(self) -> MerkleTree:
+    def merkle_tree(self) -> "MerkleTree":
         """Returns merkle tree
 
         Returns:
@@ -167,6 +174,16 @@ class DIDMyDataBuilder:
 
 
 class DidMyData:
+
+    # did:mydata method prefix
+    DID_PREFIX = "did:mydata:"
+
+    # Length (in bytes) of the agreement type fingerprint prefix
+    AGREEMENT_TYPE_PREFIX_LENGTH = 16
+
+    # Length (in bytes) of the SHA2-256 merkle root
+    AGREEMENT_MERKLE_ROOT_LENGTH = 32
+
     def __init__(self, *, agreement_type: str, agreement_merkle_root: str) -> None:
         """
         Initialise the DidMydata class
@@ -194,12 +211,90 @@ class DidMyData:
         # Agreement merkle root sha256 fingerprint to bytes
         agreement_merkle_root_bytes = binascii.unhexlify(self._agreement_merkle_root)
 
-        # 16 + 38 bytes = 48 byte method specific identifier
-        identifier = agreement_type_bytes[:16] + agreement_merkle_root_bytes
+        # 16 + 32 bytes = 48 byte method specific identifier
+        prefix_length = self.AGREEMENT_TYPE_PREFIX_LENGTH
+        identifier = agreement_type_bytes[:prefix_length] + agreement_merkle_root_bytes
 
         # Multibase encode
+        from multibase import encode
+
         identifier = encode("base58btc", identifier).decode()
-        return f"did:mydata:{identifier}"
+        return f"{self.DID_PREFIX}{identifier}"
+
+    @classmethod
+    def parse(cls, did: str) -> "DidMyData":
+        """Decode a did:mydata v2 identifier.
+
+        Only the first 16 bytes of the agreement type fingerprint are encoded
+        in the identifier, therefore the agreement type of the parsed instance
+        is the fingerprint prefix.
+
+        Args:
+            did (str): did:mydata identifier
+
+        Raises:
+            InvalidDidMyDataException: If the identifier is malformed.
+
+        Returns:
+            DidMyData: did:mydata instance
+        """
+        if not did or not did.startswith(cls.DID_PREFIX):
+            raise InvalidDidMyDataException(f"Not a did:mydata identifier: {did}")
+
+        # Method specific identifier
+        identifier = did.replace(cls.DID_PREFIX, "", 1)
+
+        # Multibase decode
+        from multibase import decode
+
+        try:
+            identifier_bytes = decode(identifier)
+        except ValueError as err:
+            raise InvalidDidMyDataException(
+                f"Failed to decode did:mydata identifier {did}; Reason: {err}"
+            )
+
+        prefix_length = cls.AGREEMENT_TYPE_PREFIX_LENGTH
+        if len(identifier_bytes) != prefix_length + cls.AGREEMENT_MERKLE_ROOT_LENGTH:
+            raise InvalidDidMyDataException(
+                f"Invalid method specific identifier length for {did}"
+            )
+
+        # Split into agreement type prefix and merkle root
+        agreement_type_bytes = identifier_bytes[:prefix_length]
+        agreement_merkle_root_bytes = identifier_bytes[prefix_length:]
+
+        return cls(
+            agreement_type=binascii.hexlify(agreement_type_bytes).decode(),
+            agreement_merkle_root=binascii.hexlify(
+                agreement_merkle_root_bytes
+            ).decode(),
+        )
+
+    def matches_agreement_type(self, agreement_type: str) -> bool:
+        """Check if the identifier was generated for an agreement type.
+
+        Args:
+            agreement_type (str): SHA2-256 fingerprint of the agreement JSONLD context
+
+        Returns:
+            bool: True if the fingerprint prefix matches
+        """
+        prefix_length = self.AGREEMENT_TYPE_PREFIX_LENGTH * 2
+        return (
+            agreement_type[:prefix_length].lower()
+            == self._agreement_type[:prefix_length].lower()
+        )
+
+    @property
+    def agreement_type(self) -> str:
+        """Returns SHA2-256 fingerprint (or it's prefix) of the agreement JSONLD context"""
+        return self._agreement_type
+
+    @property
+    def agreement_merkle_root(self) -> str:
+        """Returns SHA2-256 merkle root for the agreement document"""
+        return self._agreement_merkle_root
 
     @property
     def did(self) -> str:
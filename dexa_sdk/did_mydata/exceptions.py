@@ -0,0 +1,4 @@
+class InvalidDidMyDataException(Exception):
+    """Raised when did:mydata identifier cannot be decoded"""
+
+    pass
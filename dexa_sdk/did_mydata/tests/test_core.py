@@ -0,0 +1,43 @@
+import hashlib
+
+from asynctest import TestCase as AsyncTestCase
+from dexa_sdk.did_mydata.core import DidMyData
+from dexa_sdk.did_mydata.exceptions import InvalidDidMyDataException
+
+
+class TestDidMyData(AsyncTestCase):
+    """Test did:mydata identifier"""
+
+    def setUp(self) -> None:
+
+        self.agreement_type = hashlib.sha256(b"DataAgreement").hexdigest()
+        self.agreement_merkle_root = hashlib.sha256(b"merkle root").hexdigest()
+
+    async def test_parse_did_mydata(self):
+        """Test parse did:mydata identifier"""
+
+        mydata_did = DidMyData(
+            agreement_type=self.agreement_type,
+            agreement_merkle_root=self.agreement_merkle_root,
+        )
+
+        parsed = DidMyData.parse(mydata_did.did)
+
+        # Merkle root is recovered as is
+        assert parsed.agreement_merkle_root == self.agreement_merkle_root
+
+        # Only the fingerprint prefix of agreement type is recovered
+        assert parsed.agreement_type == self.agreement_type[:32]
+        assert parsed.matches_agreement_type(self.agreement_type)
+
+        # Parsed identifier generates the same did:mydata
+        assert parsed.did == mydata_did.did
+
+    async def test_parse_invalid_did_mydata(self):
+        """Test parse invalid did:mydata identifier"""
+
+        with self.assertRaises(InvalidDidMyDataException):
+            DidMyData.parse("did:sov:WgWxqztrNooG92RXvxSTWv")
+
+        with self.assertRaises(InvalidDidMyDataException):
+            DidMyData.parse("did:mydata:z3yQ")
@@ -0,0 +1,238 @@
+import time
+import typing
+from abc import ABC, abstractmethod
+from collections import namedtuple
+
+from dexa_sdk.jsonld.exceptions import CanonicaliserNotFoundException
+from dexa_sdk.jsonld.loader import load_jsonld
+
+# Config for JSONLD normalisation
+URDNA2015_CONFIG = {"algorithm": "URDNA2015", "format": "application/n-quads"}
+
+# Name of the reference canonicaliser
+PYLD_CANONICALISER = "pyld"
+
+
+class BaseCanonicaliser(ABC):
+    """Base class for JSON-LD canonicalisation (URDNA2015) backends"""
+
+    # Name under which the canonicaliser is registered
+    name: str = None
+
+    @abstractmethod
+    def normalize(self, doc: dict) -> str:
+        """Normalise JSON-LD document to canonical n-quads using URDNA2015.
+
+        Args:
+            doc (dict): JSON-LD document
+
+        Returns:
+            str: canonical n-quads document
+        """
+
+    def nquads(self, doc: dict) -> typing.List[str]:
+        """Normalise JSON-LD document to n-quads statements.
+
+        Args:
+            doc (dict): JSON-LD document
+
+        Returns:
+            typing.List[str]: n-quads statements
+        """
+
+        # Split normalised string into multiple statements
+        normalized = self.normalize(doc).split("\n")
+
+        # Return the statements
+        return normalized[:-1]
+
+
+class PyLDCanonicaliser(BaseCanonicaliser):
+    """Canonicaliser backed by PyLD. Used as the reference implementation."""
+
+    name = PYLD_CANONICALISER
+
+    def normalize(self, doc: dict) -> str:
+        """Normalise JSON-LD document to canonical n-quads using URDNA2015.
+
+        Args:
+            doc (dict): JSON-LD document
+
+        Returns:
+            str: canonical n-quads document
+        """
+        return load_jsonld().normalize(doc, URDNA2015_CONFIG)
+
+
+# Registered canonicaliser classes
+CANONICALISERS: typing.Dict[str, typing.Type[BaseCanonicaliser]] = {
+    PyLDCanonicaliser.name: PyLDCanonicaliser,
+}
+
+# Instantiated canonicalisers
+_instances: typing.Dict[str, BaseCanonicaliser] = {}
+
+# Canonicaliser used when none is specified
+_default_canonicaliser = PYLD_CANONICALISER
+
+
+def register_canonicaliser(
+    name: str, canonicaliser_class: typing.Type[BaseCanonicaliser]
+) -> None:
+    """Register a canonicaliser backend (for e.g. native URDNA2015 implementation)
+
+    Args:
+        name (str): Name of the canonicaliser
+        canonicaliser_class (typing.Type[BaseCanonicaliser]): Canonicaliser class
+    """
+    CANONICALISERS[name] = canonicaliser_class
+    _instances.pop(name, None)
+
+
+def get_canonicaliser(name: str = None) -> BaseCanonicaliser:
+    """Get canonicaliser by name
+
+    Args:
+        name (str, optional): Name of the canonicaliser. Defaults to None.
+
+    Raises:
+        CanonicaliserNotFoundException: If canonicaliser is not registered.
+
+    Returns:
+        BaseCanonicaliser: canonicaliser
+    """
+    name = name or _default_canonicaliser
+
+    if name not in CANONICALISERS:
+        raise CanonicaliserNotFoundException(
+            f"Canonicaliser '{name}' is not registered"
+        )
+
+    if name not in _instances:
+        _instances[name] = CANONICALISERS[name]()
+
+    return _instances[name]
+
+
+def set_default_canonicaliser(name: str) -> None:
+    """Set the canonicaliser used when none is specified
+
+    Args:
+        name (str): Name of the canonicaliser
+    """
+    global _default_canonicaliser
+
+    # Ensure the canonicaliser is available
+    get_canonicaliser(name)
+
+    _default_canonicaliser = name
+
+
+CanonicaliserBenchmark = namedtuple(
+    "CanonicaliserBenchmark", "name conformant mean_time failures"
+)
+
+
+def check_conformance(
+    canonicaliser: BaseCanonicaliser,
+    documents: typing.List[dict],
+    reference: BaseCanonicaliser = None,
+) -> typing.List[int]:
+    """Check canonicaliser output is byte-identical to the reference output
+
+    Args:
+        canonicaliser (BaseCanonicaliser): Canonicaliser to be checked
+        documents (typing.List[dict]): JSON-LD documents
+        reference (BaseCanonicaliser, optional): Reference canonicaliser.
+            Defaults to PyLD canonicaliser.
+
+    Returns:
+        typing.List[int]: Indices of the documents which didn't match
+    """
+    reference = reference or get_canonicaliser(PYLD_CANONICALISER)
+
+    failures = []
+    for index, doc in enumerate(documents):
+        try:
+            conformant = canonicaliser.normalize(doc) == reference.normalize(doc)
+        except Exception:
+            conformant = False
+
+        if not conformant:
+            failures.append(index)
+
+    return failures
+
+
+def benchmark_canonicalisers(
+    documents: typing.List[dict],
+    names: typing.List[str] = None,
+    rounds: int = 10,
+) -> typing.List[CanonicaliserBenchmark]:
+    """Benchmark canonicalisers against the documents
+
+    Args:
+        documents (typing.List[dict]): JSON-LD documents
+        names (typing.List[str], optional): Canonicalisers to be benchmarked.
+            Defaults to all the registered canonicalisers.
+        rounds (int, optional): Number of rounds per document. Defaults to 10.
+
+    Returns:
+        typing.List[CanonicaliserBenchmark]: Results sorted by mean time
+    """
+    names = names or list(CANONICALISERS.keys())
+
+    results = []
+    for name in names:
+        canonicaliser = get_canonicaliser(name)
+
+        # Conformance check also warms up the canonicaliser
+        failures = check_conformance(canonicaliser, documents)
+
+        mean_time = None
+        if not failures:
+            start = time.perf_counter()
+            for _ in range(rounds):
+                for doc in documents:
+                    canonicaliser.normalize(doc)
+            mean_time = (time.perf_counter() - start) / (rounds * len(documents))
+
+        results.append(
+            CanonicaliserBenchmark(
+                name=name,
+                conformant=not failures,
+                mean_time=mean_time,
+                failures=failures,
+            )
+        )
+
+    # Conformant canonicalisers first, fastest first
+    results.sort(key=lambda r: (not r.conformant, r.mean_time or 0))
+
+    return results
+
+
+def select_canonicaliser(
+    documents: typing.List[dict],
+    names: typing.List[str] = None,
+    rounds: int = 10,
+) -> str:
+    """Select the fastest canonicaliser which passes conformance checks
+
+    Args:
+        documents (typing.List[dict]): JSON-LD documents
+        names (typing.List[str], optional): Candidate canonicalisers.
+            Defaults to all the registered canonicalisers.
+        rounds (int, optional): Number of rounds per document. Defaults to 10.
+
+    Returns:
+        str: Name of the canonicaliser
+    """
+    results = benchmark_canonicalisers(documents, names=names, rounds=rounds)
+
+    for result in results:
+        if result.conformant:
+            return result.name
+
+    # Fallback to the reference canonicaliser
+    return PYLD_CANONICALISER
@@ -3,19 +3,15 @@ import hashlib
 import uuid
 
 import requests
-from aries_cloudagent.messaging.jsonld.credential import (
-    sign_credential,
-    verify_credential,
-)
 from aries_cloudagent.wallet.base import BaseWallet
 from dexa_sdk.jsonld.exceptions import ProofNotAvailableException
+from dexa_sdk.jsonld.loader import load_jsonld
 from dexa_sdk.utils import (
     jcs_rfc8785,
     replace_jws,
     replace_proof_chain,
     replace_proof_value,
 )
-from merklelib import utils
 
 DEXA_JSONLD_CONTEXT_URL = (
     "https://raw.githubusercontent.com"
@@ -25,6 +21,19 @@ DEXA_JSONLD_CONTEXT_URL = (
 )
 
 
+def load_credential_suite():
+    """Import the aries JSON-LD signature suite on first use, it loads PyLD
+
+    Returns:
+        module: aries_cloudagent.messaging.jsonld.credential
+    """
+    load_jsonld()
+
+    from aries_cloudagent.messaging.jsonld import credential
+
+    return credential
+
+
 def fetch_jsonld_context_from_remote(
     context_type: str = None, remote_context_url: str = DEXA_JSONLD_CONTEXT_URL
 ) -> dict:
@@ -63,7 +72,9 @@ def jsonld_context_fingerprint(
     jsonld_context = fetch_jsonld_context_from_remote(context_type, remote_context_url)
     # Canonicalise the context document
     jcs = jcs_rfc8785(jsonld_context)
-    # Convert bytes to string
+    # Convert bytes to string, merklelib is imported on first use
+    from merklelib import utils
+
     value = utils.to_string(jcs)
     # Return the SHA2-256 hexdigest
     return hashlib.sha256(value).hexdigest()
@@ -102,7 +113,7 @@ async def sign_proof(
     }
 
     # Sign the proof document
-    proof_with_proof = await sign_credential(
+    proof_with_proof = await load_credential_suite().sign_credential(
         proof_with_context, signature_options, verkey, wallet
     )
 
@@ -164,7 +175,9 @@ async def sign_agreement(
             }
 
         # Sign the agreement
-        agreement = await sign_credential(agreement, signature_options, verkey, wallet)
+        agreement = await load_credential_suite().sign_credential(
+            agreement, signature_options, verkey, wallet
+        )
 
         # Replace 'jws' field with 'proofValue' field
         agreement["proof"] = replace_jws(agreement["proof"].copy())
@@ -206,7 +219,9 @@ async def verify_agreement(*, agreement: dict, wallet: BaseWallet) -> bool:
             # Replace 'proofValue' field with 'jws' field
             tbv["proof"] = replace_proof_value(proofs[0].copy())
             valid.append(
-                await verify_credential(tbv, tbv["proof"]["verificationMethod"], wallet)
+                await load_credential_suite().verify_credential(
+                    tbv, tbv["proof"]["verificationMethod"], wallet
+                )
             )
         else:
             # From second proof onwards, tbv would be the proof before it.
@@ -214,7 +229,9 @@ async def verify_agreement(*, agreement: dict, wallet: BaseWallet) -> bool:
             tbv = replace_proof_value(tbv.copy())
             tbv["proof"] = replace_proof_value(proof.copy())
             valid.append(
-                await verify_credential(tbv, tbv["proof"]["verificationMethod"], wallet)
+                await load_credential_suite().verify_credential(
+                    tbv, tbv["proof"]["verificationMethod"], wallet
+                )
             )
 
     return all(valid)
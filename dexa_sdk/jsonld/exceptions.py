@@ -2,3 +2,9 @@ class ProofNotAvailableException(Exception):
     """Raised when proof or proof chain is not present in the agreement"""
 
     pass
+
+
+class CanonicaliserNotFoundException(Exception):
+    """Raised when JSON-LD canonicaliser is not registered"""
+
+    pass
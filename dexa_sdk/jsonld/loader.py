@@ -0,0 +1,35 @@
+"""Lazy loading of PyLD, configured with the caching document loader."""
+
+import functools
+
+# To store jsonld context resolved documents
+cache = {}
+
+
+def caching_document_loader(url, options):
+    """Simple in-memory cache for JSONLD context resolutions"""
+    from pyld import jsonld
+
+    loader = jsonld.requests_document_loader()
+    if url in cache:
+        return cache[url]
+    resp = loader(url)
+    cache[url] = resp
+    return resp
+
+
+@functools.lru_cache(maxsize=None)
+def load_jsonld():
+    """Import PyLD on first use and install the caching document loader
+
+    PyLD takes a significant share of the startup imports, hence
+    it is imported once JSON-LD processing is needed.
+
+    Returns:
+        module: pyld.jsonld
+    """
+    from pyld import jsonld
+
+    jsonld.set_document_loader(caching_document_loader)
+
+    return jsonld
@@ -0,0 +1,190 @@
+from asynctest import TestCase as AsyncTestCase
+from dexa_sdk.jsonld.canonicalisers import (
+    CANONICALISERS,
+    PYLD_CANONICALISER,
+    PyLDCanonicaliser,
+    check_conformance,
+    get_canonicaliser,
+    register_canonicaliser,
+    select_canonicaliser,
+)
+from dexa_sdk.jsonld.exceptions import CanonicaliserNotFoundException
+
+# Inline context, fixtures must not depend on remote context resolution
+CONTEXT = {
+    "@version": 1.1,
+    "@vocab": "https://w3id.org/dexa#",
+    "id": "@id",
+    "type": "@type",
+    "created": {
+        "@id": "http://purl.org/dc/terms/created",
+        "@type": "http://www.w3.org/2001/XMLSchema#dateTime",
+    },
+    "verificationMethod": {
+        "@id": "https://w3id.org/security#verificationMethod",
+        "@type": "@id",
+    },
+}
+
+DA_FIXTURE = {
+    "@context": CONTEXT,
+    "@id": "urn:uuid:ea046a85-d460-44ab-9369-ed71f8abf3ba",
+    "@type": ["DataAgreement"],
+    "version": "1.0.0",
+    "templateId": "a8f3f3b4-7c3a-4b4e-9d8e-4f3c1e7f2a10",
+    "templateVersion": "1.0.0",
+    "language": "en",
+    "dataControllerName": "XYZ Company",
+    "dataControllerUrl": "https://company.xyz",
+    "dataPolicy": {
+        "policyUrl": "https://company.xyz/privacy-policy/",
+        "jurisdiction": "EU",
+        "industrySector": "Healthcare",
+        "dataRetentionPeriod": 365,
+        "geographicRestriction": "EU",
+        "storageLocation": "EU",
+        "thirdPartyDataSharing": False,
+    },
+    "purpose": 'Fetch diabetic records "and" recommend foods\nüñí',
+    "purposeDescription": "To perform ML on diabetic records",
+    "lawfulBasis": "consent",
+    "methodOfUse": "data-source",
+    "personalData": [
+        {
+            "attributeId": "fbcd8bd5",
+            "attributeName": "Name",
+            "attributeSensitive": True,
+            "attributeDescription": "Name of the patient",
+        },
+        {
+            "attributeId": "a2c4f1e9",
+            "attributeName": "Age",
+            "attributeSensitive": False,
+            "attributeDescription": "Age of the patient",
+        },
+    ],
+    "dpia": {
+        "dpiaDate": "2011-10-05T14:48:00.000Z",
+        "dpiaSummaryUrl": "https://org.com/dpia_results.html",
+    },
+    "proof": {
+        "id": "did:key:z6MkiTBz1ymuepAQ4HEHYSF1H8quG5GLVVQR3djdX3mDooWp#1",
+        "type": "Ed25519Signature2018",
+        "created": "2021-05-08T08:41:59+0000",
+        "verificationMethod": "did:key:z6MkiTBz1ymuepAQ4HEHYSF1H8quG5GLVVQR3djdX3mDooWp",
+        "proofPurpose": "authentication",
+        "proofValue": "z5L5n1vVcj8QBxV1Cb9AQJe4qx1j7ZcZ5D2YDP4F8WGnv",
+    },
+}
+
+DDA_FIXTURE = {
+    "@context": CONTEXT,
+    "@id": "urn:uuid:3b1d2ad6-0c1f-4e5a-9f7c-0d9f4ec3c1b2",
+    "@type": ["DataDisclosureAgreement"],
+    "version": "1.0.0",
+    "templateId": "d6c2c7a2-2a1f-4d8e-8d2a-9c4b0f3e1d22",
+    "templateVersion": "1.0.0",
+    "language": "en",
+    "dataController": {
+        "did": "did:key:z6MkiTBz1ymuepAQ4HEHYSF1H8quG5GLVVQR3djdX3mDooWp",
+        "name": "Happy Shopping AB",
+        "legalId": "lei:happy-shopping",
+        "url": "https://happy-shopping.com",
+        "industrySector": "Retail",
+    },
+    "agreementPeriod": 365,
+    "dataSharingRestrictions": {
+        "policyUrl": "https://happy-shopping.com/policy",
+        "jurisdiction": "Sweden",
+        "industrySector": "Retail",
+        "dataRetentionPeriod": 365,
+        "geographicRestriction": "Europe",
+        "storageLocation": "Europe",
+    },
+    "purpose": "Some marketing purpose",
+    "purposeDescription": "Collect customer data for marketing",
+    "lawfulBasis": "consent",
+    "personalData": [
+        {
+            "attributeId": "0ea2c9c3",
+            "attributeName": "Email",
+            "attributeSensitive": "true",
+            "attributeDescription": "Email address of the customer",
+        },
+    ],
+    "codeOfConduct": "https://happy-shopping.com/code-of-conduct",
+    "dataUsingService": {
+        "did": "did:key:z6MkpW2mG5Yw2oCq7N9Q8w3dVhZ7Gfy3yWqf1E8WRfbHz6hC",
+        "name": "Data Using Service",
+        "legalId": "lei:dus",
+        "url": "https://dus.example.com",
+        "industrySector": "Retail",
+        "usagePurposes": "Marketing",
+        "jurisdiction": "Sweden",
+        "withdrawal": "https://dus.example.com/withdrawal",
+        "privacyRights": "https://dus.example.com/privacy",
+        "signatureContact": "Alice",
+    },
+}
+
+
+class UnsortedCanonicaliser(PyLDCanonicaliser):
+    """Canonicaliser emitting the statements out of canonical order"""
+
+    name = "unsorted"
+
+    def normalize(self, doc: dict) -> str:
+        statements = super().normalize(doc).split("\n")[:-1]
+        return "\n".join(reversed(statements)) + "\n"
+
+
+class TestCanonicalisers(AsyncTestCase):
+    """Conformance tests for JSON-LD canonicalisers"""
+
+    def setUp(self) -> None:
+
+        self.documents = [DA_FIXTURE, DDA_FIXTURE]
+
+    async def test_registered_canonicalisers_are_conformant(self):
+        """Test registered canonicalisers emit byte-identical n-quads"""
+
+        reference = get_canonicaliser(PYLD_CANONICALISER)
+
+        for name in CANONICALISERS:
+            canonicaliser = get_canonicaliser(name)
+
+            assert check_conformance(canonicaliser, self.documents) == []
+
+            for doc in self.documents:
+                nquads = canonicaliser.nquads(doc)
+                assert nquads == reference.nquads(doc)
+                assert all(statement.endswith(" .") for statement in nquads)
+
+    async def test_non_conformant_canonicaliser_is_not_selected(self):
+        """Test selection skips canonicalisers failing conformance"""
+
+        register_canonicaliser("unsorted", UnsortedCanonicaliser)
+        try:
+            unsorted = get_canonicaliser("unsorted")
+            assert check_conformance(unsorted, self.documents) == [0, 1]
+
+            name = select_canonicaliser(
+                self.documents, names=["unsorted", PYLD_CANONICALISER], rounds=1
+            )
+            assert name == PYLD_CANONICALISER
+        finally:
+            CANONICALISERS.pop("unsorted")
+
+    async def test_select_canonicaliser(self):
+        """Test fastest conformant canonicaliser is selected"""
+
+        name = select_canonicaliser(self.documents, rounds=1)
+
+        assert name in CANONICALISERS
+        assert check_conformance(get_canonicaliser(name), self.documents) == []
+
+    async def test_get_unknown_canonicaliser(self):
+        """Test unknown canonicaliser"""
+
+        with self.assertRaises(CanonicaliserNotFoundException):
+            get_canonicaliser("unknown")
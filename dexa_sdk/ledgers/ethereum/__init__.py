@@ -1 +1,7 @@
-from .core import *
+def __getattr__(name):
+    """Import the ethereum client on first access, it loads web3"""
+    if name == "EthereumClient":
+        from dexa_sdk.ledgers.ethereum.loader import load_ethereum_client
+
+        return load_ethereum_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,149 @@
+import asyncio
+import time
+import typing
+
+from loguru import logger
+from web3 import Web3
+
+
+class AccountStatePoller:
+    """Refreshes balances and nonces of the accounts in the background.
+
+    State is served from memory for logging and health checks, hence
+    write paths don't query the node for it.
+    """
+
+    def __init__(
+        self,
+        client: Web3,
+        accounts: typing.Dict[str, str],
+        interval: float = 30.0,
+        min_balance: int = 0,
+    ) -> None:
+        """Initialise account state poller
+
+        Args:
+            client (Web3): Ethereum client (async)
+            accounts (typing.Dict[str, str]): Account addresses by name
+            interval (float, optional): Refresh interval in seconds. Defaults to 30.0.
+            min_balance (int, optional): Balance (wei) below which readiness is warned.
+                Defaults to 0.
+        """
+
+        # Ethereum client
+        self._client = client
+
+        # Account addresses by name
+        self._accounts = accounts
+
+        # Refresh interval
+        self._interval = interval
+
+        # Balance threshold
+        self._min_balance = min_balance
+
+        # Account state by name, empty till first refresh
+        self._state: typing.Dict[str, dict] = {}
+
+        # Poller task
+        self._task: typing.Optional[asyncio.Task] = None
+
+    @property
+    def min_balance(self) -> int:
+        """Accessor for balance threshold
+
+        Returns:
+            int: balance in wei
+        """
+        return self._min_balance
+
+    def get(self, name: str) -> typing.Optional[dict]:
+        """Returns last known state of the account
+
+        Args:
+            name (str): Account name
+
+        Returns:
+            typing.Optional[dict]: address, balance, nonce and updated_at
+        """
+        return self._state.get(name)
+
+    def snapshot(self) -> typing.Dict[str, dict]:
+        """Returns last known state of all the accounts
+
+        Returns:
+            typing.Dict[str, dict]: account state by name
+        """
+        return {name: dict(state) for name, state in self._state.items()}
+
+    def low_balance(self) -> typing.List[str]:
+        """Accounts with balance below the threshold
+
+        Returns:
+            typing.List[str]: account names
+        """
+        return [
+            name
+            for name, state in self._state.items()
+            if state["balance"] < self._min_balance
+        ]
+
+    async def refresh(self) -> None:
+        """Fetch balances and nonces of the accounts"""
+        eth = self._client.eth
+
+        names = list(self._accounts.keys())
+        addresses = [self._accounts[name] for name in names]
+
+        results = await asyncio.gather(
+            *[eth.get_balance(address) for address in addresses],
+            *[eth.get_transaction_count(address) for address in addresses],
+        )
+        count = len(addresses)
+        (balances, nonces) = (results[:count], results[count:])
+
+        for name, address, balance, nonce in zip(names, addresses, balances, nonces):
+            self._state[name] = {
+                "address": address,
+                "balance": balance,
+                "nonce": nonce,
+                "updated_at": int(time.time()),
+            }
+
+        for name in self.low_balance():
+            logger.warning(
+                f"Balance of {name} account ({self._accounts[name]}) is below "
+                f"{self._min_balance} wei: {self._state[name]['balance']}"
+            )
+
+    async def _poll(self) -> None:
+        """Refresh the account state on an interval"""
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                await self.refresh()
+            except Exception as err:
+                # Last known state is served till next refresh
+                logger.info(f"Failed to refresh account state: {err}")
+
+    async def start(self) -> None:
+        """Fetch the account state and start refreshing it in the background"""
+        if self._task and not self._task.done():
+            return
+
+        try:
+            await self.refresh()
+        except Exception as err:
+            logger.info(f"Failed to refresh account state: {err}")
+
+        self._task = asyncio.get_event_loop().create_task(self._poll())
+
+    async def stop(self) -> None:
+        """Stop refreshing the account state"""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
@@ -0,0 +1,57 @@
+// SPDX-License-Identifier: Apache-2.0
+pragma solidity ^0.8.0;
+
+// Stand-in for the DEXA smart contract, exposing the functions used by
+// EthereumClient. Used for benchmarking anchoring against a local chain.
+contract DexaStandIn {
+    address public owner;
+
+    mapping(address => bool) public organisations;
+
+    mapping(string => string) private accessTokens;
+
+    event DADID(string did);
+    event DDADID(string did);
+    event AccessToken(string nonce);
+
+    constructor() {
+        owner = msg.sender;
+    }
+
+    modifier onlyOrganisation() {
+        require(organisations[msg.sender], "Organisation is not whitelisted");
+        _;
+    }
+
+    function addOrganisation(address organisation) public {
+        require(msg.sender == owner, "Only owner can add organisations");
+        organisations[organisation] = true;
+    }
+
+    function emitDADID(string memory did) public onlyOrganisation {
+        emit DADID(did);
+    }
+
+    function emitDDADID(string memory did) public onlyOrganisation {
+        emit DDADID(did);
+    }
+
+    function addAccessToken(string memory nonce, string memory accessToken)
+        public
+        onlyOrganisation
+    {
+        require(bytes(accessTokens[nonce]).length == 0, "Nonce is already used");
+        accessTokens[nonce] = accessToken;
+        emit AccessToken(nonce);
+    }
+
+    function releaseAccessToken(string memory nonce, address dataSubject)
+        public
+        view
+        returns (string memory)
+    {
+        require(dataSubject != address(0), "Invalid data subject");
+        require(bytes(accessTokens[nonce]).length > 0, "Access token not found");
+        return accessTokens[nonce];
+    }
+}
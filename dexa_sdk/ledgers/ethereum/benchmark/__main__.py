@@ -0,0 +1,48 @@
+"""Anchoring throughput benchmark against a local chain.
+
+Requires eth-tester with py-evm backend (`pip install "eth-tester[py-evm]"`)
+and a Solidity compiler, installed by py-solc-x on first run.
+
+Usage:
+    python -m dexa_sdk.ledgers.ethereum.benchmark --flow add_token --count 200
+"""
+import argparse
+import asyncio
+
+from dexa_sdk.ledgers.ethereum.benchmark.harness import (
+    FLOW_ANCHOR_DA_INSTANCE,
+    FLOWS,
+    format_result,
+    run_benchmark,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Anchoring throughput benchmark against a local chain"
+    )
+    parser.add_argument("--flow", choices=FLOWS, default=FLOW_ANCHOR_DA_INSTANCE)
+    parser.add_argument("--count", type=int, default=100, help="Number of flows")
+    parser.add_argument("--concurrency", type=int, default=10, help="Concurrent flows")
+    parser.add_argument(
+        "--block-time",
+        type=float,
+        default=1.0,
+        help="Block time in seconds, 0 mines a block per transaction",
+    )
+    args = parser.parse_args()
+
+    result = asyncio.get_event_loop().run_until_complete(
+        run_benchmark(
+            flow=args.flow,
+            count=args.count,
+            concurrency=args.concurrency,
+            block_time=args.block_time,
+        )
+    )
+
+    print(format_result(result))
+
+
+if __name__ == "__main__":
+    main()
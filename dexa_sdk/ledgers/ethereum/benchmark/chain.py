@@ -0,0 +1,236 @@
+import asyncio
+import collections
+import os
+import typing
+from concurrent.futures import ThreadPoolExecutor
+
+from aiohttp import web
+from eth_account.signers.local import LocalAccount
+from loguru import logger
+from web3 import Web3
+from web3._utils.encoding import to_json
+
+# Stand-in for the DEXA smart contract
+STAND_IN_CONTRACT_PATH = os.path.join(os.path.dirname(__file__), "DexaStandIn.sol")
+STAND_IN_CONTRACT_NAME = "DexaStandIn"
+
+# Solidity compiler version, later versions emit opcodes py-evm doesn't support
+SOLC_VERSION = "0.8.17"
+
+# Fees for the setup transactions
+SETUP_MAX_FEE_PER_GAS = 10**10
+SETUP_MAX_PRIORITY_FEE_PER_GAS = 10**9
+
+
+def compile_stand_in_contract(
+    solc_version: str = SOLC_VERSION,
+) -> typing.Tuple[list, str]:
+    """Compile the stand-in DEXA contract using py-solc-x
+
+    Solidity compiler is installed if not available (requires network).
+
+    Args:
+        solc_version (str, optional): Solidity compiler version.
+
+    Returns:
+        typing.Tuple[list, str]: contract abi and bytecode
+    """
+    import solcx
+
+    if solc_version not in [str(v) for v in solcx.get_installed_solc_versions()]:
+        solcx.install_solc(solc_version)
+
+    with open(STAND_IN_CONTRACT_PATH) as f:
+        source = f.read()
+
+    compiled = solcx.compile_source(
+        source, output_values=["abi", "bin"], solc_version=solc_version
+    )
+    contract = compiled[f"<stdin>:{STAND_IN_CONTRACT_NAME}"]
+
+    return (contract["abi"], contract["bin"])
+
+
+class LocalChain:
+    """In-process Ethereum chain (eth-tester, py-evm backend) served over JSON-RPC.
+
+    Chain access is serialised on a single thread, hence the event loop
+    driving the client is not blocked by EVM execution. Blocks are mined
+    on an interval, or for every transaction if block time is 0.
+    JSON-RPC requests are counted per method.
+    """
+
+    def __init__(self, block_time: float = 1.0) -> None:
+        """Initialise local chain
+
+        Args:
+            block_time (float, optional): Block time in seconds. Defaults to 1.0.
+        """
+        # Imported here, eth-tester and py-evm are only needed for benchmarks
+        from eth_tester import EthereumTester, PyEVMBackend
+        from web3.providers.eth_tester import EthereumTesterProvider
+
+        self._tester = EthereumTester(PyEVMBackend())
+        self._w3 = Web3(EthereumTesterProvider(self._tester))
+
+        # Provider middlewares translate between JSON-RPC and eth-tester formats
+        self._request_func = self._w3.provider.request_func(
+            self._w3, self._w3.middleware_onion
+        )
+
+        # Block time
+        self._block_time = block_time
+
+        # Single thread for chain access
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+        # JSON-RPC requests per method
+        self.rpc_calls: typing.Counter[str] = collections.Counter()
+
+        self._runner: typing.Optional[web.AppRunner] = None
+        self._miner: typing.Optional[asyncio.Task] = None
+
+    @property
+    def w3(self) -> Web3:
+        """Accessor for client connected to the chain directly
+
+        Returns:
+            Web3: Ethereum client
+        """
+        return self._w3
+
+    def fund(self, address: str, value: int) -> None:
+        """Transfer value from a pre-funded account
+
+        Args:
+            address (str): Account address
+            value (int): Value in wei
+        """
+        self._tester.send_transaction(
+            {
+                "from": self._tester.get_accounts()[0],
+                "to": address,
+                "value": value,
+                "gas": 21000,
+                "max_fee_per_gas": SETUP_MAX_FEE_PER_GAS,
+                "max_priority_fee_per_gas": SETUP_MAX_PRIORITY_FEE_PER_GAS,
+            }
+        )
+        self._tester.mine_blocks()
+
+    def deploy(self, account: LocalAccount, abi: list, bytecode: str) -> str:
+        """Deploy contract from the account, the account owns the contract
+
+        Args:
+            account (LocalAccount): Account
+            abi (list): Contract abi
+            bytecode (str): Contract bytecode
+
+        Returns:
+            str: contract address
+        """
+        w3 = self._w3
+
+        transaction = w3.eth.contract(abi=abi, bytecode=bytecode).constructor()
+        transaction = transaction.buildTransaction(
+            {
+                "from": account.address,
+                "nonce": w3.eth.get_transaction_count(account.address),
+                "gas": 3000000,
+                "maxFeePerGas": SETUP_MAX_FEE_PER_GAS,
+                "maxPriorityFeePerGas": SETUP_MAX_PRIORITY_FEE_PER_GAS,
+                "chainId": w3.eth.chain_id,
+            }
+        )
+        tx_create = w3.eth.account.sign_transaction(transaction, account.key)
+        tx_hash = w3.eth.send_raw_transaction(tx_create.rawTransaction)
+        self._tester.mine_blocks()
+
+        return w3.eth.get_transaction_receipt(tx_hash)["contractAddress"]
+
+    def _request(self, method: str, params: typing.Any) -> dict:
+        """Execute JSON-RPC request against the chain
+
+        Args:
+            method (str): RPC method
+            params (typing.Any): RPC params
+
+        Returns:
+            dict: response without id
+        """
+        try:
+            return self._request_func(method, params)
+        except Exception as err:
+            # For e.g. reverts, surfaced to the client as JSON-RPC errors
+            return {"error": {"code": -32000, "message": str(err)}}
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        """JSON-RPC request handler
+
+        Args:
+            request (web.Request): aiohttp request
+
+        Returns:
+            web.Response: JSON-RPC response
+        """
+        body = await request.json()
+
+        self.rpc_calls[body["method"]] += 1
+
+        loop = asyncio.get_event_loop()
+        response = await loop.run_in_executor(
+            self._executor, self._request, body["method"], body.get("params", [])
+        )
+
+        response = {"jsonrpc": "2.0", "id": body.get("id"), **response}
+
+        return web.Response(text=to_json(response), content_type="application/json")
+
+    async def _mine(self) -> None:
+        """Mine blocks on an interval"""
+        loop = asyncio.get_event_loop()
+        while True:
+            await asyncio.sleep(self._block_time)
+            await loop.run_in_executor(self._executor, self._tester.mine_blocks)
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Serve the chain over JSON-RPC
+
+        Args:
+            host (str, optional): Host. Defaults to "127.0.0.1".
+            port (int, optional): Port, picked by OS if 0. Defaults to 0.
+
+        Returns:
+            str: RPC endpoint
+        """
+        if self._block_time:
+            self._tester.disable_auto_mine_transactions()
+            self._miner = asyncio.get_event_loop().create_task(self._mine())
+
+        app = web.Application()
+        app.router.add_post("/", self._handle)
+
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+
+        site = web.TCPSite(self._runner, host=host, port=port)
+        await site.start()
+
+        (host, port) = self._runner.addresses[0][:2]
+        endpoint = f"http://{host}:{port}"
+
+        logger.info(f"Local chain serving JSON-RPC at {endpoint}")
+
+        return endpoint
+
+    def reset_rpc_calls(self) -> None:
+        """Reset JSON-RPC request counters"""
+        self.rpc_calls.clear()
+
+    async def stop(self) -> None:
+        """Stop mining and serving the chain"""
+        if self._miner:
+            self._miner.cancel()
+        if self._runner:
+            await self._runner.cleanup()
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,212 @@
+import asyncio
+import math
+import time
+import typing
+import uuid
+from collections import namedtuple
+
+from aries_cloudagent.config.injection_context import InjectionContext
+from dexa_sdk.ledgers.ethereum.benchmark.chain import (
+    LocalChain,
+    compile_stand_in_contract,
+)
+from dexa_sdk.ledgers.ethereum.core import EthereumClient
+from web3 import Account
+
+# Flows driven by the benchmark
+FLOW_ANCHOR_DA_INSTANCE = "anchor_da_instance"
+FLOW_ADD_TOKEN = "add_token"
+
+FLOWS = (FLOW_ANCHOR_DA_INSTANCE, FLOW_ADD_TOKEN)
+
+# Balance for the benchmark accounts
+ACCOUNT_FUNDING = 10**22
+
+BenchmarkResult = namedtuple(
+    "BenchmarkResult",
+    "flow count concurrency failures duration tx_per_second "
+    "p50_latency p99_latency rpc_calls_per_anchor rpc_calls",
+)
+
+
+def percentile(values: typing.List[float], percent: float) -> float:
+    """Nearest-rank percentile
+
+    Args:
+        values (typing.List[float]): Values
+        percent (float): Percentile (0-100)
+
+    Returns:
+        float: percentile value, 0 if there are no values
+    """
+    if not values:
+        return 0
+
+    ordered = sorted(values)
+    rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+
+    return ordered[rank - 1]
+
+
+def summarise(
+    flow: str,
+    concurrency: int,
+    latencies: typing.List[float],
+    failures: int,
+    duration: float,
+    rpc_calls: typing.Dict[str, int],
+) -> BenchmarkResult:
+    """Summarise benchmark run
+
+    Args:
+        flow (str): Flow
+        concurrency (int): Concurrent flows
+        latencies (typing.List[float]): Confirmation latencies of successful flows
+        failures (int): Failed flows
+        duration (float): Wall clock duration in seconds
+        rpc_calls (typing.Dict[str, int]): JSON-RPC requests per method
+
+    Returns:
+        BenchmarkResult: benchmark result
+    """
+    count = len(latencies) + failures
+
+    return BenchmarkResult(
+        flow=flow,
+        count=count,
+        concurrency=concurrency,
+        failures=failures,
+        duration=duration,
+        tx_per_second=len(latencies) / duration if duration else 0,
+        p50_latency=percentile(latencies, 50),
+        p99_latency=percentile(latencies, 99),
+        rpc_calls_per_anchor=sum(rpc_calls.values()) / count if count else 0,
+        rpc_calls=dict(rpc_calls),
+    )
+
+
+async def _run_flow(eth_client: EthereumClient, flow: str, index: int) -> bool:
+    """Run the blockchain part of the flow
+
+    Args:
+        eth_client (EthereumClient): Ethereum client
+        flow (str): Flow
+        index (int): Flow index
+
+    Returns:
+        bool: True if the transaction succeeded
+    """
+    if flow == FLOW_ANCHOR_DA_INSTANCE:
+        # Same call as anchor_da_instance_to_blockchain
+        result = await eth_client.emit_da_did(f"did:mydata:benchmark-{index}")
+    else:
+        # Same call as add_token_to_blockchain, token sized as a packed JWT
+        result = await eth_client.add_access_token(uuid.uuid4().hex, "x" * 1024)
+
+    return bool(result) and result[1].get("status") == 1
+
+
+async def run_benchmark(
+    flow: str = FLOW_ANCHOR_DA_INSTANCE,
+    count: int = 100,
+    concurrency: int = 10,
+    block_time: float = 1.0,
+) -> BenchmarkResult:
+    """Run anchoring flows against a local chain
+
+    Args:
+        flow (str, optional): Flow. Defaults to anchoring DA instances.
+        count (int, optional): Number of flows. Defaults to 100.
+        concurrency (int, optional): Concurrent flows. Defaults to 10.
+        block_time (float, optional): Block time in seconds. Defaults to 1.0.
+
+    Returns:
+        BenchmarkResult: benchmark result
+    """
+    assert flow in FLOWS, f"Flow must be one of {FLOWS}"
+
+    # Local chain with the stand-in contract, owned by the intermediary
+    chain = LocalChain(block_time=block_time)
+
+    org_account = Account.create()
+    intermediary_account = Account.create()
+
+    chain.fund(org_account.address, ACCOUNT_FUNDING)
+    chain.fund(intermediary_account.address, ACCOUNT_FUNDING)
+
+    (abi, bytecode) = compile_stand_in_contract()
+    contract_address = chain.deploy(intermediary_account, abi, bytecode)
+
+    eth_node_rpc = await chain.start()
+
+    context = InjectionContext(
+        settings={
+            "dexa.eth_node_rpc": eth_node_rpc,
+            "dexa.org_eth_private_key": org_account.key.hex(),
+            "dexa.intermediary_eth_private_key": intermediary_account.key.hex(),
+            "dexa.contract_address": contract_address,
+            "dexa.contract_abi": abi,
+        }
+    )
+    eth_client = EthereumClient(context)
+
+    try:
+        # Whitelist the organisation, as done on startup
+        await eth_client.account_state.start()
+        await eth_client.add_organisation()
+
+        chain.reset_rpc_calls()
+
+        semaphore = asyncio.Semaphore(concurrency)
+        latencies = []
+        failures = 0
+
+        async def timed_flow(index: int) -> None:
+            nonlocal failures
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    succeeded = await _run_flow(eth_client, flow, index)
+                except Exception:
+                    succeeded = False
+
+                if succeeded:
+                    latencies.append(time.perf_counter() - start)
+                else:
+                    failures += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*[timed_flow(index) for index in range(count)])
+        duration = time.perf_counter() - start
+
+        return summarise(
+            flow, concurrency, latencies, failures, duration, chain.rpc_calls
+        )
+    finally:
+        await eth_client.close()
+        await chain.stop()
+
+
+def format_result(result: BenchmarkResult) -> str:
+    """Format benchmark result as a report
+
+    Args:
+        result (BenchmarkResult): benchmark result
+
+    Returns:
+        str: report
+    """
+    lines = [
+        f"Flow:                  {result.flow}",
+        f"Flows:                 {result.count} ({result.failures} failed)",
+        f"Concurrency:           {result.concurrency}",
+        f"Duration:              {result.duration:.2f} s",
+        f"Throughput:            {result.tx_per_second:.2f} tx/s",
+        f"Latency p50:           {result.p50_latency * 1000:.0f} ms",
+        f"Latency p99:           {result.p99_latency * 1000:.0f} ms",
+        f"RPC calls per anchor:  {result.rpc_calls_per_anchor:.2f}",
+    ]
+    for method, calls in sorted(result.rpc_calls.items()):
+        lines.append(f"  {method}: {calls}")
+
+    return "\n".join(lines)
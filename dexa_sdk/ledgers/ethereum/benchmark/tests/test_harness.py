@@ -0,0 +1,37 @@
+from asynctest import TestCase as AsyncTestCase
+from dexa_sdk.ledgers.ethereum.benchmark.harness import (
+    FLOW_ADD_TOKEN,
+    percentile,
+    summarise,
+)
+
+
+class TestHarness(AsyncTestCase):
+    """Test benchmark harness"""
+
+    async def test_percentile(self):
+        """Test nearest-rank percentile"""
+
+        values = [float(v) for v in range(100, 0, -1)]
+
+        assert percentile(values, 50) == 50
+        assert percentile(values, 99) == 99
+        assert percentile(values, 100) == 100
+        assert percentile([], 50) == 0
+
+    async def test_summarise(self):
+        """Test benchmark summary"""
+
+        result = summarise(
+            FLOW_ADD_TOKEN,
+            concurrency=2,
+            latencies=[1.0, 2.0, 3.0],
+            failures=1,
+            duration=2.0,
+            rpc_calls={"eth_sendRawTransaction": 4, "eth_estimateGas": 4},
+        )
+
+        assert result.count == 4
+        assert result.tx_per_second == 1.5
+        assert result.p50_latency == 2.0
+        assert result.rpc_calls_per_anchor == 2
@@ -2,12 +2,36 @@ import asyncio
 import typing
 
 from aries_cloudagent.config.injection_context import InjectionContext
+from dexa_sdk.ledgers.ethereum.account_state import AccountStatePoller
+from dexa_sdk.ledgers.ethereum.fees import (
+    FEE_URGENCY_FAST,
+    FEE_URGENCY_STANDARD,
+    FeeOracle,
+    bump_fee,
+)
+from dexa_sdk.ledgers.ethereum.nonce import NonceManager
+from dexa_sdk.ledgers.ethereum.rpc_pool import RPCPoolProvider, parse_rpc_endpoints
+from dexa_sdk.ledgers.ethereum.watcher import ReceiptWatcher
+from dexa_sdk.utils.executor_pools import POOL_ETHEREUM, run_in_pool
 from eth_account.signers.local import LocalAccount
+from hexbytes import HexBytes
 from loguru import logger
 from web3 import Account, Web3
+from web3._utils.abi import get_abi_output_types
 from web3._utils.encoding import to_json
 from web3.contract import Contract
-from web3.exceptions import ContractLogicError
+from web3.eth import AsyncEth
+from web3.exceptions import ContractLogicError, TimeExhausted, TransactionNotFound
+from web3.types import TxParams, TxReceipt
+
+# Callback invoked with the transaction hash once a transaction is sent
+OnSubmitCallback = typing.Callable[[HexBytes], typing.Awaitable[None]]
+
+# Node errors indicating the local nonce is out of sync
+NONCE_ERRORS = ("nonce", "replacement transaction underpriced")
+
+# Node error indicating the signed transaction is in the pool already
+ALREADY_KNOWN_ERROR = "already known"
 
 
 class EthereumClient:
@@ -22,8 +46,10 @@ class EthereumClient:
         # Logger
         self._logger = logger
 
-        # Eth node rpc endpoint
-        self._eth_node_rpc = self._context.settings.get("dexa.eth_node_rpc")
+        # Eth node rpc endpoints (comma separated)
+        self._eth_node_rpcs = parse_rpc_endpoints(
+            self._context.settings.get("dexa.eth_node_rpc")
+        )
 
         # Eth private key of the controller
         self._org_eth_private_key = self._context.settings.get(
@@ -43,8 +69,29 @@ class EthereumClient:
             self._intermediary_eth_private_key
         )
 
-        # Ethereum client
-        self._client = Web3(Web3.HTTPProvider(self._eth_node_rpc))
+        # Ethereum client, used for encoding contract calls
+        self._client = Web3(Web3.HTTPProvider(self._eth_node_rpcs[0]))
+
+        # RPC endpoints with keep-alive connection pools, reads are routed
+        # to the fastest healthy node and writes fail over on error.
+        self._rpc_pool = RPCPoolProvider(self._eth_node_rpcs)
+
+        # Ethereum client (asyncio), used for submitting transactions
+        # and tracking receipts without occupying executor threads.
+        self._async_client = Web3(
+            self._rpc_pool,
+            modules={"eth": (AsyncEth,)},
+            middlewares=[],
+        )
+
+        # Single poller tracking receipts for all the pending transactions
+        self._receipt_watcher = ReceiptWatcher(self._async_client)
+
+        # Fees are estimated from recent fee history
+        self._fee_oracle = FeeOracle(self._async_client)
+
+        # Chain id, fetched on first transaction
+        self._chain_id: typing.Optional[int] = None
 
         # Contract ABI
         self._contract_abi = self._context.settings.get("dexa.contract_abi")
@@ -57,6 +104,29 @@ class EthereumClient:
             address=self._contract_address, abi=self._contract_abi
         )
 
+        # Balances and nonces of the accounts, refreshed in the background
+        self._account_state = AccountStatePoller(
+            self._async_client,
+            {
+                "organisation": self._org_eth_account.address,
+                "intermediary": self._intermediary_eth_account.address,
+            },
+            interval=self._context.settings.get("dexa.eth_account_poll_interval", 30),
+            min_balance=self._context.settings.get("dexa.eth_min_balance", 0),
+        )
+
+        # Local nonce allocation for the accounts
+        self._org_nonce_manager = NonceManager(
+            self._async_client, self._org_eth_account.address
+        )
+        self._intermediary_nonce_manager = NonceManager(
+            self._async_client, self._intermediary_eth_account.address
+        )
+
+        # Set once the organisation is whitelisted, transactions of the
+        # organisation account wait for it as they would revert otherwise.
+        self._whitelisted = asyncio.Event()
+
     @property
     def context(self) -> InjectionContext:
         """Accessor for injection context.
@@ -84,6 +154,46 @@ class EthereumClient:
         """
         return self._client
 
+    @property
+    def async_client(self) -> Web3:
+        """Returns the asyncio client for interacting with ethereum blockchain node.
+
+        Returns:
+            Web3: Ethereum blockchain client (asyncio)
+        """
+        return self._async_client
+
+    @property
+    def rpc_pool(self) -> RPCPoolProvider:
+        """Accessor for RPC endpoint pool.
+
+        Returns:
+            RPCPoolProvider: RPC endpoint pool
+        """
+        return self._rpc_pool
+
+    def rpc_metrics(self) -> typing.List[dict]:
+        """Returns latency and error metrics for the RPC endpoints.
+
+        Returns:
+            typing.List[dict]: metrics
+        """
+        return self.rpc_pool.metrics()
+
+    @property
+    def account_state(self) -> AccountStatePoller:
+        """Accessor for account state poller.
+
+        Returns:
+            AccountStatePoller: account state poller
+        """
+        return self._account_state
+
+    async def close(self) -> None:
+        """Stop the account state poller and close the RPC connection pools."""
+        await self.account_state.stop()
+        await self.rpc_pool.close()
+
     @property
     def org_account(self) -> LocalAccount:
         """Accessor for ethereum account for organisation.
@@ -147,33 +257,390 @@ class EthereumClient:
         """
         return self._contract
 
-    def emit_da_did(self, did: str) -> typing.Tuple[typing.Any, typing.Any]:
-        """Emit did:mydata identifier in the blockchain logs"""
-        org_account = self.org_account
-        org_balance = self.client.eth.get_balance(org_account.address)
+    async def get_chain_id(self) -> int:
+        """Returns the chain id, fetched from the node once.
+
+        Returns:
+            int: chain id
+        """
+        if self._chain_id is None:
+            self._chain_id = await self.async_client.eth.chain_id
+        return self._chain_id
 
-        self.logger.info(f"Organisation account address: {org_account.address}")
-        self.logger.info(f"Organisation account balance: {org_balance}")
+    @property
+    def fee_oracle(self) -> FeeOracle:
+        """Accessor for fee oracle.
+
+        Returns:
+            FeeOracle: fee oracle
+        """
+        return self._fee_oracle
+
+    async def submit_transaction(
+        self,
+        fn_name: str,
+        args: typing.List[typing.Any],
+        account: LocalAccount,
+        nonce_manager: NonceManager,
+        urgency: str = FEE_URGENCY_STANDARD,
+        nonce_retries: int = 1,
+    ) -> typing.Tuple[HexBytes, TxParams]:
+        """Build, sign and send the transaction without waiting for the receipt.
+
+        Nonce is allocated locally, so transactions can be pipelined.
+
+        Args:
+            fn_name (str): Contract function name
+            args (typing.List[typing.Any]): Contract function arguments
+            account (LocalAccount): Account sending the transaction
+            nonce_manager (NonceManager): Nonce manager for the account
+            urgency (str, optional): Fee urgency tier. Defaults to standard.
+            nonce_retries (int, optional): Retries if nonce is out of sync. Defaults to 1.
+
+        Returns:
+            typing.Tuple[HexBytes, TxParams]: transaction hash and transaction
+        """
+        eth = self.async_client.eth
+
+        # Encode contract function call locally
+        transaction = {
+            "from": account.address,
+            "to": self.contract_address,
+            "data": self.contract.encodeABI(fn_name=fn_name, args=args),
+        }
+
+        # Raises ContractLogicError if the transaction would revert
+        transaction["gas"] = await eth.estimate_gas(transaction)
+        transaction["chainId"] = await self.get_chain_id()
+
+        # Fees for the urgency tier
+        (max_fee_per_gas, max_priority_fee_per_gas) = await self.fee_oracle.fees(
+            urgency
+        )
+        transaction["maxFeePerGas"] = max_fee_per_gas
+        transaction["maxPriorityFeePerGas"] = max_priority_fee_per_gas
+
+        for attempt in range(nonce_retries + 1):
+            try:
+                async with nonce_manager.reserve() as nonce:
+                    transaction["nonce"] = nonce
+
+                    # Signing is CPU bound, hence run in the ethereum pool
+                    tx_create = await run_in_pool(
+                        self.context,
+                        POOL_ETHEREUM,
+                        eth.account.sign_transaction,
+                        transaction,
+                        account.privateKey,
+                    )
+
+                    tx_hash = await self.send_signed_transaction(tx_create)
+
+                    return (tx_hash, transaction)
+            except ContractLogicError:
+                raise
+            except ValueError as err:
+                # Nonce is resynced by the nonce manager, retry once more.
+                nonce_error = any(e in str(err).lower() for e in NONCE_ERRORS)
+                if nonce_error and attempt < nonce_retries:
+                    self.logger.info(f"Nonce out of sync, retrying: {err}")
+                    continue
+                raise
+
+    async def replace_transaction(
+        self, transaction: TxParams, account: LocalAccount
+    ) -> HexBytes:
+        """Re-broadcast the transaction with same nonce and bumped fees.
+
+        Args:
+            transaction (TxParams): Transaction, fees are updated in place
+            account (LocalAccount): Account sending the transaction
+
+        Returns:
+            HexBytes: transaction hash of the replacement
+        """
+        eth = self.async_client.eth
+
+        # Bumped fees, or fees for fast tier if the network moved further
+        (max_fee_per_gas, max_priority_fee_per_gas) = await self.fee_oracle.fees(
+            FEE_URGENCY_FAST
+        )
+        transaction["maxPriorityFeePerGas"] = max(
+            bump_fee(transaction["maxPriorityFeePerGas"]), max_priority_fee_per_gas
+        )
+        transaction["maxFeePerGas"] = max(
+            bump_fee(transaction["maxFeePerGas"]),
+            max_fee_per_gas,
+            transaction["maxPriorityFeePerGas"],
+        )
+
+        tx_create = await run_in_pool(
+            self.context,
+            POOL_ETHEREUM,
+            eth.account.sign_transaction,
+            transaction,
+            account.privateKey,
+        )
+
+        return await self.send_signed_transaction(tx_create)
+
+    async def send_signed_transaction(self, tx_create: typing.Any) -> HexBytes:
+        """Broadcast the signed transaction.
+
+        If the node has the same signed transaction already, for e.g. it was
+        broadcasted through another node, the transaction is sent. If the
+        node doesn't respond in time, the transaction might be sent, hence
+        the hash is returned to be tracked and replaced if not mined.
+
+        Args:
+            tx_create (typing.Any): Signed transaction
 
+        Returns:
+            HexBytes: transaction hash
+        """
         try:
-            contract = self.contract
-            contract_function = contract.functions.emitDADID(did)
-            contract_function_txn = contract_function.buildTransaction(
-                {
-                    "from": org_account.address,
-                    "nonce": self.client.eth.get_transaction_count(org_account.address),
-                    "maxFeePerGas": 5721831636100,
-                    "maxPriorityFeePerGas": 1000000000,
-                }
+            return await self.async_client.eth.send_raw_transaction(
+                tx_create.rawTransaction
+            )
+        except asyncio.TimeoutError:
+            self.logger.info(
+                f"Timed out sending transaction {HexBytes(tx_create.hash).hex()}"
+            )
+
+            return HexBytes(tx_create.hash)
+        except ValueError as err:
+            if ALREADY_KNOWN_ERROR not in str(err).lower():
+                raise
+
+            self.logger.info(
+                f"Transaction {HexBytes(tx_create.hash).hex()} is known already"
             )
 
-            tx_create = self.client.eth.account.sign_transaction(
-                contract_function_txn, org_account.privateKey
+            return HexBytes(tx_create.hash)
+
+    async def confirm_transaction(
+        self,
+        tx_hash: HexBytes,
+        transaction: TxParams,
+        account: LocalAccount,
+        replacement_deadline: float = 60,
+        max_replacements: int = 3,
+        timeout: float = 300,
+        on_submit: OnSubmitCallback = None,
+    ) -> typing.Tuple[HexBytes, TxReceipt]:
+        """Wait for the transaction to be mined, replacing it if stuck.
+
+        If the transaction is not mined within the replacement deadline,
+        a replacement with the same nonce and bumped fees is broadcasted.
+        Whichever of the transactions is mined first is returned.
+
+        Args:
+            tx_hash (HexBytes): Transaction hash
+            transaction (TxParams): Transaction
+            account (LocalAccount): Account sending the transaction
+            replacement_deadline (float, optional): Seconds before replacing. Defaults to 60.
+            max_replacements (int, optional): Maximum replacements. Defaults to 3.
+            timeout (float, optional): Timeout in seconds. Defaults to 300.
+            on_submit (OnSubmitCallback, optional): Called for the transaction
+                and each replacement, once tracked.
+
+        Raises:
+            TimeExhausted: If none of the transactions is mined within timeout.
+
+        Returns:
+            typing.Tuple[HexBytes, TxReceipt]: transaction hash and receipt
+        """
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + timeout
+
+        # Futures for the broadcasted transactions, tracked before the hash
+        # is handed over so that a receipt is not missed meanwhile
+        futures = {self.track_transaction(tx_hash, timeout): tx_hash}
+
+        replacements = 0
+        try:
+            if on_submit:
+                await on_submit(tx_hash)
+
+            while True:
+                done, _ = await asyncio.wait(
+                    futures.keys(),
+                    timeout=(
+                        replacement_deadline
+                        if replacements < max_replacements
+                        else None
+                    ),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+
+                if done:
+                    future = done.pop()
+                    return (futures[future], future.result())
+
+                replacements += 1
+
+                # Transaction is stuck, re-broadcast with bumped fees
+                try:
+                    replacement_hash = await self.replace_transaction(
+                        transaction, account
+                    )
+                except ValueError as err:
+                    # For e.g. previous transaction is mined in the meantime
+                    self.logger.info(f"Failed to replace transaction: {err}")
+                    continue
+
+                self.logger.info(
+                    f"Replaced transaction {HexBytes(tx_hash).hex()} with "
+                    f"{replacement_hash.hex()} (nonce: {transaction['nonce']})"
+                )
+
+                futures[
+                    self.track_transaction(replacement_hash, deadline - loop.time())
+                ] = replacement_hash
+
+                if on_submit:
+                    await on_submit(replacement_hash)
+        finally:
+            # Stop tracking the transactions which are replaced
+            for future in futures:
+                if not future.done():
+                    future.cancel()
+
+    async def send_transaction(
+        self,
+        fn_name: str,
+        args: typing.List[typing.Any],
+        account: LocalAccount,
+        nonce_manager: NonceManager,
+        urgency: str = FEE_URGENCY_STANDARD,
+        on_submit: OnSubmitCallback = None,
+    ) -> typing.Tuple[HexBytes, TxReceipt]:
+        """Submit the transaction and wait till it is mined.
+
+        Args:
+            fn_name (str): Contract function name
+            args (typing.List[typing.Any]): Contract function arguments
+            account (LocalAccount): Account sending the transaction
+            nonce_manager (NonceManager): Nonce manager for the account
+            urgency (str, optional): Fee urgency tier. Defaults to standard.
+            on_submit (OnSubmitCallback, optional): Called once transaction is sent.
+
+        Returns:
+            typing.Tuple[HexBytes, TxReceipt]: transaction hash and receipt
+        """
+        # Whitelisting runs in the background on startup
+        if account.address == self._org_eth_account.address:
+            await self._whitelisted.wait()
+
+        (tx_hash, transaction) = await self.submit_transaction(
+            fn_name, args, account, nonce_manager, urgency=urgency
+        )
+
+        self.logger.info(f"Transaction hash ({fn_name}): {tx_hash.hex()}")
+
+        return await self.confirm_transaction(
+            tx_hash, transaction, account, on_submit=on_submit
+        )
+
+    async def find_receipt(
+        self, tx_hashes: typing.List[str], timeout: float = 120
+    ) -> typing.Optional[typing.Tuple[HexBytes, TxReceipt]]:
+        """Find the receipt for any of the previously sent transactions.
+
+        Used for resuming transactions sent before a restart. Transactions
+        sent with same nonce are replacements, hence at most one is mined.
+
+        Args:
+            tx_hashes (typing.List[str]): Transaction hashes
+            timeout (float, optional): Timeout in seconds. Defaults to 120.
+
+        Returns:
+            typing.Optional[typing.Tuple[HexBytes, TxReceipt]]: transaction hash
+                and receipt, None if none of the transactions is mined.
+        """
+        # Check if any of the transactions is mined already
+        for tx_hash in tx_hashes:
+            try:
+                tx_receipt = await self.async_client.eth.get_transaction_receipt(
+                    tx_hash
+                )
+                return (HexBytes(tx_hash), tx_receipt)
+            except TransactionNotFound:
+                continue
+
+        # Wait for the transactions which might be still in the mempool
+        futures = {
+            self.track_transaction(HexBytes(tx_hash), timeout): tx_hash
+            for tx_hash in tx_hashes
+        }
+        try:
+            done, _ = await asyncio.wait(
+                futures.keys(), return_when=asyncio.FIRST_COMPLETED
             )
+            future = done.pop()
+            return (HexBytes(futures[future]), future.result())
+        except TimeExhausted:
+            return None
+        finally:
+            for future in futures:
+                if not future.done():
+                    future.cancel()
 
-            tx_hash = self.client.eth.send_raw_transaction(tx_create.rawTransaction)
+    @property
+    def receipt_watcher(self) -> ReceiptWatcher:
+        """Accessor for receipt watcher.
 
-            tx_receipt = self.client.eth.wait_for_transaction_receipt(tx_hash)
+        Returns:
+            ReceiptWatcher: receipt watcher
+        """
+        return self._receipt_watcher
+
+    async def wait_for_receipt(
+        self, tx_hash: HexBytes, timeout: float = 120
+    ) -> TxReceipt:
+        """Wait for the transaction receipt.
+
+        Args:
+            tx_hash (HexBytes): Transaction hash
+            timeout (float, optional): Timeout in seconds. Defaults to 120.
+
+        Raises:
+            TimeExhausted: If receipt is not available within timeout.
+
+        Returns:
+            TxReceipt: transaction receipt
+        """
+        return await self.track_transaction(tx_hash, timeout)
+
+    def track_transaction(
+        self, tx_hash: HexBytes, timeout: float = 120
+    ) -> "asyncio.Future[TxReceipt]":
+        """Track the transaction, returns a future resolved with the receipt.
+
+        Args:
+            tx_hash (HexBytes): Transaction hash
+            timeout (float, optional): Timeout in seconds. Defaults to 120.
+
+        Returns:
+            asyncio.Future[TxReceipt]: future for the transaction receipt,
+                owned by the caller and safe to cancel
+        """
+        return self.receipt_watcher.watch(tx_hash, timeout)
+
+    async def emit_da_did(
+        self, did: str, on_submit: OnSubmitCallback = None
+    ) -> typing.Tuple[typing.Any, typing.Any]:
+        """Emit did:mydata identifier in the blockchain logs"""
+        org_account = self.org_account
+
+        try:
+            (tx_hash, tx_receipt) = await self.send_transaction(
+                "emitDADID",
+                [did],
+                org_account,
+                self._org_nonce_manager,
+                on_submit=on_submit,
+            )
 
             if tx_receipt.get("status") == 1:
                 self.logger.info(f"Status (emitDADID): Succesfully emitted {did}")
@@ -184,34 +651,21 @@ class EthereumClient:
         except ContractLogicError as err:
             self.logger.info(f"Status (emitDADID): {err}")
 
-    def emit_dda_did(self, did: str) -> typing.Tuple[typing.Any, typing.Any]:
+    async def emit_dda_did(
+        self, did: str, on_submit: OnSubmitCallback = None
+    ) -> typing.Tuple[typing.Any, typing.Any]:
         """Emit did:mydata identifier in the blockchain logs"""
         org_account = self.org_account
-        org_balance = self.client.eth.get_balance(org_account.address)
-
-        self.logger.info(f"Organisation account address: {org_account.address}")
-        self.logger.info(f"Organisation account balance: {org_balance}")
 
         try:
-            contract = self.contract
-            contract_function = contract.functions.emitDDADID(did)
-            contract_function_txn = contract_function.buildTransaction(
-                {
-                    "from": org_account.address,
-                    "nonce": self.client.eth.get_transaction_count(org_account.address),
-                    "maxFeePerGas": 572183163610,
-                    "maxPriorityFeePerGas": 1000000000,
-                }
-            )
-
-            tx_create = self.client.eth.account.sign_transaction(
-                contract_function_txn, org_account.privateKey
+            (tx_hash, tx_receipt) = await self.send_transaction(
+                "emitDDADID",
+                [did],
+                org_account,
+                self._org_nonce_manager,
+                on_submit=on_submit,
             )
 
-            tx_hash = self.client.eth.send_raw_transaction(tx_create.rawTransaction)
-
-            tx_receipt = self.client.eth.wait_for_transaction_receipt(tx_hash)
-
             if tx_receipt.get("status") == 1:
                 self.logger.info(f"Status (emitDDADID): Succesfully emitted {did}")
             else:
@@ -221,35 +675,23 @@ class EthereumClient:
         except ContractLogicError as err:
             self.logger.info(f"Status (emitDDADID): {err}")
 
-    def add_access_token(
-        self, nonce: str, accesstoken: str
+    async def add_access_token(
+        self, nonce: str, accesstoken: str, on_submit: OnSubmitCallback = None
     ) -> typing.Tuple[typing.Any, typing.Any]:
         """Add access token."""
         org_account = self.org_account
-        org_balance = self.client.eth.get_balance(org_account.address)
-
-        self.logger.info(f"Organisation account address: {org_account.address}")
-        self.logger.info(f"Organisation account balance: {org_balance}")
 
         try:
-            contract = self.contract
-            contract_function = contract.functions.addAccessToken(nonce, accesstoken)
-            contract_function_txn = contract_function.buildTransaction(
-                {
-                    "from": org_account.address,
-                    "nonce": self.client.eth.get_transaction_count(org_account.address),
-                    "maxFeePerGas": 572183163610,
-                    "maxPriorityFeePerGas": 1000000000,
-                }
-            )
-
-            tx_create = self.client.eth.account.sign_transaction(
-                contract_function_txn, org_account.privateKey
+            # Data pull waits for the token, hence faster inclusion
+            (tx_hash, tx_receipt) = await self.send_transaction(
+                "addAccessToken",
+                [nonce, accesstoken],
+                org_account,
+                self._org_nonce_manager,
+                urgency=FEE_URGENCY_FAST,
+                on_submit=on_submit,
             )
 
-            tx_hash = self.client.eth.send_raw_transaction(tx_create.rawTransaction)
-            tx_receipt = self.client.eth.wait_for_transaction_receipt(tx_hash)
-
             if tx_receipt.get("status") == 1:
                 self.logger.info(
                     f"Status (addAccessToken): Succesfully added accesstoken with nonce: {nonce}"
@@ -263,77 +705,85 @@ class EthereumClient:
         except ContractLogicError as err:
             self.logger.info(f"Status (addAccessToken): {err}")
 
-    async def release_access_token(self, eth_address: str, nonce: str) -> str:
-        """Release access token"""
+    async def call(
+        self, fn_name: str, args: typing.List[typing.Any], from_address: str = None
+    ) -> typing.Any:
+        """Call a read-only contract function.
 
-        org_account = self.org_account
-        org_balance = self.client.eth.get_balance(org_account.address)
+        Doesn't need nonce, fees or balance, hence only a single `eth_call`.
+
+        Args:
+            fn_name (str): Contract function name
+            args (typing.List[typing.Any]): Contract function arguments
+            from_address (str, optional): Caller address. Defaults to None.
+
+        Returns:
+            typing.Any: decoded return value(s)
+        """
+        transaction = {
+            "to": self.contract_address,
+            "data": self.contract.encodeABI(fn_name=fn_name, args=args),
+        }
+        if from_address:
+            transaction["from"] = from_address
+
+        # Raises ContractLogicError if the call reverts
+        result = await self.async_client.eth.call(transaction)
+
+        # Decode the return values
+        fn_abi = self.contract.get_function_by_name(fn_name).abi
+        output_types = get_abi_output_types(fn_abi)
+        output = self.client.codec.decode_abi(output_types, result)
 
-        self.logger.info(f"Organisation account address: {org_account.address}")
-        self.logger.info(f"Organisation account balance: {org_balance}")
+        return output[0] if len(output) == 1 else output
+
+    async def release_access_token(self, eth_address: str, nonce: str) -> str:
+        """Release access token"""
 
         try:
-            contract = self.contract
-            token = contract.functions.releaseAccessToken(nonce, eth_address).call(
-                {
-                    "from": org_account.address,
-                    "nonce": self.client.eth.get_transaction_count(org_account.address),
-                    "maxFeePerGas": 572183163610,
-                    "maxPriorityFeePerGas": 1000000000,
-                }
+            return await self.call(
+                "releaseAccessToken",
+                [nonce, eth_address],
+                from_address=self.org_account.address,
             )
+        except ContractLogicError as err:
+            self.logger.info(f"Status (releaseAccessToken): {err}")
 
-            # Suspend execution and let other task run.
-            await asyncio.sleep(1)
+    @property
+    def whitelisted(self) -> bool:
+        """Whether the organisation is whitelisted
 
-            return token
-        except ContractLogicError as err:
-            self.logger.info(f"Status (addAccessToken): {err}")
+        Returns:
+            bool: True once whitelisting is done
+        """
+        return self._whitelisted.is_set()
+
+    def mark_whitelisted(self) -> None:
+        """Release the organisation transactions, for e.g. if whitelisted by
+        another worker process"""
+        self._whitelisted.set()
 
     async def add_organisation(self) -> None:
         """Add organisation to the whitelist"""
         org_account = self.org_account
-        org_balance = self.client.eth.get_balance(org_account.address)
-
-        self.logger.info(f"Organisation account address: {org_account.address}")
-        self.logger.info(f"Organisation account balance: {org_balance}")
-
         intermediary_account = self.intermediary_account
-        intermediary_balance = self.client.eth.get_balance(intermediary_account.address)
 
-        self.logger.info(
-            f"Intermediary account address: {intermediary_account.address}"
-        )
-        self.logger.info(f"Intermediary account balance: {intermediary_balance}")
-        self.logger.info(
-            f"Transaction count: \
-                {self.client.eth.get_transaction_count(intermediary_account.address)}"
-        )
-
-        try:
-            contract = self.contract
-            contract_function = contract.functions.addOrganisation(org_account.address)
-            contract_function_txn = contract_function.buildTransaction(
-                {
-                    "from": intermediary_account.address,
-                    "nonce": self.client.eth.get_transaction_count(
-                        intermediary_account.address
-                    ),
-                    "maxFeePerGas": 572183163610,
-                    "maxPriorityFeePerGas": 1000000000,
-                }
+        # Account state is served from memory, refreshed in the background
+        for name, state in self.account_state.snapshot().items():
+            self.logger.info(f"{name.capitalize()} account address: {state['address']}")
+            self.logger.info(f"{name.capitalize()} account balance: {state['balance']}")
+            self.logger.info(
+                f"{name.capitalize()} account transaction count: {state['nonce']}"
             )
 
-            tx_create = self.client.eth.account.sign_transaction(
-                contract_function_txn, intermediary_account.privateKey
+        try:
+            (tx_hash, tx_receipt) = await self.send_transaction(
+                "addOrganisation",
+                [org_account.address],
+                intermediary_account,
+                self._intermediary_nonce_manager,
             )
 
-            tx_hash = self.client.eth.send_raw_transaction(tx_create.rawTransaction)
-
-            self.logger.info(f"Transaction hash (addOrganisation): {tx_hash.hex()}")
-
-            tx_receipt = self.client.eth.wait_for_transaction_receipt(tx_hash)
-
             self.logger.info(
                 f"Transaction receipt (addOrganisation): {to_json(tx_receipt)}"
             )
@@ -350,3 +800,6 @@ class EthereumClient:
             self.logger.info(f"Status (addOrganisation): {err}")
         except ValueError as err:
             self.logger.info(f"Status (addOrganisation): {err}")
+        finally:
+            # Released on failure too, organisation transactions must not wait forever
+            self.mark_whitelisted()
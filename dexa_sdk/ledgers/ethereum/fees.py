@@ -0,0 +1,136 @@
+import asyncio
+import statistics
+import typing
+
+from loguru import logger
+from web3 import Web3
+
+# Urgency tiers mapped to reward percentiles in fee history
+FEE_URGENCY_SLOW = "slow"
+FEE_URGENCY_STANDARD = "standard"
+FEE_URGENCY_FAST = "fast"
+
+FEE_URGENCY_PERCENTILES = {
+    FEE_URGENCY_SLOW: 25,
+    FEE_URGENCY_STANDARD: 50,
+    FEE_URGENCY_FAST: 75,
+}
+
+# Fees used if fee history is not available
+DEFAULT_MAX_FEE_PER_GAS = 572183163610
+DEFAULT_MAX_PRIORITY_FEE_PER_GAS = 1000000000
+
+# Replacement transactions must pay at least 10% more, nodes reject otherwise
+FEE_BUMP_NUMERATOR = 1125
+FEE_BUMP_DENOMINATOR = 1000
+
+
+def bump_fee(fee: int) -> int:
+    """Bump fee for replacing a transaction with same nonce
+
+    Args:
+        fee (int): fee
+
+    Returns:
+        int: bumped fee
+    """
+    return fee * FEE_BUMP_NUMERATOR // FEE_BUMP_DENOMINATOR + 1
+
+
+class FeeOracle:
+    """EIP-1559 fee estimation from cached `eth_feeHistory` results"""
+
+    def __init__(
+        self,
+        client: Web3,
+        block_count: int = 10,
+        cache_ttl: float = 12.0,
+        min_priority_fee_per_gas: int = DEFAULT_MAX_PRIORITY_FEE_PER_GAS,
+    ) -> None:
+        """Initialise fee oracle
+
+        Args:
+            client (Web3): Ethereum client (async)
+            block_count (int, optional): Blocks in fee history. Defaults to 10.
+            cache_ttl (float, optional): Fee history cache TTL in seconds. Defaults to 12.0.
+            min_priority_fee_per_gas (int, optional): Lower bound for priority fee.
+        """
+
+        # Ethereum client
+        self._client = client
+
+        # Number of blocks to sample
+        self._block_count = block_count
+
+        # Cache TTL for fee history, around a block time
+        self._cache_ttl = cache_ttl
+
+        # Lower bound for priority fee
+        self._min_priority_fee_per_gas = min_priority_fee_per_gas
+
+        # Cached fees per urgency and the time they were fetched
+        self._fees: typing.Optional[typing.Dict[str, typing.Tuple[int, int]]] = None
+        self._fetched_at: float = 0
+
+        # Concurrent callers share a single fetch
+        self._lock: typing.Optional[asyncio.Lock] = None
+
+    @property
+    def lock(self) -> asyncio.Lock:
+        """Accessor for the fetch lock
+
+        Returns:
+            asyncio.Lock: lock
+        """
+        if not self._lock:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def _fetch(self) -> typing.Dict[str, typing.Tuple[int, int]]:
+        """Fetch fee history and compute fees for each urgency tier
+
+        Returns:
+            typing.Dict[str, typing.Tuple[int, int]]: max fee and max priority fee
+        """
+        percentiles = list(FEE_URGENCY_PERCENTILES.values())
+        fee_history = await self._client.eth.fee_history(
+            self._block_count, "latest", percentiles
+        )
+
+        # Base fee for the next block is the last entry
+        base_fee = fee_history["baseFeePerGas"][-1]
+
+        fees = {}
+        for index, urgency in enumerate(FEE_URGENCY_PERCENTILES):
+            rewards = [reward[index] for reward in fee_history["reward"] if reward]
+            priority_fee = int(statistics.median(rewards)) if rewards else 0
+            priority_fee = max(priority_fee, self._min_priority_fee_per_gas)
+
+            # Headroom for base fee increase over the next few blocks
+            fees[urgency] = (2 * base_fee + priority_fee, priority_fee)
+
+        return fees
+
+    async def fees(self, urgency: str = FEE_URGENCY_STANDARD) -> typing.Tuple[int, int]:
+        """Returns fees for the urgency tier
+
+        Args:
+            urgency (str, optional): Urgency tier. Defaults to standard.
+
+        Returns:
+            typing.Tuple[int, int]: max fee per gas and max priority fee per gas
+        """
+        loop = asyncio.get_event_loop()
+
+        async with self.lock:
+            if not self._fees or loop.time() - self._fetched_at > self._cache_ttl:
+                try:
+                    self._fees = await self._fetch()
+                    self._fetched_at = loop.time()
+                except Exception as err:
+                    logger.info(f"Failed to fetch fee history: {err}")
+
+        if not self._fees:
+            return (DEFAULT_MAX_FEE_PER_GAS, DEFAULT_MAX_PRIORITY_FEE_PER_GAS)
+
+        return self._fees.get(urgency, self._fees[FEE_URGENCY_STANDARD])
@@ -0,0 +1,52 @@
+"""Lazy loading of the ethereum ledger backend.
+
+web3 and eth_account take a significant share of the startup imports,
+hence they are imported once the ethereum client is needed.
+"""
+
+import typing
+
+from aries_cloudagent.config.injection_context import InjectionContext
+
+if typing.TYPE_CHECKING:
+    from dexa_sdk.ledgers.ethereum.core import EthereumClient
+
+
+def load_ethereum_client() -> typing.Type["EthereumClient"]:
+    """Import the ethereum client class on first use
+
+    Returns:
+        typing.Type[EthereumClient]: ethereum client class
+    """
+    from dexa_sdk.ledgers.ethereum.core import EthereumClient
+
+    return EthereumClient
+
+
+async def inject_ethereum_client(
+    context: InjectionContext, required: bool = True
+) -> typing.Optional["EthereumClient"]:
+    """Inject the ethereum client bound to the context
+
+    Args:
+        context (InjectionContext): Injection context
+        required (bool, optional): Raise if not bound. Defaults to True.
+
+    Returns:
+        typing.Optional[EthereumClient]: ethereum client
+    """
+    return await context.inject(load_ethereum_client(), required=required)
+
+
+def to_json(obj: typing.Any) -> str:
+    """Convert web3 objects, for e.g. transaction receipts, to JSON
+
+    Args:
+        obj (typing.Any): web3 object
+
+    Returns:
+        str: JSON string
+    """
+    from web3._utils.encoding import to_json
+
+    return to_json(obj)
@@ -0,0 +1,104 @@
+import asyncio
+import typing
+from contextlib import asynccontextmanager
+
+from loguru import logger
+from web3 import Web3
+
+
+class NonceManager:
+    """Allocates sequential transaction nonces locally for an account.
+
+    Nonce is fetched from the node once (including pending transactions)
+    and incremented locally afterwards, so transactions can be submitted
+    back to back without waiting for the previous one to be mined.
+    """
+
+    def __init__(self, client: Web3, address: str) -> None:
+        """Initialise nonce manager
+
+        Args:
+            client (Web3): Ethereum client (async)
+            address (str): Account address
+        """
+
+        # Ethereum client
+        self._client = client
+
+        # Account address
+        self._address = address
+
+        # Next nonce to be allocated, None until synced with the node
+        self._next_nonce: typing.Optional[int] = None
+
+        # Lock is created lazily within the running event loop
+        self._lock: typing.Optional[asyncio.Lock] = None
+
+    @property
+    def address(self) -> str:
+        """Accessor for account address
+
+        Returns:
+            str: account address
+        """
+        return self._address
+
+    @property
+    def next_nonce(self) -> typing.Optional[int]:
+        """Accessor for next nonce to be allocated
+
+        Returns:
+            typing.Optional[int]: nonce
+        """
+        return self._next_nonce
+
+    @property
+    def lock(self) -> asyncio.Lock:
+        """Accessor for the allocation lock
+
+        Returns:
+            asyncio.Lock: lock
+        """
+        if not self._lock:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def _sync(self) -> int:
+        """Fetch the nonce from the node (including pending transactions)
+
+        Returns:
+            int: nonce
+        """
+        nonce = await self._client.eth.get_transaction_count(self._address, "pending")
+        logger.info(f"Synced nonce for {self._address}: {nonce}")
+        return nonce
+
+    def resync(self) -> None:
+        """Discard the local nonce, next allocation fetches it from the node"""
+        self._next_nonce = None
+
+    @asynccontextmanager
+    async def reserve(self) -> typing.AsyncIterator[int]:
+        """Reserve the next nonce for submitting a transaction.
+
+        Allocation is serialised till the block exits, hence transactions
+        reach the node in nonce order. If the block raises an error, the
+        local nonce is discarded and synced again on next allocation.
+
+        Yields:
+            int: nonce
+        """
+        async with self.lock:
+            if self._next_nonce is None:
+                self._next_nonce = await self._sync()
+
+            nonce = self._next_nonce
+
+            try:
+                yield nonce
+            except Exception:
+                # Nonce state is unknown, resync on next allocation
+                self._next_nonce = None
+                raise
+
+            self._next_nonce = nonce + 1
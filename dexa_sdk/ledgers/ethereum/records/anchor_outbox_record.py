@@ -0,0 +1,216 @@
+import typing
+
+from aries_cloudagent.config.injection_context import InjectionContext
+from aries_cloudagent.messaging.models.base_record import BaseRecord, BaseRecordSchema
+from hexbytes import HexBytes
+from marshmallow import EXCLUDE, fields
+
+
+class AnchorOutboxRecord(BaseRecord):
+    """Anchoring outbox record.
+
+    Written before a transaction is submitted to the blockchain, updated
+    with the transaction hash once sent and deleted once the receipt is
+    processed. Entries which are not completed are resumed on startup.
+    """
+
+    class Meta:
+        schema_class = "AnchorOutboxRecordSchema"
+
+    # Record type
+    RECORD_TYPE = "anchor_outbox_record"
+
+    # Record identifier
+    RECORD_ID_NAME = "id"
+
+    # Record tags
+    TAG_NAMES = {"~state", "~kind", "~reference_id"}
+
+    # States
+    STATE_PENDING = "pending"
+    STATE_SENT = "sent"
+    STATE_COMPLETED = "completed"
+    STATE_FAILED = "failed"
+
+    # Kinds of anchoring
+    KIND_DA_INSTANCE = "da_instance"
+    KIND_DDA_INSTANCE = "dda_instance"
+    KIND_ACCESS_TOKEN = "access_token"
+
+    # Entries being anchored by this process, not to be resumed meanwhile
+    _in_flight: typing.Set[str] = set()
+
+    def __init__(
+        self,
+        *,
+        id: str = None,
+        kind: str = None,
+        reference_id: str = None,
+        payload: dict = None,
+        tx_hashes: typing.List[str] = None,
+        error: str = None,
+        state: str = None,
+        **kwargs
+    ):
+        # Pass the identifier and state to parent class
+        super().__init__(id, state, **kwargs)
+
+        self.kind = kind
+        self.reference_id = reference_id
+        self.payload = payload or {}
+        self.tx_hashes = tx_hashes or []
+        self.error = error
+
+    @property
+    def outbox_id(self) -> str:
+        """Accessor for record identifier"""
+        return self._id
+
+    @property
+    def in_flight(self) -> bool:
+        """Accessor for whether the entry is being anchored by this process"""
+        return self._id in AnchorOutboxRecord._in_flight
+
+    def claim(self) -> bool:
+        """Claim the entry for anchoring by this process.
+
+        Returns:
+            bool: True if claimed, False if the entry is claimed already
+        """
+        if self.in_flight:
+            return False
+
+        AnchorOutboxRecord._in_flight.add(self._id)
+        return True
+
+    def release(self) -> None:
+        """Release the claim, for e.g. once the entry is finished."""
+        AnchorOutboxRecord._in_flight.discard(self._id)
+
+    @property
+    def record_value(self) -> dict:
+        """Accessor for JSON record value generated for this transaction record."""
+        return {
+            prop: getattr(self, prop)
+            for prop in (
+                "kind",
+                "reference_id",
+                "payload",
+                "tx_hashes",
+                "error",
+                "state",
+            )
+        }
+
+    @classmethod
+    async def create_entry(
+        cls,
+        context: InjectionContext,
+        kind: str,
+        reference_id: str,
+        payload: dict = None,
+    ) -> "AnchorOutboxRecord":
+        """Write outbox entry before submitting the transaction.
+
+        Args:
+            context (InjectionContext): Injection context to be used.
+            kind (str): Kind of anchoring
+            reference_id (str): Identifier of the anchored artefact
+            payload (dict, optional): Data required to resume anchoring.
+
+        Returns:
+            AnchorOutboxRecord: outbox record, claimed by this process
+        """
+        record = cls(
+            kind=kind,
+            reference_id=reference_id,
+            payload=payload,
+            state=cls.STATE_PENDING,
+        )
+        await record.save(context)
+        record.claim()
+        return record
+
+    async def mark_sent(self, context: InjectionContext, tx_hash: HexBytes) -> None:
+        """Record the transaction hash once the transaction is sent.
+
+        Replacement transactions are appended, any of them can be mined.
+
+        Args:
+            context (InjectionContext): Injection context to be used.
+            tx_hash (HexBytes): Transaction hash
+        """
+        self.tx_hashes = self.tx_hashes + [HexBytes(tx_hash).hex()]
+        self.state = self.STATE_SENT
+        await self.save(context)
+
+    async def mark_completed(self, context: InjectionContext) -> None:
+        """Complete the entry once the receipt is processed.
+
+        Entry is deleted, the payload (for e.g. access token) is not kept.
+
+        Args:
+            context (InjectionContext): Injection context to be used.
+        """
+        self.state = self.STATE_COMPLETED
+        await self.delete_record(context)
+        self.release()
+
+    async def mark_failed(self, context: InjectionContext, error: str) -> None:
+        """Fail the entry, it is not resumed on startup.
+
+        Args:
+            context (InjectionContext): Injection context to be used.
+            error (str): Error
+        """
+        self.error = error
+        self.state = self.STATE_FAILED
+        await self.save(context)
+        self.release()
+
+    @classmethod
+    async def query_unfinished(
+        cls, context: InjectionContext
+    ) -> typing.List["AnchorOutboxRecord"]:
+        """Query entries which are pending or sent.
+
+        Args:
+            context (InjectionContext): Injection context to be used.
+
+        Returns:
+            typing.List[AnchorOutboxRecord]: outbox records
+        """
+        pending = await cls.query(context, {"state": cls.STATE_PENDING})
+        sent = await cls.query(context, {"state": cls.STATE_SENT})
+        return pending + sent
+
+    @classmethod
+    async def purge_completed(cls, context: InjectionContext) -> int:
+        """Delete completed entries kept by previous versions.
+
+        Args:
+            context (InjectionContext): Injection context to be used.
+
+        Returns:
+            int: deleted entries
+        """
+        completed = await cls.query(context, {"state": cls.STATE_COMPLETED})
+        for record in completed:
+            await record.delete_record(context)
+        return len(completed)
+
+
+class AnchorOutboxRecordSchema(BaseRecordSchema):
+    """Anchoring outbox record schema"""
+
+    class Meta:
+        model_class = AnchorOutboxRecord
+        unknown = EXCLUDE
+
+    outbox_id = fields.Str()
+    kind = fields.Str()
+    reference_id = fields.Str()
+    payload = fields.Dict()
+    tx_hashes = fields.List(fields.Str())
+    error = fields.Str(allow_none=True)
+    state = fields.Str()
@@ -0,0 +1,94 @@
+from aries_cloudagent.config.injection_context import InjectionContext
+from aries_cloudagent.storage.base import BaseStorage
+from aries_cloudagent.storage.basic import BasicStorage
+from aries_cloudagent.storage.error import StorageNotFoundError
+from asynctest import TestCase as AsyncTestCase
+from hexbytes import HexBytes
+
+from ..anchor_outbox_record import AnchorOutboxRecord
+
+
+class TestAnchorOutboxRecord(AsyncTestCase):
+    """Test anchoring outbox record"""
+
+    def setUp(self):
+        self.storage = BasicStorage()
+        self.context = InjectionContext()
+        self.context.injector.bind_instance(BaseStorage, self.storage)
+
+    async def test_outbox_lifecycle(self):
+        """Test outbox entry from submission till completion"""
+
+        record = await AnchorOutboxRecord.create_entry(
+            self.context,
+            AnchorOutboxRecord.KIND_ACCESS_TOKEN,
+            "nonce-1",
+            payload={"connection_id": "conn-1", "jwt": "jwt", "nonce": "nonce-1"},
+        )
+        assert record.state == AnchorOutboxRecord.STATE_PENDING
+
+        unfinished = await AnchorOutboxRecord.query_unfinished(self.context)
+        assert [r.outbox_id for r in unfinished] == [record.outbox_id]
+
+        # Original transaction and its replacement
+        await record.mark_sent(self.context, HexBytes(b"\x01" * 32))
+        await record.mark_sent(self.context, HexBytes(b"\x02" * 32))
+
+        fetched = await AnchorOutboxRecord.retrieve_by_id(
+            self.context, record.outbox_id
+        )
+        assert fetched.state == AnchorOutboxRecord.STATE_SENT
+        assert fetched.tx_hashes == ["0x" + "01" * 32, "0x" + "02" * 32]
+        assert fetched.payload["connection_id"] == "conn-1"
+
+        unfinished = await AnchorOutboxRecord.query_unfinished(self.context)
+        assert len(unfinished) == 1
+
+        await fetched.mark_completed(self.context)
+
+        unfinished = await AnchorOutboxRecord.query_unfinished(self.context)
+        assert unfinished == []
+
+        # Completed entry isn't kept along with its payload
+        with self.assertRaises(StorageNotFoundError):
+            await AnchorOutboxRecord.retrieve_by_id(self.context, record.outbox_id)
+
+    async def test_purge_completed(self):
+        """Test completed entries kept by previous versions are deleted"""
+
+        completed = AnchorOutboxRecord(
+            kind=AnchorOutboxRecord.KIND_ACCESS_TOKEN,
+            reference_id="nonce-1",
+            payload={"jwt": "jwt"},
+            state=AnchorOutboxRecord.STATE_COMPLETED,
+        )
+        await completed.save(self.context)
+        pending = await AnchorOutboxRecord.create_entry(
+            self.context, AnchorOutboxRecord.KIND_DA_INSTANCE, "instance-1"
+        )
+
+        assert await AnchorOutboxRecord.purge_completed(self.context) == 1
+
+        unfinished = await AnchorOutboxRecord.query_unfinished(self.context)
+        assert [r.outbox_id for r in unfinished] == [pending.outbox_id]
+        pending.release()
+
+    async def test_claim(self):
+        """Test outbox entry is claimed till it is finished"""
+
+        record = await AnchorOutboxRecord.create_entry(
+            self.context, AnchorOutboxRecord.KIND_DA_INSTANCE, "instance-1"
+        )
+        assert record.in_flight
+
+        # Same entry resumed from storage is not claimed again
+        fetched = await AnchorOutboxRecord.retrieve_by_id(
+            self.context, record.outbox_id
+        )
+        assert not fetched.claim()
+
+        await record.mark_failed(self.context, "error")
+        assert not fetched.in_flight
+
+        assert fetched.claim()
+        fetched.release()
@@ -0,0 +1,294 @@
+import asyncio
+import typing
+
+import aiohttp
+from loguru import logger
+from web3.providers.async_base import AsyncJSONBaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+# RPC methods which change the state, routed to endpoints in configured order
+WRITE_METHODS = {"eth_sendRawTransaction", "eth_sendTransaction"}
+
+
+def parse_rpc_endpoints(
+    endpoints: typing.Union[str, typing.List[str]]
+) -> typing.List[str]:
+    """Parse comma separated RPC endpoints
+
+    Args:
+        endpoints (typing.Union[str, typing.List[str]]): RPC endpoint(s)
+
+    Returns:
+        typing.List[str]: RPC endpoints
+    """
+    if isinstance(endpoints, str):
+        endpoints = endpoints.split(",")
+
+    return [endpoint.strip() for endpoint in endpoints if endpoint.strip()]
+
+
+class RPCNode:
+    """RPC endpoint with a keep-alive connection pool and metrics"""
+
+    def __init__(
+        self,
+        url: str,
+        pool_size: int = 10,
+        keepalive_timeout: float = 30.0,
+        request_timeout: float = 10.0,
+        latency_smoothing: float = 0.2,
+    ) -> None:
+        """Initialise RPC node
+
+        Args:
+            url (str): RPC endpoint
+            pool_size (int, optional): Connections in the pool. Defaults to 10.
+            keepalive_timeout (float, optional): Idle connection timeout. Defaults to 30.0.
+            request_timeout (float, optional): Request timeout in seconds. Defaults to 10.0.
+            latency_smoothing (float, optional): Weight of the latest latency sample.
+        """
+
+        # RPC endpoint
+        self.url = url
+
+        # Connection pool settings
+        self._pool_size = pool_size
+        self._keepalive_timeout = keepalive_timeout
+        self._request_timeout = request_timeout
+
+        # Session is created lazily within the running event loop
+        self._session: typing.Optional[aiohttp.ClientSession] = None
+
+        # Exponentially weighted moving average of latency in seconds
+        self._latency_smoothing = latency_smoothing
+        self.latency: typing.Optional[float] = None
+
+        # Metrics
+        self.requests = 0
+        self.errors = 0
+        self.last_error: typing.Optional[str] = None
+
+        # Endpoint is skipped till the cooldown ends after a failure
+        self.unhealthy_until: float = 0
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Accessor for the keep-alive session
+
+        Returns:
+            aiohttp.ClientSession: session
+        """
+        if not self._session or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self._pool_size, keepalive_timeout=self._keepalive_timeout
+                ),
+                timeout=aiohttp.ClientTimeout(total=self._request_timeout),
+                headers={"Content-Type": "application/json"},
+            )
+        return self._session
+
+    def is_healthy(self, now: float) -> bool:
+        """Check if the endpoint is out of cooldown
+
+        Args:
+            now (float): Event loop time
+
+        Returns:
+            bool: True if healthy
+        """
+        return now >= self.unhealthy_until
+
+    async def post(self, data: bytes) -> bytes:
+        """Post JSON-RPC request
+
+        Args:
+            data (bytes): Encoded request
+
+        Returns:
+            bytes: Raw response
+        """
+        async with self.session.post(self.url, data=data) as response:
+            response.raise_for_status()
+            return await response.read()
+
+    def record_success(self, latency: float) -> None:
+        """Record latency of a successful request
+
+        Args:
+            latency (float): Latency in seconds
+        """
+        self.requests += 1
+        self.unhealthy_until = 0
+
+        if self.latency is None:
+            self.latency = latency
+        else:
+            self.latency += self._latency_smoothing * (latency - self.latency)
+
+    def record_failure(self, error: Exception, cooldown_until: float) -> None:
+        """Record failed request and put the endpoint in cooldown
+
+        Args:
+            error (Exception): Error
+            cooldown_until (float): Event loop time till the endpoint is skipped
+        """
+        self.requests += 1
+        self.errors += 1
+        self.last_error = repr(error)
+        self.unhealthy_until = cooldown_until
+
+    def metrics(self, now: float) -> dict:
+        """Returns metrics for the endpoint
+
+        Args:
+            now (float): Event loop time
+
+        Returns:
+            dict: metrics
+        """
+        return {
+            "url": self.url,
+            "healthy": self.is_healthy(now),
+            "requests": self.requests,
+            "errors": self.errors,
+            "latency_ms": (
+                round(self.latency * 1000, 2) if self.latency is not None else None
+            ),
+            "last_error": self.last_error,
+        }
+
+    async def close(self) -> None:
+        """Close the keep-alive session"""
+        if self._session and not self._session.closed:
+            await self._session.close()
+
+
+class RPCPoolProvider(AsyncJSONBaseProvider):
+    """Web3 asyncio provider backed by multiple RPC endpoints.
+
+    Reads are routed to the healthy endpoint with the lowest latency.
+    Writes are sent to the endpoints in the configured order. In both
+    cases the request fails over to the next endpoint on transport errors.
+    JSON-RPC errors (for e.g. reverts) are returned without failover.
+    """
+
+    def __init__(
+        self,
+        endpoint_uris: typing.List[str],
+        cooldown: float = 30.0,
+        **endpoint_kwargs,
+    ) -> None:
+        """Initialise RPC pool provider
+
+        Args:
+            endpoint_uris (typing.List[str]): RPC endpoints
+            cooldown (float, optional): Seconds an endpoint is skipped after failure.
+                Defaults to 30.0.
+            endpoint_kwargs: Connection pool settings for the endpoints
+        """
+        super().__init__()
+
+        assert endpoint_uris, "Atleast one RPC endpoint is required."
+
+        self._endpoints = [RPCNode(url, **endpoint_kwargs) for url in endpoint_uris]
+
+        # Cooldown after failure
+        self._cooldown = cooldown
+
+    @property
+    def endpoints(self) -> typing.List[RPCNode]:
+        """Accessor for RPC endpoints
+
+        Returns:
+            typing.List[RPCNode]: RPC endpoints
+        """
+        return self._endpoints
+
+    def candidates(self, method: str) -> typing.List[RPCNode]:
+        """Endpoints to try for the method, in order
+
+        Args:
+            method (str): RPC method
+
+        Returns:
+            typing.List[RPCNode]: RPC endpoints
+        """
+        now = asyncio.get_event_loop().time()
+
+        healthy = [e for e in self._endpoints if e.is_healthy(now)]
+        unhealthy = [e for e in self._endpoints if not e.is_healthy(now)]
+
+        if method not in WRITE_METHODS:
+            # Endpoints without samples are tried first to measure them
+            healthy.sort(key=lambda e: e.latency or 0)
+
+        # Endpoints in cooldown are the last resort, soonest recovering first
+        unhealthy.sort(key=lambda e: e.unhealthy_until)
+
+        return healthy + unhealthy
+
+    async def make_request(
+        self, method: RPCEndpoint, params: typing.Any
+    ) -> RPCResponse:
+        """Send JSON-RPC request, failing over to the next endpoint on error
+
+        Writes are failed over only if the connection couldn't be made, as
+        otherwise the node might have received the request already.
+
+        Args:
+            method (RPCEndpoint): RPC method
+            params (typing.Any): RPC params
+
+        Returns:
+            RPCResponse: response
+        """
+        loop = asyncio.get_event_loop()
+        request_data = self.encode_rpc_request(method, params)
+
+        last_error = None
+        for endpoint in self.candidates(method):
+            start = loop.time()
+            try:
+                raw_response = await endpoint.post(request_data)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                endpoint.record_failure(err, loop.time() + self._cooldown)
+                logger.info(f"RPC endpoint {endpoint.url} failed ({method}): {err!r}")
+                if method in WRITE_METHODS and not isinstance(
+                    err, aiohttp.ClientConnectorError
+                ):
+                    # Request might be sent, the caller tracks the transaction hash
+                    raise
+                last_error = err
+                continue
+
+            endpoint.record_success(loop.time() - start)
+
+            return self.decode_rpc_response(raw_response)
+
+        raise last_error
+
+    async def is_connected(self) -> bool:
+        """Check if any of the endpoints is reachable
+
+        Returns:
+            bool: True if connected
+        """
+        try:
+            await self.make_request(RPCEndpoint("web3_clientVersion"), [])
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return False
+        return True
+
+    def metrics(self) -> typing.List[dict]:
+        """Returns per endpoint latency and error metrics
+
+        Returns:
+            typing.List[dict]: metrics
+        """
+        now = asyncio.get_event_loop().time()
+        return [endpoint.metrics(now) for endpoint in self._endpoints]
+
+    async def close(self) -> None:
+        """Close the keep-alive sessions"""
+        await asyncio.gather(*[endpoint.close() for endpoint in self._endpoints])
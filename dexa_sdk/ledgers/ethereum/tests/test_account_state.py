@@ -0,0 +1,42 @@
+from asynctest import TestCase as AsyncTestCase
+from asynctest import mock as async_mock
+from dexa_sdk.ledgers.ethereum.account_state import AccountStatePoller
+
+
+class TestAccountStatePoller(AsyncTestCase):
+    """Test account state poller"""
+
+    def setUp(self) -> None:
+
+        balances = {"0xorg": 5, "0xintermediary": 500}
+
+        self.client = async_mock.MagicMock()
+        self.client.eth.get_balance = async_mock.CoroutineMock(
+            side_effect=lambda address: balances[address]
+        )
+        self.client.eth.get_transaction_count = async_mock.CoroutineMock(return_value=7)
+
+        self.poller = AccountStatePoller(
+            self.client,
+            {"organisation": "0xorg", "intermediary": "0xintermediary"},
+            interval=60,
+            min_balance=100,
+        )
+
+    async def test_state_served_from_memory(self):
+        """Test account state is fetched once and served from memory"""
+
+        await self.poller.start()
+
+        for _ in range(3):
+            state = self.poller.get("organisation")
+            assert state["balance"] == 5
+            assert state["nonce"] == 7
+
+        assert self.client.eth.get_balance.call_count == 2
+        assert self.client.eth.get_transaction_count.call_count == 2
+
+        # Organisation account is below the threshold
+        assert self.poller.low_balance() == ["organisation"]
+
+        await self.poller.stop()
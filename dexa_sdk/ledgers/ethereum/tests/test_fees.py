@@ -0,0 +1,60 @@
+from asynctest import TestCase as AsyncTestCase
+from asynctest import mock as async_mock
+from dexa_sdk.ledgers.ethereum.fees import (
+    DEFAULT_MAX_FEE_PER_GAS,
+    DEFAULT_MAX_PRIORITY_FEE_PER_GAS,
+    FEE_URGENCY_FAST,
+    FEE_URGENCY_SLOW,
+    FEE_URGENCY_STANDARD,
+    FeeOracle,
+    bump_fee,
+)
+
+GWEI = 10**9
+
+
+class TestFeeOracle(AsyncTestCase):
+    """Test fee oracle"""
+
+    def setUp(self) -> None:
+
+        self.client = async_mock.MagicMock()
+        self.client.eth.fee_history = async_mock.CoroutineMock(
+            return_value={
+                "baseFeePerGas": [10 * GWEI, 12 * GWEI, 20 * GWEI],
+                "reward": [
+                    [1 * GWEI, 2 * GWEI, 5 * GWEI],
+                    [1 * GWEI, 3 * GWEI, 7 * GWEI],
+                ],
+            }
+        )
+        self.oracle = FeeOracle(self.client, block_count=2, min_priority_fee_per_gas=0)
+
+    async def test_fees_per_urgency(self):
+        """Test fees are computed per urgency tier from fee history"""
+
+        slow = await self.oracle.fees(FEE_URGENCY_SLOW)
+        standard = await self.oracle.fees(FEE_URGENCY_STANDARD)
+        fast = await self.oracle.fees(FEE_URGENCY_FAST)
+
+        # Priority fee is the median reward at the tier percentile
+        assert slow == (41 * GWEI, 1 * GWEI)
+        assert standard == (int(42.5 * GWEI), int(2.5 * GWEI))
+        assert fast == (46 * GWEI, 6 * GWEI)
+
+        # Fee history is fetched once and cached
+        self.client.eth.fee_history.assert_called_once_with(2, "latest", [25, 50, 75])
+
+    async def test_fees_fallback(self):
+        """Test default fees if fee history is not available"""
+
+        self.client.eth.fee_history.side_effect = ValueError("not supported")
+
+        fees = await self.oracle.fees(FEE_URGENCY_FAST)
+
+        assert fees == (DEFAULT_MAX_FEE_PER_GAS, DEFAULT_MAX_PRIORITY_FEE_PER_GAS)
+
+    async def test_bump_fee(self):
+        """Test replacement fee is at least 10% more"""
+
+        assert bump_fee(GWEI) > GWEI * 1.1
@@ -0,0 +1,60 @@
+import asyncio
+
+from asynctest import TestCase as AsyncTestCase
+from asynctest import mock as async_mock
+from dexa_sdk.ledgers.ethereum.nonce import NonceManager
+
+
+class TestNonceManager(AsyncTestCase):
+    """Test local nonce allocation"""
+
+    def setUp(self) -> None:
+
+        self.client = async_mock.MagicMock()
+        self.client.eth.get_transaction_count = async_mock.CoroutineMock(return_value=5)
+        self.nonce_manager = NonceManager(self.client, "0xabc")
+
+    async def test_sequential_nonces(self):
+        """Test nonces are allocated locally after the first sync"""
+
+        nonces = []
+        for _ in range(3):
+            async with self.nonce_manager.reserve() as nonce:
+                nonces.append(nonce)
+
+        assert nonces == [5, 6, 7]
+        assert self.nonce_manager.next_nonce == 8
+
+        # Node is queried only once
+        self.client.eth.get_transaction_count.assert_called_once_with(
+            "0xabc", "pending"
+        )
+
+    async def test_resync_on_error(self):
+        """Test nonce is synced with the node after a failed submission"""
+
+        async with self.nonce_manager.reserve() as nonce:
+            assert nonce == 5
+
+        with self.assertRaises(ValueError):
+            async with self.nonce_manager.reserve() as nonce:
+                raise ValueError({"code": -32000, "message": "nonce too low"})
+
+        assert self.nonce_manager.next_nonce is None
+
+        self.client.eth.get_transaction_count.return_value = 9
+        async with self.nonce_manager.reserve() as nonce:
+            assert nonce == 9
+
+    async def test_concurrent_reservations(self):
+        """Test concurrent submissions don't reuse nonces"""
+
+        async def reserve():
+            async with self.nonce_manager.reserve() as nonce:
+                # Let other submissions contend for the lock
+                await asyncio.sleep(0)
+                return nonce
+
+        nonces = await asyncio.gather(*[reserve() for _ in range(50)])
+
+        assert sorted(nonces) == list(range(5, 55))
@@ -0,0 +1,93 @@
+import asyncio
+import json
+
+import aiohttp
+from asynctest import TestCase as AsyncTestCase
+from asynctest import mock as async_mock
+from dexa_sdk.ledgers.ethereum.rpc_pool import RPCPoolProvider, parse_rpc_endpoints
+
+
+def rpc_response(result) -> bytes:
+    return json.dumps({"jsonrpc": "2.0", "id": 0, "result": result}).encode()
+
+
+class TestRPCPoolProvider(AsyncTestCase):
+    """Test RPC pool provider"""
+
+    def setUp(self) -> None:
+
+        self.pool = RPCPoolProvider(
+            parse_rpc_endpoints("http://node-a:8545, http://node-b:8545")
+        )
+        (self.node_a, self.node_b) = self.pool.endpoints
+
+    async def test_reads_routed_to_fastest_node(self):
+        """Test reads are routed to the node with lowest latency"""
+
+        self.node_a.latency = 0.5
+        self.node_b.latency = 0.1
+
+        self.node_a.post = async_mock.CoroutineMock(return_value=rpc_response("0x1"))
+        self.node_b.post = async_mock.CoroutineMock(return_value=rpc_response("0x2"))
+
+        response = await self.pool.make_request("eth_blockNumber", [])
+
+        assert response["result"] == "0x2"
+        assert self.node_a.post.call_count == 0
+
+        # Writes are sent in configured order
+        response = await self.pool.make_request("eth_sendRawTransaction", ["0x"])
+
+        assert response["result"] == "0x1"
+
+    async def test_failover(self):
+        """Test request fails over on transport error"""
+
+        self.node_a.post = async_mock.CoroutineMock(
+            side_effect=aiohttp.ClientConnectorError(
+                async_mock.MagicMock(), OSError("refused")
+            )
+        )
+        self.node_b.post = async_mock.CoroutineMock(return_value=rpc_response("0x2"))
+
+        response = await self.pool.make_request("eth_sendRawTransaction", ["0x"])
+
+        assert response["result"] == "0x2"
+
+        metrics = {m["url"]: m for m in self.pool.metrics()}
+
+        assert metrics["http://node-a:8545"]["errors"] == 1
+        assert not metrics["http://node-a:8545"]["healthy"]
+        assert metrics["http://node-b:8545"]["requests"] == 1
+
+        # Failed node is skipped during cooldown
+        await self.pool.make_request("eth_sendRawTransaction", ["0x"])
+
+        assert self.node_a.post.call_count == 1
+
+    async def test_write_timeout_not_failed_over(self):
+        """Test write is not sent to the next node if it might be sent already"""
+
+        self.node_a.post = async_mock.CoroutineMock(side_effect=asyncio.TimeoutError())
+        self.node_b.post = async_mock.CoroutineMock(return_value=rpc_response("0x2"))
+
+        with self.assertRaises(asyncio.TimeoutError):
+            await self.pool.make_request("eth_sendRawTransaction", ["0x"])
+
+        assert self.node_b.post.call_count == 0
+
+        # Reads are failed over
+        response = await self.pool.make_request("eth_blockNumber", [])
+
+        assert response["result"] == "0x2"
+
+    async def test_all_nodes_failed(self):
+        """Test error is raised if all the nodes failed"""
+
+        for node in self.pool.endpoints:
+            node.post = async_mock.CoroutineMock(
+                side_effect=aiohttp.ClientConnectionError("refused")
+            )
+
+        with self.assertRaises(aiohttp.ClientConnectionError):
+            await self.pool.make_request("eth_blockNumber", [])
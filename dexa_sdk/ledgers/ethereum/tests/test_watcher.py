@@ -0,0 +1,105 @@
+from asynctest import TestCase as AsyncTestCase
+from asynctest import mock as async_mock
+from dexa_sdk.ledgers.ethereum.watcher import ReceiptWatcher
+from hexbytes import HexBytes
+from web3.exceptions import TimeExhausted, TransactionNotFound
+
+
+class TestReceiptWatcher(AsyncTestCase):
+    """Test receipt watcher"""
+
+    def setUp(self) -> None:
+
+        self.tx_hashes = [HexBytes(bytes([i]) * 32) for i in range(3)]
+
+        # Block 10 includes first two transactions, block 11 the last one
+        blocks = {
+            9: {"transactions": []},
+            10: {"transactions": self.tx_hashes[:2]},
+            11: {"transactions": [HexBytes(b"\xff" * 32), self.tx_hashes[2]]},
+        }
+
+        # Latest block returned by the successive polls, the last one repeated
+        self.heads = [9, 10, 11]
+
+        self.head = None
+
+        def get_block_number():
+            self.head = self.heads.pop(0) if len(self.heads) > 1 else self.heads[0]
+            return self.head
+
+        def get_transaction_receipt(key):
+            for number, block in blocks.items():
+                if number <= self.head and HexBytes(key) in block["transactions"]:
+                    return {"transactionHash": key, "status": 1}
+            raise TransactionNotFound(key)
+
+        self.client = async_mock.MagicMock()
+        self.client.eth.get_block_number = async_mock.CoroutineMock(
+            side_effect=get_block_number
+        )
+        self.client.eth.get_block = async_mock.CoroutineMock(
+            side_effect=lambda number: blocks[number]
+        )
+        self.client.eth.get_transaction_receipt = async_mock.CoroutineMock(
+            side_effect=get_transaction_receipt
+        )
+
+        self.watcher = ReceiptWatcher(self.client, poll_interval=0.01)
+
+    async def test_receipts_resolved_in_bulk(self):
+        """Test receipts for pending transactions are resolved by single poller"""
+
+        futures = [self.watcher.watch(tx_hash) for tx_hash in self.tx_hashes]
+
+        for tx_hash, future in zip(self.tx_hashes, futures):
+            receipt = await future
+            assert receipt["transactionHash"] == tx_hash.hex()
+
+        assert self.watcher.pending == 0
+
+        # Each block is fetched once, receipts looked up once on watching
+        # and then only for the matched transactions
+        assert self.client.eth.get_block.call_count == 3
+        assert self.client.eth.get_transaction_receipt.call_count == 6
+
+    async def test_mined_before_watching(self):
+        """Test transaction mined before it is watched is resolved"""
+
+        self.heads = [11]
+
+        receipt = await self.watcher.watch(self.tx_hashes[0])
+        assert receipt["transactionHash"] == self.tx_hashes[0].hex()
+
+        assert self.watcher.pending == 0
+
+        # Only the latest block is scanned
+        self.client.eth.get_block.assert_called_once_with(11)
+
+    async def test_watch_same_transaction(self):
+        """Test waiters of the same transaction get their own futures"""
+
+        self.heads = [9, 10]
+
+        first = self.watcher.watch(self.tx_hashes[0])
+        second = self.watcher.watch(self.tx_hashes[0])
+        assert first is not second
+        assert self.watcher.pending == 1
+
+        # Cancelling a waiter doesn't affect the other
+        first.cancel()
+
+        receipt = await second
+        assert receipt["transactionHash"] == self.tx_hashes[0].hex()
+
+        assert self.watcher.pending == 0
+
+    async def test_receipt_timeout(self):
+        """Test transaction not mined within timeout"""
+
+        self.heads = [9]
+
+        with self.assertRaises(TimeExhausted):
+            await self.watcher.watch(self.tx_hashes[0], timeout=0.05)
+
+        assert self.watcher.pending == 0
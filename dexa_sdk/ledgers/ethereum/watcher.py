@@ -0,0 +1,196 @@
+import asyncio
+import typing
+
+from hexbytes import HexBytes
+from loguru import logger
+from web3 import Web3
+from web3.exceptions import TimeExhausted, TransactionNotFound
+from web3.types import TxReceipt
+
+
+class ReceiptWatcher:
+    """Tracks receipts for all the pending transactions with a single poller.
+
+    New blocks are fetched once per poll interval and the transactions
+    included in them are matched against the pending transactions.
+    Receipts are fetched only for the matched transactions and the
+    futures are resolved in bulk. Newly watched transactions are looked up
+    once, since they might be mined before the blocks scanned.
+
+    Every caller gets its own future, so that cancelling one doesn't affect
+    the others waiting for the same transaction.
+    """
+
+    def __init__(self, client: Web3, poll_interval: float = 1.0) -> None:
+        """Initialise receipt watcher
+
+        Args:
+            client (Web3): Ethereum client (async)
+            poll_interval (float, optional): Poll interval in seconds. Defaults to 1.0.
+        """
+
+        # Ethereum client
+        self._client = client
+
+        # Poll interval
+        self._poll_interval = poll_interval
+
+        # Pending transactions (hex hash -> [(future, deadline)] per waiter)
+        self._pending: typing.Dict[
+            str, typing.List[typing.Tuple["asyncio.Future[TxReceipt]", float]]
+        ] = {}
+
+        # Transactions watched since the last scan, receipts are looked up
+        # directly as they might be included in blocks scanned already
+        self._unchecked: typing.Set[str] = set()
+
+        # Last block scanned for pending transactions
+        self._last_block: typing.Optional[int] = None
+
+        # Poller task, runs only while there are pending transactions
+        self._task: typing.Optional[asyncio.Task] = None
+
+    @property
+    def pending(self) -> int:
+        """Accessor for number of pending transactions
+
+        Returns:
+            int: pending transactions
+        """
+        return len(self._pending)
+
+    def watch(
+        self, tx_hash: HexBytes, timeout: float = 120
+    ) -> "asyncio.Future[TxReceipt]":
+        """Watch the transaction, returns a future resolved with the receipt.
+
+        Args:
+            tx_hash (HexBytes): Transaction hash
+            timeout (float, optional): Timeout in seconds. Defaults to 120.
+
+        Returns:
+            asyncio.Future[TxReceipt]: future for the transaction receipt
+        """
+        loop = asyncio.get_event_loop()
+        key = HexBytes(tx_hash).hex()
+
+        future = loop.create_future()
+        if key not in self._pending:
+            self._pending[key] = []
+            self._unchecked.add(key)
+        self._pending[key].append((future, loop.time() + timeout))
+
+        # Start the poller if not running
+        if not self._task or self._task.done():
+            self._last_block = None
+            self._task = loop.create_task(self._poll())
+
+        return future
+
+    async def _poll(self) -> None:
+        """Poll for new blocks till there are pending transactions"""
+        while self._pending:
+            try:
+                await self._scan()
+            except Exception as err:
+                # Blocks are scanned again on next poll
+                logger.info(f"Receipt watcher failed to scan blocks: {err}")
+
+            self._expire()
+
+            if self._pending:
+                await asyncio.sleep(self._poll_interval)
+
+    def _resolve(self, key: str, receipt: TxReceipt) -> None:
+        """Resolve the pending transaction with the receipt
+
+        Args:
+            key (str): Transaction hash (hex)
+            receipt (TxReceipt): Transaction receipt
+        """
+        for future, _ in self._pending.pop(key):
+            if not future.done():
+                future.set_result(receipt)
+
+    async def _check(self) -> None:
+        """Look up receipts of the transactions watched since the last scan"""
+        unchecked = [key for key in self._unchecked if key in self._pending]
+        self._unchecked.clear()
+        if not unchecked:
+            return
+
+        receipts = await asyncio.gather(
+            *[self._client.eth.get_transaction_receipt(key) for key in unchecked],
+            return_exceptions=True,
+        )
+
+        for key, receipt in zip(unchecked, receipts):
+            if isinstance(receipt, TransactionNotFound):
+                # Not mined yet, matched once included in a block scanned
+                continue
+            if isinstance(receipt, Exception):
+                # Looked up again on next scan
+                self._unchecked.add(key)
+                continue
+            if key in self._pending:
+                self._resolve(key, receipt)
+
+    async def _scan(self) -> None:
+        """Scan the blocks since the last poll for pending transactions"""
+        eth = self._client.eth
+
+        latest = await eth.get_block_number()
+
+        # Transactions mined till the latest block have receipts, later ones
+        # are matched in the blocks scanned next
+        await self._check()
+
+        # Transactions might be included in the latest block already
+        start = latest if self._last_block is None else self._last_block + 1
+
+        for block_number in range(start, latest + 1):
+            block = await eth.get_block(block_number)
+
+            # Pending transactions included in the block
+            mined = [
+                HexBytes(tx).hex()
+                for tx in block.get("transactions", [])
+                if HexBytes(tx).hex() in self._pending
+            ]
+
+            if mined:
+                receipts = await asyncio.gather(
+                    *[eth.get_transaction_receipt(key) for key in mined],
+                    return_exceptions=True,
+                )
+
+                for key, receipt in zip(mined, receipts):
+                    if isinstance(receipt, Exception):
+                        # Receipt is fetched again if the block is scanned again
+                        raise receipt
+
+                    self._resolve(key, receipt)
+
+            self._last_block = block_number
+
+    def _expire(self) -> None:
+        """Fail the transactions not mined within timeout"""
+        now = asyncio.get_event_loop().time()
+
+        for key, waiters in list(self._pending.items()):
+            remaining = []
+            for future, deadline in waiters:
+                if future.done():
+                    # Awaiting task was cancelled
+                    continue
+                if now > deadline:
+                    future.set_exception(
+                        TimeExhausted(f"Transaction {key} is not in the chain")
+                    )
+                    continue
+                remaining.append((future, deadline))
+
+            if remaining:
+                self._pending[key] = remaining
+            else:
+                self._pending.pop(key)
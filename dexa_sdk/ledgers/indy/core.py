@@ -4,6 +4,7 @@ from asyncio import shield
 from aries_cloudagent.config.injection_context import InjectionContext
 from aries_cloudagent.issuer.base import BaseIssuer
 from aries_cloudagent.ledger.base import BaseLedger
+from dexa_sdk.ledgers.indy.records.ledger_payload_record import LedgerPayloadRecord
 
 
 class IndyLegerConfigError(Exception):
@@ -100,3 +101,62 @@ async def create_cred_def_and_anchor_to_ledger(
         )
 
         return cred_def_id, cred_def, novel
+
+
+async def fetch_or_create_ledger_payloads(
+    context: InjectionContext,
+    schema_name: str,
+    schema_version: str,
+    attributes: typing.List[str],
+    schema_id: str = None,
+) -> typing.Tuple[str, str]:
+    """
+    Fetch schema and credential definition from the local registry,
+    written to the ledger only if not available.
+
+    Args:
+        schema_name: Schema name.
+        schema_version: Schema version.
+        attributes: List of attributes.
+        schema_id: Schema id if available.
+
+    Returns:
+        :rtype: tuple: (schema id, credential definition id)
+    """
+
+    # Consult the registry
+    if schema_id:
+        record = await LedgerPayloadRecord.fetch_by_schema_id(context, schema_id)
+    else:
+        record = await LedgerPayloadRecord.fetch_by_attributes(
+            context, schema_name, schema_version, attributes
+        )
+
+    if record and record.cred_def_id:
+        return record.schema_id, record.cred_def_id
+
+    # Create schema if not existing
+    if not schema_id:
+        (schema_id, _) = await create_schema_def_and_anchor_to_ledger(
+            context=context,
+            schema_name=schema_name,
+            schema_version=schema_version,
+            attributes=attributes,
+        )
+
+    # Create credential definition
+    (cred_def_id, _, _) = await create_cred_def_and_anchor_to_ledger(
+        context=context, schema_id=schema_id
+    )
+
+    # Record in the registry
+    record = record or LedgerPayloadRecord(
+        schema_name=schema_name,
+        schema_version=schema_version,
+        attributes=sorted(set(attributes)),
+    )
+    record.schema_id = schema_id
+    record.cred_def_id = cred_def_id
+    await record.save(context)
+
+    return schema_id, cred_def_id
@@ -0,0 +1,144 @@
+import hashlib
+import json
+import typing
+
+from aries_cloudagent.config.injection_context import InjectionContext
+from aries_cloudagent.messaging.models.base_record import BaseRecord, BaseRecordSchema
+from marshmallow import EXCLUDE, fields
+
+
+class LedgerPayloadRecord(BaseRecord):
+    """Registry of schemas and credential definitions written to the ledger.
+
+    Keyed by schema name, version and the sorted attribute set, consulted
+    before writing to the ledger so unchanged templates reuse them.
+    """
+
+    class Meta:
+        schema_class = "LedgerPayloadRecordSchema"
+
+    # Record type
+    RECORD_TYPE = "ledger_payload_record"
+
+    # Record identifier
+    RECORD_ID_NAME = "id"
+
+    # Record tags
+    TAG_NAMES = {"~schema_name", "~schema_version", "~attributes_digest", "~schema_id"}
+
+    def __init__(
+        self,
+        *,
+        id: str = None,
+        schema_name: str = None,
+        schema_version: str = None,
+        attributes: typing.List[str] = None,
+        attributes_digest: str = None,
+        schema_id: str = None,
+        cred_def_id: str = None,
+        state: str = None,
+        **kwargs
+    ):
+        # Pass the identifier and state to parent class
+        super().__init__(id, state, **kwargs)
+
+        self.schema_name = schema_name
+        self.schema_version = schema_version
+        self.attributes = attributes or []
+        self.attributes_digest = attributes_digest or self.digest(self.attributes)
+        self.schema_id = schema_id
+        self.cred_def_id = cred_def_id
+
+    @property
+    def ledger_payload_id(self) -> str:
+        """Accessor for record identifier"""
+        return self._id
+
+    @property
+    def record_value(self) -> dict:
+        """Accessor for JSON record value generated for this transaction record."""
+        return {
+            prop: getattr(self, prop)
+            for prop in (
+                "schema_name",
+                "schema_version",
+                "attributes",
+                "attributes_digest",
+                "schema_id",
+                "cred_def_id",
+            )
+        }
+
+    @staticmethod
+    def digest(attributes: typing.List[str]) -> str:
+        """Digest of the attribute set, independent of order and duplicates
+
+        Args:
+            attributes (typing.List[str]): Schema attributes
+
+        Returns:
+            str: sha256 hex digest
+        """
+        canonical = json.dumps(sorted(set(attributes)))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    @classmethod
+    async def fetch_by_attributes(
+        cls,
+        context: InjectionContext,
+        schema_name: str,
+        schema_version: str,
+        attributes: typing.List[str],
+    ) -> typing.Optional["LedgerPayloadRecord"]:
+        """Fetch registry entry by schema name, version and attribute set
+
+        Args:
+            context (InjectionContext): Injection context to be used.
+            schema_name (str): Schema name
+            schema_version (str): Schema version
+            attributes (typing.List[str]): Schema attributes
+
+        Returns:
+            typing.Optional[LedgerPayloadRecord]: registry entry if available
+        """
+        records = await cls.query(
+            context,
+            {
+                "schema_name": schema_name,
+                "schema_version": schema_version,
+                "attributes_digest": cls.digest(attributes),
+            },
+        )
+        return records[0] if records else None
+
+    @classmethod
+    async def fetch_by_schema_id(
+        cls, context: InjectionContext, schema_id: str
+    ) -> typing.Optional["LedgerPayloadRecord"]:
+        """Fetch registry entry by schema identifier
+
+        Args:
+            context (InjectionContext): Injection context to be used.
+            schema_id (str): Schema identifier
+
+        Returns:
+            typing.Optional[LedgerPayloadRecord]: registry entry if available
+        """
+        records = await cls.query(context, {"schema_id": schema_id})
+        return records[0] if records else None
+
+
+class LedgerPayloadRecordSchema(BaseRecordSchema):
+    """Ledger payload record schema"""
+
+    class Meta:
+        model_class = LedgerPayloadRecord
+        unknown = EXCLUDE
+
+    ledger_payload_id = fields.Str()
+    schema_name = fields.Str()
+    schema_version = fields.Str()
+    attributes = fields.List(fields.Str())
+    attributes_digest = fields.Str()
+    schema_id = fields.Str()
+    cred_def_id = fields.Str(allow_none=True)
@@ -0,0 +1,41 @@
+from aries_cloudagent.config.injection_context import InjectionContext
+from aries_cloudagent.storage.base import BaseStorage
+from aries_cloudagent.storage.basic import BasicStorage
+from asynctest import TestCase as AsyncTestCase
+
+from ..ledger_payload_record import LedgerPayloadRecord
+
+
+class TestLedgerPayloadRecord(AsyncTestCase):
+    """Test ledger payload record"""
+
+    def setUp(self):
+        self.storage = BasicStorage()
+        self.context = InjectionContext()
+        self.context.injector.bind_instance(BaseStorage, self.storage)
+
+    async def test_fetch_by_attributes(self):
+        """Test registry entry is found irrespective of attribute order"""
+
+        record = LedgerPayloadRecord(
+            schema_name="Issue medical records",
+            schema_version="1.0.0",
+            attributes=["name", "age"],
+            schema_id="schema-1",
+            cred_def_id="cred-def-1",
+        )
+        await record.save(self.context)
+
+        fetched = await LedgerPayloadRecord.fetch_by_attributes(
+            self.context, "Issue medical records", "1.0.0", ["age", "name", "age"]
+        )
+        assert fetched.cred_def_id == "cred-def-1"
+
+        # Attribute set changed
+        fetched = await LedgerPayloadRecord.fetch_by_attributes(
+            self.context, "Issue medical records", "1.0.0", ["age"]
+        )
+        assert fetched is None
+
+        fetched = await LedgerPayloadRecord.fetch_by_schema_id(self.context, "schema-1")
+        assert fetched.ledger_payload_id == record.ledger_payload_id
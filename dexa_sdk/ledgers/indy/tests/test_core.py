@@ -0,0 +1,54 @@
+from aries_cloudagent.config.injection_context import InjectionContext
+from aries_cloudagent.storage.base import BaseStorage
+from aries_cloudagent.storage.basic import BasicStorage
+from asynctest import TestCase as AsyncTestCase
+from asynctest import mock as async_mock
+
+from .. import core as test_module
+
+
+class TestIndyLedgerCore(AsyncTestCase):
+    """Test indy ledger functions"""
+
+    def setUp(self):
+        self.storage = BasicStorage()
+        self.context = InjectionContext()
+        self.context.injector.bind_instance(BaseStorage, self.storage)
+
+    async def test_ledger_payloads_reused(self):
+        """Test schema and credential definition are written once"""
+
+        with async_mock.patch.object(
+            test_module,
+            "create_schema_def_and_anchor_to_ledger",
+            async_mock.CoroutineMock(return_value=("schema-1", {})),
+        ) as create_schema, async_mock.patch.object(
+            test_module,
+            "create_cred_def_and_anchor_to_ledger",
+            async_mock.CoroutineMock(return_value=("cred-def-1", {}, True)),
+        ) as create_cred_def:
+
+            for attributes in (["name", "age"], ["age", "name"]):
+                (
+                    schema_id,
+                    cred_def_id,
+                ) = await test_module.fetch_or_create_ledger_payloads(
+                    self.context, "Issue medical records", "1.0.0", attributes
+                )
+                assert (schema_id, cred_def_id) == ("schema-1", "cred-def-1")
+
+            # Republish with schema identifier
+            (
+                schema_id,
+                cred_def_id,
+            ) = await test_module.fetch_or_create_ledger_payloads(
+                self.context,
+                "Issue medical records",
+                "1.0.0",
+                [],
+                schema_id="schema-1",
+            )
+            assert cred_def_id == "cred-def-1"
+
+            assert create_schema.call_count == 1
+            assert create_cred_def.call_count == 1
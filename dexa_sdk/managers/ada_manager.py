@@ -17,7 +17,6 @@ from aries_cloudagent.messaging.agent_message import AgentMessage
 from aries_cloudagent.messaging.decorators.attach_decorator import AttachDecorator
 from aries_cloudagent.messaging.decorators.default import DecoratorSet
 from aries_cloudagent.messaging.decorators.transport_decorator import TransportDecorator
-from aries_cloudagent.messaging.jsonld.create_verify_data import create_verify_data
 from aries_cloudagent.messaging.models.base_record import match_post_filter
 from aries_cloudagent.messaging.responder import BaseResponder
 from aries_cloudagent.protocols.connections.v1_0.manager import (
@@ -46,6 +45,11 @@ from aries_cloudagent.transport.pack_format import BaseWireFormat, PackWireForma
 from aries_cloudagent.utils.task_queue import CompletedTask, PendingTask
 from aries_cloudagent.wallet.base import BaseWallet, DIDInfo
 from aries_cloudagent.wallet.indy import IndyWallet
+from dexa_sdk.agent.core.task_lanes import LANE_BACKGROUND, TaskLanes
+from dexa_sdk.agent.workers.coordinator import (
+    JOB_ANCHOR_OUTBOX_ENTRY,
+    WorkerCoordinator,
+)
 from dexa_sdk.agreements.da.v1_0.models.da_instance_models import (
     DataAgreementInstanceModel,
 )
@@ -89,12 +93,13 @@ from dexa_sdk.data_controller.records.connection_controller_details_record impor
 from dexa_sdk.data_controller.records.controller_details_record import (
     ControllerDetailsRecord,
 )
-from dexa_sdk.did_mydata.core import DIDMyDataBuilder
-from dexa_sdk.ledgers.ethereum.core import EthereumClient
-from dexa_sdk.ledgers.indy.core import (
-    create_cred_def_and_anchor_to_ledger,
-    create_schema_def_and_anchor_to_ledger,
-)
+from dexa_sdk.did_mydata.core import DIDMyDataBuilder, DidMyData
+from dexa_sdk.did_mydata.exceptions import InvalidDidMyDataException
+from dexa_sdk.jsonld.core import jsonld_context_fingerprint, load_credential_suite
+from dexa_sdk.ledgers.ethereum.loader import inject_ethereum_client, to_json
+from dexa_sdk.ledgers.ethereum.records.anchor_outbox_record import AnchorOutboxRecord
+from dexa_sdk.ledgers.indy.core import fetch_or_create_ledger_payloads
+from dexa_sdk.ledgers.indy.records.ledger_payload_record import LedgerPayloadRecord
 from dexa_sdk.marketplace.records.marketplace_connection_record import (
     MarketplaceConnectionRecord,
 )
@@ -104,9 +109,15 @@ from dexa_sdk.utils import (
     drop_none_dict,
     fetch_org_details_from_intermediary,
     generate_firebase_dynamic_link,
+    iter_records,
     paginate,
     paginate_records,
 )
+from dexa_sdk.utils.executor_pools import (
+    POOL_CANONICALISATION,
+    POOL_HTTP_SYNC,
+    run_in_pool,
+)
 from loguru import logger
 from marshmallow.exceptions import ValidationError
 from mydata_did.patched_protocols.present_proof.v1_0.manager import PresentationManager
@@ -167,7 +178,10 @@ from mydata_did.v1_0.models.fetch_preferences_response_model import (
 )
 from mydata_did.v1_0.models.update_preferences_model import UpdatePreferencesBodyModel
 from mydata_did.v1_0.utils.util import bool_to_str, str_to_bool
-from web3._utils.encoding import to_json
+
+
+# Webhook topic for bulk data agreement template publication progress
+DA_TEMPLATE_BULK_PUBLISH_WEBHOOK_TOPIC = "da_template_bulk_publish"
 
 
 class V2ADAManagerError(BaseError):
@@ -314,29 +328,18 @@ class V2ADAManager:
             == DataAgreementTemplateRecord.METHOD_OF_USE_DATA_SOURCE
         ):
 
-            # Create schema if not existing
-            if not schema_id:
-                data_agreement = template_record.data_agreement
-                # Schema name
-                schema_name = data_agreement.get("purpose")
-                # Schema version
-                schema_version = data_agreement.get("version")
-                # Schema attributes
-                attributes = [
-                    personal_data.attribute_name for personal_data in pd_records
-                ]
-                # Creata schema and anchor to ledger
-                (schema_id, schema_def) = await create_schema_def_and_anchor_to_ledger(
-                    context=self.context,
-                    schema_name=schema_name,
-                    schema_version=schema_version,
-                    attributes=attributes,
-                )
-
-            # Create credential definition and anchor to ledger
+            data_agreement = template_record.data_agreement
 
-            (cred_def_id, cred_def, novel) = await create_cred_def_and_anchor_to_ledger(
-                context=self.context, schema_id=schema_id
+            # Schema and credential definition are reused if the
+            # attributes are unchanged, written to ledger otherwise.
+            (schema_id, cred_def_id) = await fetch_or_create_ledger_payloads(
+                context=self.context,
+                schema_name=data_agreement.get("purpose"),
+                schema_version=data_agreement.get("version"),
+                attributes=[
+                    personal_data.attribute_name for personal_data in pd_records or []
+                ],
+                schema_id=schema_id,
             )
 
             template_record.cred_def_id = cred_def_id
@@ -578,10 +581,27 @@ class V2ADAManager:
 
         record: DataAgreementTemplateRecord = records[0]
 
-        await record.publish_template(self.context)
-
         pd_records = await record.fetch_personal_data_records(self.context)
 
+        return await self.publish_da_template_record(record, pd_records)
+
+    async def publish_da_template_record(
+        self,
+        record: DataAgreementTemplateRecord,
+        pd_records: typing.List[PersonalDataRecord],
+    ) -> DataAgreementTemplateRecord:
+        """Publish data agreement template record and create ledger payloads.
+
+        Args:
+            record (DataAgreementTemplateRecord): Template record
+            pd_records (typing.List[PersonalDataRecord]): Personal data records
+
+        Returns:
+            DataAgreementTemplateRecord: Template record.
+        """
+
+        await record.publish_template(self.context)
+
         # Create ledger payloads
         record = await self.create_and_store_ledger_payloads_for_da_template(
             template_record=record, pd_records=pd_records, schema_id=record.schema_id
@@ -589,6 +609,110 @@ class V2ADAManager:
 
         return record
 
+    async def bulk_publish_da_templates_in_wallet(
+        self,
+        template_ids: typing.List[str],
+        concurrency: int = 5,
+        bulk_id: str = None,
+    ) -> typing.List[dict]:
+        """Publish data agreement templates with bounded concurrency.
+
+        Templates are grouped by the ledger payloads they need. Groups are
+        published concurrently, hence ledger writes are pipelined. Templates
+        within a group are published one after another, so the schema and
+        credential definition are written once and reused by the rest.
+        Progress is reported per template through webhooks.
+
+        Args:
+            template_ids (typing.List[str]): Template identifiers
+            concurrency (int, optional): Groups published concurrently. Defaults to 5.
+            bulk_id (str, optional): Identifier for the bulk publication.
+
+        Returns:
+            typing.List[dict]: Publication result per template
+        """
+
+        bulk_id = bulk_id or str(uuid.uuid4())
+        total = len(template_ids)
+        results = []
+
+        responder: BaseResponder = await self.context.inject(
+            BaseResponder, required=False
+        )
+
+        async def report(template_id: str, state: str, error: str = None) -> None:
+            result = {
+                "bulk_id": bulk_id,
+                "template_id": template_id,
+                "state": state,
+                "error": error,
+            }
+            results.append(result)
+
+            if responder:
+                await responder.send_webhook(
+                    DA_TEMPLATE_BULK_PUBLISH_WEBHOOK_TOPIC,
+                    {**result, "completed": len(results), "total": total},
+                )
+
+        # Group the templates by ledger payloads
+        groups: typing.Dict[typing.Any, list] = {}
+        for template_id in dict.fromkeys(template_ids):
+            tag_filter = {
+                "delete_flag": bool_to_str(False),
+                "publish_flag": bool_to_str(False),
+                "latest_version_flag": bool_to_str(True),
+                "template_id": template_id,
+            }
+            records = await DataAgreementTemplateRecord.query(
+                context=self.context, tag_filter=tag_filter
+            )
+
+            if not records:
+                await report(
+                    template_id, "failed", "Data agreement template not found."
+                )
+                continue
+
+            record: DataAgreementTemplateRecord = records[0]
+            pd_records = await record.fetch_personal_data_records(self.context)
+
+            if (
+                record.method_of_use
+                == DataAgreementTemplateRecord.METHOD_OF_USE_DATA_SOURCE
+            ):
+                data_agreement = record.data_agreement
+                group_key = record.schema_id or (
+                    data_agreement.get("purpose"),
+                    data_agreement.get("version"),
+                    LedgerPayloadRecord.digest(
+                        [pd_record.attribute_name for pd_record in pd_records]
+                    ),
+                )
+            else:
+                # No ledger writes
+                group_key = template_id
+
+            groups.setdefault(group_key, []).append((record, pd_records))
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def publish_group(group: list) -> None:
+            async with semaphore:
+                for (record, pd_records) in group:
+                    try:
+                        await self.publish_da_template_record(record, pd_records)
+                        await report(record.template_id, "published")
+                    except Exception as err:
+                        self._logger.info(
+                            f"Failed to publish template {record.template_id}: {err}"
+                        )
+                        await report(record.template_id, "failed", str(err))
+
+        await asyncio.gather(*[publish_group(group) for group in groups.values()])
+
+        return results
+
     async def update_and_store_da_template_in_wallet(
         self,
         template_id: str,
@@ -1176,86 +1300,168 @@ class V2ADAManager:
 
         da_instances_with_permissions = []
         for record in records:
-            record_dict = record.serialize()
-            record_dict.update({"permissions": []})
-            record_dict.update({"org_prefs": []})
-
-            # Fetch permissions for the DA instance.
-            permissions: typing.List[
-                DAInstancePermissionRecord
-            ] = await DAInstancePermissionRecord.query(
-                self.context, {"instance_id": record.instance_id}
+            da_instances_with_permissions.append(
+                await self.serialize_da_instance_with_permissions(record)
             )
 
-            permissions = sorted(permissions, key=lambda k: k.updated_at, reverse=True)
+        paginate_result = paginate(da_instances_with_permissions, page, page_size)
+
+        return paginate_result
+
+    async def serialize_da_instance_with_permissions(
+        self, record: DataAgreementInstanceRecord
+    ) -> dict:
+        """Serialise data agreement instance with permissions and org preferences
+
+        Args:
+            record (DataAgreementInstanceRecord): Data agreement instance record
+
+        Returns:
+            dict: Serialised data agreement instance
+        """
+        record_dict = record.serialize()
+        record_dict.update({"permissions": []})
+        record_dict.update({"org_prefs": []})
+
+        # Fetch permissions for the DA instance.
+        permissions: typing.List[
+            DAInstancePermissionRecord
+        ] = await DAInstancePermissionRecord.query(
+            self.context, {"instance_id": record.instance_id}
+        )
+
+        permissions = sorted(permissions, key=lambda k: k.updated_at, reverse=True)
 
-            for permission in permissions:
-                # Update permissions list for DDA instance.
-                record_dict["permissions"].append(permission.serialize())
+        for permission in permissions:
+            # Update permissions list for DDA instance.
+            record_dict["permissions"].append(permission.serialize())
 
-            da_instances_with_permissions.append(record_dict)
+        if record.third_party_data_sharing == bool_to_str(True):
+            # DA tempate ID
+            da_template_id = record.template_id
 
-            if record.third_party_data_sharing == bool_to_str(True):
-                # DA tempate ID
-                da_template_id = record.template_id
+            # Fetch DDA template ID matching DA template ID
+            dda_template_tag_filter: dict = {
+                "delete_flag": bool_to_str(False),
+                "da_template_id": da_template_id,
+                "latest_version_flag": bool_to_str(True),
+            }
+            dda_template_record: typing.List[
+                DataDisclosureAgreementTemplateRecord
+            ] = await DataDisclosureAgreementTemplateRecord.query(
+                self.context, dda_template_tag_filter
+            )
 
-                # Fetch DDA template ID matching DA template ID
-                dda_template_tag_filter: dict = {
-                    "delete_flag": bool_to_str(False),
-                    "da_template_id": da_template_id,
-                    "latest_version_flag": bool_to_str(True),
-                }
-                dda_template_record: typing.List[
-                    DataDisclosureAgreementTemplateRecord
-                ] = await DataDisclosureAgreementTemplateRecord.query(
-                    self.context, dda_template_tag_filter
+            if dda_template_record:
+                # Fetch DDA instances by DDA template.
+                dda_instances: typing.List[
+                    DataDisclosureAgreementInstanceRecord
+                ] = await DataDisclosureAgreementInstanceRecord.query(
+                    self.context,
+                    {
+                        "template_id": dda_template_record[0].template_id,
+                        "state": DataDisclosureAgreementInstanceRecord.STATE_CAPTURE,
+                    },
                 )
 
-                if dda_template_record:
-                    # Fetch DDA instances by DDA template.
-                    dda_instances: typing.List[
-                        DataDisclosureAgreementInstanceRecord
-                    ] = await DataDisclosureAgreementInstanceRecord.query(
-                        self.context,
-                        {
-                            "template_id": dda_template_record[0].template_id,
-                            "state": DataDisclosureAgreementInstanceRecord.STATE_CAPTURE,
-                        },
+                for dda_instance in dda_instances:
+
+                    dda_instance_permission_record = (
+                        await DDAInstancePermissionRecord.get_permission(
+                            self.context, dda_instance.instance_id
+                        )
                     )
 
-                    for dda_instance in dda_instances:
+                    # Check DDA instance is active.
+                    if (
+                        dda_instance_permission_record
+                        and dda_instance_permission_record.state
+                        != DDAInstancePermissionRecord.STATE_DEACTIVATE
+                        or (not dda_instance_permission_record)
+                    ):
 
-                        dda_instance_permission_record = (
-                            await DDAInstancePermissionRecord.get_permission(
-                                self.context, dda_instance.instance_id
+                        # Fetch Individual preferences for this DDA instance.
+                        third_party_da_preference_record = (
+                            await ThirdParyDAPreferenceRecord.get_preference(
+                                self.context,
+                                dda_instance.instance_id,
+                                record.instance_id,
                             )
                         )
 
-                        # Check DDA instance is active.
-                        if (
-                            dda_instance_permission_record
-                            and dda_instance_permission_record.state
-                            != DDAInstancePermissionRecord.STATE_DEACTIVATE
-                            or (not dda_instance_permission_record)
-                        ):
-
-                            # Fetch Individual preferences for this DDA instance.
-                            third_party_da_preference_record = (
-                                await ThirdParyDAPreferenceRecord.get_preference(
-                                    self.context,
-                                    dda_instance.instance_id,
-                                    record.instance_id,
-                                )
+                        if third_party_da_preference_record:
+                            record_dict["org_prefs"].append(
+                                third_party_da_preference_record.serialize()
                             )
 
-                            if third_party_da_preference_record:
-                                record_dict["org_prefs"].append(
-                                    third_party_da_preference_record.serialize()
-                                )
+        return record_dict
 
-        paginate_result = paginate(da_instances_with_permissions, page, page_size)
+    async def stream_data_agreement_instances(
+        self,
+        instance_id: str = None,
+        template_id: str = None,
+        template_version: str = None,
+        method_of_use: str = None,
+        third_party_data_sharing: str = None,
+        data_ex_id: str = None,
+        data_subject_did: str = None,
+        page_size: int = 100,
+    ) -> typing.AsyncIterator[dict]:
+        """Stream data agreement instances with the permissions, in storage order
 
-        return paginate_result
+        Args:
+            instance_id (str, optional): Instance identifier
+            template_id (str, optional): Template identifier
+            template_version (str, optional): Template version
+            method_of_use (str, optional): Method of use
+            third_party_data_sharing (str, optional): Third party data sharing
+            data_ex_id (str, optional): Data exchange id
+            data_subject_did (str, optional): Data subject did
+            page_size (int, optional): Records fetched at a time. Defaults to 100.
+
+        Returns:
+            typing.AsyncIterator[dict]: Serialised data agreement instances
+        """
+        # Query by version is only possible if the template id is provided
+        if template_version:
+            assert template_id, "Template identifier is required to query by version"
+
+        # Tag filter
+        tag_filter = {
+            "instance_id": instance_id,
+            "template_id": template_id,
+            "template_version": template_version,
+            "method_of_use": method_of_use,
+            "third_party_data_sharing": third_party_data_sharing,
+            "data_ex_id": data_ex_id,
+            "data_subject_did": data_subject_did,
+        }
+
+        tag_filter = drop_none_dict(tag_filter)
+
+        async for record in iter_records(
+            self.context, DataAgreementInstanceRecord, tag_filter, page_size
+        ):
+            yield await self.serialize_da_instance_with_permissions(record)
+
+    async def stream_da_instance_permissions(
+        self, instance_id: str = None, page_size: int = 100
+    ) -> typing.AsyncIterator[dict]:
+        """Stream data agreement instance permissions, in storage order
+
+        Args:
+            instance_id (str, optional): Instance identifier
+            page_size (int, optional): Records fetched at a time. Defaults to 100.
+
+        Returns:
+            typing.AsyncIterator[dict]: Serialised permissions
+        """
+        tag_filter = drop_none_dict({"instance_id": instance_id})
+
+        async for record in iter_records(
+            self.context, DAInstancePermissionRecord, tag_filter, page_size
+        ):
+            yield record.serialize()
 
     async def delete_da_instance_by_data_ex_id(self, cred_ex_id: str) -> None:
         """Delete da instance by cred ex id.
@@ -1280,7 +1486,13 @@ class V2ADAManager:
         completed_task: CompletedTask = args[0]
 
         # Obtain the results from the task.
-        (instance_id, mydata_did, tx_hash, tx_receipt) = completed_task.task.result()
+        (
+            instance_id,
+            mydata_did,
+            tx_hash,
+            tx_receipt,
+            outbox_record,
+        ) = completed_task.task.result()
 
         tag_filter = {"instance_id": instance_id}
 
@@ -1323,66 +1535,148 @@ class V2ADAManager:
 
         await self.send_reply_message(message, connection_record.connection_id)
 
-    async def anchor_da_instance_to_blockchain_async_task(self, instance_id: str):
+        # Anchoring is complete, not to be resumed on restart.
+        await outbox_record.mark_completed(self.context)
+
+    async def anchor_da_instance_to_blockchain_async_task(
+        self, instance_id: str, outbox_record: AnchorOutboxRecord = None
+    ):
         """Async task to anchor da instance to blockchain.
 
         Args:
             instance_id (str): Instance id
+            outbox_record (AnchorOutboxRecord, optional): Outbox entry to be resumed.
         """
+
+        # Persist the anchoring before submission, resumed if agent restarts.
+        if not outbox_record:
+            outbox_record = await AnchorOutboxRecord.create_entry(
+                self.context, AnchorOutboxRecord.KIND_DA_INSTANCE, instance_id
+            )
+
+            # Anchored by the leader, if running in worker processes
+            if await self.submit_anchor_outbox_job(outbox_record):
+                return
+
         pending_task = await self.add_task(
             self.context,
-            self.anchor_da_instance_to_blockchain(instance_id),
+            self.anchor_da_instance_to_blockchain(instance_id, outbox_record),
             self.anchor_da_instance_to_blockchain_async_task_callback,
         )
         self._logger.info(pending_task)
 
-    async def long_running(self, blocking_func, *args):
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, functools.partial(blocking_func, *args))
-
-    async def anchor_da_instance_to_blockchain(self, instance_id: str) -> None:
+    async def anchor_da_instance_to_blockchain(
+        self, instance_id: str, outbox_record: AnchorOutboxRecord
+    ) -> None:
         """Anchor da instance to blockchain.
 
         Args:
             instance_id (str): Instance id
+            outbox_record (AnchorOutboxRecord): Outbox entry for the anchoring
         """
 
-        eth_client: EthereumClient = await self.context.inject(EthereumClient)
+        # Entry is left pending for recovery if it fails before submission
+        try:
+            eth_client = await inject_ethereum_client(self.context)
 
-        tag_filter = {"instance_id": instance_id}
+            tag_filter = {"instance_id": instance_id}
 
-        # Fetch data agreement instance record.
-        da_instance_records = await DataAgreementInstanceRecord.query(
-            self.context,
-            tag_filter,
-        )
+            # Fetch data agreement instance record.
+            da_instance_records = await DataAgreementInstanceRecord.query(
+                self.context,
+                tag_filter,
+            )
 
-        assert da_instance_records, "Data agreement instance not found."
+            assert da_instance_records, "Data agreement instance not found."
 
-        da_instance_record: DataAgreementInstanceRecord = da_instance_records[0]
-        da_model: DataAgreementInstanceModel = DataAgreementInstanceModel.deserialize(
-            da_instance_record.data_agreement
-        )
+            da_instance_record: DataAgreementInstanceRecord = da_instance_records[0]
+            da_model: DataAgreementInstanceModel = (
+                DataAgreementInstanceModel.deserialize(
+                    da_instance_record.data_agreement
+                )
+            )
 
-        did_mydata_builder = DIDMyDataBuilder(artefact=da_model)
+            did_mydata_builder = DIDMyDataBuilder(artefact=da_model)
 
-        # (tx_hash, tx_receipt) = await eth_client.emit_da_did(
-        #     did_mydata_builder.mydata_did
-        # )
+            # Fetch the JSONLD context fingerprint, blocking HTTP in its own pool
+            agreement_type = await run_in_pool(
+                self.context,
+                POOL_HTTP_SYNC,
+                jsonld_context_fingerprint,
+                context_type="DataAgreement",
+            )
 
-        task = asyncio.create_task(
-            self.long_running(eth_client.emit_da_did, did_mydata_builder.mydata_did)
-        )
-        while not task.done():
-            await asyncio.sleep(0.05)
+            # Canonicalise the agreement off the event loop
+            mydata_did = await run_in_pool(
+                self.context,
+                POOL_CANONICALISATION,
+                did_mydata_builder.generate_did,
+                "DataAgreement",
+                agreement_type,
+            )
+        except Exception:
+            outbox_record.release()
+            raise
 
-        (tx_hash, tx_receipt) = task.result()
+        try:
+            result = None
+
+            # Transaction was sent before restart, check if it is mined.
+            if outbox_record.tx_hashes:
+                result = await eth_client.find_receipt(outbox_record.tx_hashes)
+
+            if not result:
+                # Submit the transaction and wait for the receipt without blocking
+                result = await eth_client.emit_da_did(
+                    mydata_did,
+                    on_submit=functools.partial(outbox_record.mark_sent, self.context),
+                )
+
+            (tx_hash, tx_receipt) = result
+        except Exception as err:
+            await outbox_record.mark_failed(self.context, str(err))
+            raise
 
         return (
             da_instance_record.instance_id,
-            did_mydata_builder.mydata_did,
+            mydata_did,
             tx_hash,
             tx_receipt,
+            outbox_record,
+        )
+
+    async def resolve_mydata_did(
+        self, mydata_did: str
+    ) -> typing.Union[
+        DataAgreementInstanceRecord, DataDisclosureAgreementInstanceRecord, None
+    ]:
+        """Resolve did:mydata identifier to the local agreement instance.
+
+        Args:
+            mydata_did (str): did:mydata identifier
+
+        Returns:
+            typing.Union[
+                DataAgreementInstanceRecord, DataDisclosureAgreementInstanceRecord, None
+            ]: DA or DDA instance record carrying the identifier, if any.
+        """
+
+        # Validate the identifier before querying the storage.
+        try:
+            DidMyData.parse(mydata_did)
+        except InvalidDidMyDataException as err:
+            raise V2ADAManagerError(f"Failed to resolve did:mydata; Reason: {err}")
+
+        # Look up data agreement instances by tag.
+        da_instance_record = await DataAgreementInstanceRecord.fetch_by_mydata_did(
+            self.context, mydata_did
+        )
+        if da_instance_record:
+            return da_instance_record
+
+        # Look up data disclosure agreement instances by tag.
+        return await DataDisclosureAgreementInstanceRecord.fetch_by_mydata_did(
+            self.context, mydata_did
         )
 
     async def create_data_agreement_qr_code(
@@ -2063,12 +2357,40 @@ class V2ADAManager:
 
         return pagination_result
 
+    async def submit_anchor_outbox_job(self, outbox_record: AnchorOutboxRecord) -> bool:
+        """Submit the anchoring to the shared queue of the worker processes.
+
+        Transactions are signed by the leader worker only, hence nonces of the
+        accounts are allocated by one process.
+
+        Args:
+            outbox_record (AnchorOutboxRecord): Outbox entry
+
+        Returns:
+            bool: True if submitted, False if not running in worker processes
+        """
+        coordinator: WorkerCoordinator = await self.context.inject(
+            WorkerCoordinator, required=False
+        )
+        if not coordinator:
+            return False
+
+        # Claimed by the leader processing the job
+        outbox_record.release()
+
+        await coordinator.submit(
+            JOB_ANCHOR_OUTBOX_ENTRY, {"outbox_id": outbox_record.outbox_id}
+        )
+
+        return True
+
     async def add_task(
         self,
         context: InjectionContext,
         coro: typing.Coroutine,
         task_complete: typing.Callable = None,
         ident: str = None,
+        lane: str = LANE_BACKGROUND,
     ) -> PendingTask:
         """
         Add a new task to the queue, delaying execution if busy.
@@ -2078,10 +2400,19 @@ class V2ADAManager:
             coro: The coroutine to run
             task_complete: A callback to run on completion
             ident: A string identifier for the task
+            lane: Task lane, background by default so inbound messages aren't delayed
 
         Returns: a future resolving to the asyncio task instance once queued
         """
         loop = asyncio.get_event_loop()
+
+        # Queue in the lane, concurrency is limited independently per lane
+        task_lanes: TaskLanes = await context.inject(TaskLanes, required=False)
+        if task_lanes:
+            return task_lanes.put(
+                lane, coro, lambda x: loop.create_task(task_complete(x)), ident
+            )
+
         pack_format: PackWireFormat = await context.inject(
             BaseWireFormat, required=False
         )
@@ -2148,7 +2479,9 @@ class V2ADAManager:
         signature_options_dict = json.loads(signature_options)
 
         # Create normalised data for JSONLD proofs
-        framed, combine_hash = create_verify_data(data_dict, signature_options_dict)
+        framed, combine_hash = load_credential_suite().create_verify_data(
+            data_dict, signature_options_dict
+        )
 
         # Base64 encode framed
         framed_base64_encoded = base64.b64encode(
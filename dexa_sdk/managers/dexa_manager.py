@@ -6,6 +6,7 @@ import typing
 import uuid
 
 import aiohttp
+from aries_cloudagent.cache.base import BaseCache
 from aries_cloudagent.config.injection_context import InjectionContext
 from aries_cloudagent.connections.models.connection_record import ConnectionRecord
 from aries_cloudagent.connections.models.connection_target import ConnectionTarget
@@ -58,6 +59,11 @@ from dexa_protocol.v1_0.models.offer_dda_model import (
 )
 from dexa_protocol.v1_0.models.publish_dda_model import PublishDDAModel
 from dexa_protocol.v1_0.models.request_dda_model import RequestDDAModel
+from dexa_sdk.agent.core.task_lanes import LANE_BACKGROUND, TaskLanes
+from dexa_sdk.agent.workers.coordinator import (
+    JOB_ANCHOR_OUTBOX_ENTRY,
+    WorkerCoordinator,
+)
 from dexa_sdk.agreements.da.v1_0.records.customer_identification_record import (
     CustomerIdentificationRecord,
 )
@@ -98,7 +104,9 @@ from dexa_sdk.data_controller.records.connection_controller_details_record impor
     ConnectionControllerDetailsRecord,
 )
 from dexa_sdk.did_mydata.core import DIDMyDataBuilder
-from dexa_sdk.ledgers.ethereum.core import EthereumClient
+from dexa_sdk.jsonld.core import jsonld_context_fingerprint
+from dexa_sdk.ledgers.ethereum.loader import inject_ethereum_client, to_json
+from dexa_sdk.ledgers.ethereum.records.anchor_outbox_record import AnchorOutboxRecord
 from dexa_sdk.managers.ada_manager import V2ADAManager
 from dexa_sdk.marketplace.records.marketplace_connection_record import (
     MarketplaceConnectionRecord,
@@ -110,9 +118,16 @@ from dexa_sdk.marketplace.records.published_dda_template_record import (
 from dexa_sdk.utils import (
     PaginationResult,
     create_jwt,
+    decode_jwt_claims,
     drop_none_dict,
+    iter_records,
     paginate_records,
 )
+from dexa_sdk.utils.executor_pools import (
+    POOL_CANONICALISATION,
+    POOL_HTTP_SYNC,
+    run_in_pool,
+)
 from dexa_sdk.utils.utils import paginate
 from loguru import logger
 from mydata_did.v1_0.messages.data_controller_details import (
@@ -122,7 +137,6 @@ from mydata_did.v1_0.messages.data_controller_details_response import (
     DataControllerDetailsResponseMessage,
 )
 from mydata_did.v1_0.utils.util import bool_to_str
-from web3._utils.encoding import to_json
 
 
 class DexaManager:
@@ -1041,12 +1055,40 @@ class DexaManager:
             instance_record.instance_id
         )
 
+    async def submit_anchor_outbox_job(self, outbox_record: AnchorOutboxRecord) -> bool:
+        """Submit the anchoring to the shared queue of the worker processes.
+
+        Transactions are signed by the leader worker only, hence nonces of the
+        accounts are allocated by one process.
+
+        Args:
+            outbox_record (AnchorOutboxRecord): Outbox entry
+
+        Returns:
+            bool: True if submitted, False if not running in worker processes
+        """
+        coordinator: WorkerCoordinator = await self.context.inject(
+            WorkerCoordinator, required=False
+        )
+        if not coordinator:
+            return False
+
+        # Claimed by the leader processing the job
+        outbox_record.release()
+
+        await coordinator.submit(
+            JOB_ANCHOR_OUTBOX_ENTRY, {"outbox_id": outbox_record.outbox_id}
+        )
+
+        return True
+
     async def add_task(
         self,
         context: InjectionContext,
         coro: typing.Coroutine,
         task_complete: typing.Callable = None,
         ident: str = None,
+        lane: str = LANE_BACKGROUND,
     ) -> PendingTask:
         """
         Add a new task to the queue, delaying execution if busy.
@@ -1056,10 +1098,19 @@ class DexaManager:
             coro: The coroutine to run
             task_complete: A callback to run on completion
             ident: A string identifier for the task
+            lane: Task lane, background by default so inbound messages aren't delayed
 
         Returns: a future resolving to the asyncio task instance once queued
         """
         loop = asyncio.get_event_loop()
+
+        # Queue in the lane, concurrency is limited independently per lane
+        task_lanes: TaskLanes = await context.inject(TaskLanes, required=False)
+        if task_lanes:
+            return task_lanes.put(
+                lane, coro, lambda x: loop.create_task(task_complete(x)), ident
+            )
+
         pack_format: PackWireFormat = await context.inject(
             BaseWireFormat, required=False
         )
@@ -1068,69 +1119,113 @@ class DexaManager:
             task, lambda x: loop.create_task(task_complete(x)), ident
         )
 
-    async def anchor_dda_instance_to_blockchain_async_task(self, instance_id: str):
+    async def anchor_dda_instance_to_blockchain_async_task(
+        self, instance_id: str, outbox_record: AnchorOutboxRecord = None
+    ):
         """Async task to anchor DDA instance to blockchain.
 
         Args:
             instance_id (str): Instance id
+            outbox_record (AnchorOutboxRecord, optional): Outbox entry to be resumed.
         """
+
+        # Persist the anchoring before submission, resumed if agent restarts.
+        if not outbox_record:
+            outbox_record = await AnchorOutboxRecord.create_entry(
+                self.context, AnchorOutboxRecord.KIND_DDA_INSTANCE, instance_id
+            )
+
+            # Anchored by the leader, if running in worker processes
+            if await self.submit_anchor_outbox_job(outbox_record):
+                return
+
         pending_task = await self.add_task(
             self.context,
-            self.anchor_dda_instance_to_blockchain(instance_id),
+            self.anchor_dda_instance_to_blockchain(instance_id, outbox_record),
             self.anchor_dda_instance_to_blockchain_async_task_callback,
         )
         self._logger.info(pending_task)
 
-    async def anchor_dda_instance_to_blockchain(self, instance_id: str) -> None:
+    async def anchor_dda_instance_to_blockchain(
+        self, instance_id: str, outbox_record: AnchorOutboxRecord
+    ) -> None:
         """Anchor DDA instance to blockchain.
 
         Args:
             instance_id (str): Instance id
+            outbox_record (AnchorOutboxRecord): Outbox entry for the anchoring
         """
 
-        eth_client: EthereumClient = await self.context.inject(EthereumClient)
+        # Entry is left pending for recovery if it fails before submission
+        try:
+            eth_client = await inject_ethereum_client(self.context)
 
-        tag_filter = {"instance_id": instance_id}
+            tag_filter = {"instance_id": instance_id}
 
-        # Fetch DDA instance record.
-        dda_instance_records = await DataDisclosureAgreementInstanceRecord.query(
-            self.context,
-            tag_filter,
-        )
+            # Fetch DDA instance record.
+            dda_instance_records = await DataDisclosureAgreementInstanceRecord.query(
+                self.context,
+                tag_filter,
+            )
 
-        assert dda_instance_records, "Data agreement instance not found."
+            assert dda_instance_records, "Data agreement instance not found."
 
-        dda_instance_record: DataDisclosureAgreementInstanceRecord = (
-            dda_instance_records[0]
-        )
-        dda_model: DataDisclosureAgreementInstanceModel = (
-            DataDisclosureAgreementInstanceModel.deserialize(
-                dda_instance_record.data_disclosure_agreement
+            dda_instance_record: DataDisclosureAgreementInstanceRecord = (
+                dda_instance_records[0]
+            )
+            dda_model: DataDisclosureAgreementInstanceModel = (
+                DataDisclosureAgreementInstanceModel.deserialize(
+                    dda_instance_record.data_disclosure_agreement
+                )
             )
-        )
 
-        did_mydata_builder = DIDMyDataBuilder(artefact=dda_model)
+            did_mydata_builder = DIDMyDataBuilder(artefact=dda_model)
 
-        # (tx_hash, tx_receipt) = await eth_client.emit_dda_did(
-        #     did_mydata_builder.generate_did("DataDisclosureAgreement")
-        # )
+            # Fetch the JSONLD context fingerprint, blocking HTTP in its own pool
+            agreement_type = await run_in_pool(
+                self.context,
+                POOL_HTTP_SYNC,
+                jsonld_context_fingerprint,
+                context_type="DataDisclosureAgreement",
+            )
 
-        task = asyncio.create_task(
-            self.long_running(
-                eth_client.emit_dda_did,
-                did_mydata_builder.generate_did("DataDisclosureAgreement"),
+            # Canonicalise the agreement off the event loop
+            mydata_did = await run_in_pool(
+                self.context,
+                POOL_CANONICALISATION,
+                did_mydata_builder.generate_did,
+                "DataDisclosureAgreement",
+                agreement_type,
             )
-        )
-        while not task.done():
-            await asyncio.sleep(0.05)
+        except Exception:
+            outbox_record.release()
+            raise
+
+        try:
+            result = None
+
+            # Transaction was sent before restart, check if it is mined.
+            if outbox_record.tx_hashes:
+                result = await eth_client.find_receipt(outbox_record.tx_hashes)
+
+            if not result:
+                # Submit the transaction and wait for the receipt without blocking
+                result = await eth_client.emit_dda_did(
+                    mydata_did,
+                    on_submit=functools.partial(outbox_record.mark_sent, self.context),
+                )
 
-        (tx_hash, tx_receipt) = task.result()
+            (tx_hash, tx_receipt) = result
+        except Exception as err:
+            await outbox_record.mark_failed(self.context, str(err))
+            raise
 
         return (
             dda_instance_record.instance_id,
-            did_mydata_builder.mydata_did,
+            mydata_did,
             tx_hash,
             tx_receipt,
+            outbox_record,
         )
 
     async def anchor_dda_instance_to_blockchain_async_task_callback(
@@ -1142,7 +1237,13 @@ class DexaManager:
         completed_task: CompletedTask = args[0]
 
         # Obtain the results from the task.
-        (instance_id, mydata_did, tx_hash, tx_receipt) = completed_task.task.result()
+        (
+            instance_id,
+            mydata_did,
+            tx_hash,
+            tx_receipt,
+            outbox_record,
+        ) = completed_task.task.result()
 
         tag_filter = {"instance_id": instance_id}
 
@@ -1190,6 +1291,9 @@ class DexaManager:
         # Send message
         await mgr.send_reply_message(message, connection_record.connection_id)
 
+        # Anchoring is complete, not to be resumed on restart.
+        await outbox_record.mark_completed(self.context)
+
     async def query_dda_instances(
         self,
         instance_id: str,
@@ -1420,42 +1524,76 @@ class DexaManager:
         connection_record: ConnectionRecord,
         jwt: str,
         nonce: str,
+        outbox_record: AnchorOutboxRecord = None,
     ):
         """Add token to blockchain async task"""
 
+        # Persist the anchoring before submission, resumed if agent restarts.
+        if not outbox_record:
+            outbox_record = await AnchorOutboxRecord.create_entry(
+                self.context,
+                AnchorOutboxRecord.KIND_ACCESS_TOKEN,
+                nonce,
+                payload={
+                    "connection_id": connection_record.connection_id,
+                    "jwt": jwt,
+                    "nonce": nonce,
+                },
+            )
+
+            # Anchored by the leader, if running in worker processes
+            if await self.submit_anchor_outbox_job(outbox_record):
+                return
+
         pending_task = await self.add_task(
             self.context,
-            self.add_token_to_blockchain(connection_record, jwt, nonce),
+            self.add_token_to_blockchain(connection_record, jwt, nonce, outbox_record),
             self.add_token_to_blockchain_async_task_callback,
         )
         self._logger.info(pending_task)
 
-    async def long_running(self, blocking_func, *args):
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, functools.partial(blocking_func, *args))
-
     async def add_token_to_blockchain(
-        self, connection_record: ConnectionRecord, jwt: str, nonce: str
+        self,
+        connection_record: ConnectionRecord,
+        jwt: str,
+        nonce: str,
+        outbox_record: AnchorOutboxRecord,
     ) -> None:
         """Add token to blockchain"""
 
-        eth_client: EthereumClient = await self.context.inject(EthereumClient)
-
-        task = asyncio.create_task(
-            self.long_running(eth_client.add_access_token, nonce, jwt)
-        )
-        while not task.done():
-            await asyncio.sleep(0.05)
-
-        (tx_hash, tx_receipt) = task.result()
+        # Entry is left pending for recovery if it fails before submission
+        try:
+            eth_client = await inject_ethereum_client(self.context)
+        except Exception:
+            outbox_record.release()
+            raise
+
+        try:
+            result = None
+
+            # Transaction was sent before restart, check if it is mined.
+            if outbox_record.tx_hashes:
+                result = await eth_client.find_receipt(outbox_record.tx_hashes)
+
+            if not result:
+                # Submit the transaction and wait for the receipt without blocking
+                result = await eth_client.add_access_token(
+                    nonce,
+                    jwt,
+                    on_submit=functools.partial(outbox_record.mark_sent, self.context),
+                )
 
-        # (tx_hash, tx_receipt) = eth_client.add_access_token(nonce, jwt)
+            (tx_hash, tx_receipt) = result
+        except Exception as err:
+            await outbox_record.mark_failed(self.context, str(err))
+            raise
 
         return (
             connection_record,
             nonce,
             tx_hash,
             tx_receipt,
+            outbox_record,
         )
 
     async def add_token_to_blockchain_async_task_callback(self, *args, **kwargs):
@@ -1465,7 +1603,13 @@ class DexaManager:
         completed_task: CompletedTask = args[0]
 
         # Obtain the results from the task.
-        (connection_record, nonce, tx_hash, tx_receipt) = completed_task.task.result()
+        (
+            connection_record,
+            nonce,
+            tx_hash,
+            tx_receipt,
+            outbox_record,
+        ) = completed_task.task.result()
 
         transaction_receipt = json.loads(to_json(tx_receipt))
         transaction_hash = transaction_receipt.get("transactionHash")
@@ -1487,7 +1631,7 @@ class DexaManager:
         mgr = V2ADAManager(self.context)
 
         # Send pull data response message to DUS connection.
-        eth_client: EthereumClient = await self.context.inject(EthereumClient)
+        eth_client = await inject_ethereum_client(self.context)
 
         pulldata_response_message = PullDataResponseMessage(
             ds_eth_address=eth_client.org_account.address, nonce=nonce
@@ -1496,6 +1640,9 @@ class DexaManager:
             pulldata_response_message, connection_record.connection_id
         )
 
+        # Anchoring is complete, not to be resumed on restart.
+        await outbox_record.mark_completed(self.context)
+
     async def send_pulldata_request_message(
         self, instance_id: str, da_template_id: str = None, connection_id: str = None
     ):
@@ -1617,6 +1764,37 @@ class DexaManager:
 
         return paginate_result
 
+    async def stream_pull_data_records(
+        self,
+        *,
+        dda_instance_id: str = None,
+        dda_template_id: str = None,
+        page_size: int = 100,
+    ) -> typing.AsyncIterator[dict]:
+        """Stream pull data records, in storage order.
+
+        Args:
+            dda_instance_id (str, optional): DDA instance ID. Defaults to None.
+            dda_template_id (str, optional): DDA template ID. Defaults to None.
+            page_size (int, optional): Records fetched at a time. Defaults to 100.
+
+        Returns:
+            typing.AsyncIterator[dict]: Serialised pull data records.
+        """
+
+        # Tag filter
+        tag_filter = {
+            "dda_instance_id": dda_instance_id,
+            "dda_template_id": dda_template_id,
+        }
+
+        tag_filter = drop_none_dict(tag_filter)
+
+        async for record in iter_records(
+            self.context, PullDataRecord, tag_filter, page_size
+        ):
+            yield record.serialize()
+
     async def process_pull_data_response_message(
         self, message: PullDataResponseMessage, message_receipt: MessageReceipt
     ):
@@ -1630,18 +1808,38 @@ class DexaManager:
         ds_eth_address = message.ds_eth_address
         nonce = message.nonce
 
-        # Fetch data from ethereum.
-        eth_client: EthereumClient = await self.context.inject(EthereumClient)
+        # Released tokens are cached till they expire
+        cache: BaseCache = await self.context.inject(BaseCache, required=False)
+        cache_key = f"dexa_access_token::{ds_eth_address}::{nonce}"
 
-        packed_token = await eth_client.release_access_token(ds_eth_address, nonce)
+        assert cache, "Cache not available."
 
-        # Fetch wallet from context
-        wallet: IndyWallet = await self.context.inject(BaseWallet)
+        async with cache.acquire(cache_key) as entry:
+            if entry.result:
+                packed_token = entry.result["packed_token"]
+                token = entry.result["token"]
+            else:
+                # Fetch data from ethereum.
+                eth_client = await inject_ethereum_client(self.context)
 
-        # Pack the token.
-        (token, from_verkey, to_verkey) = await wallet.unpack_message(
-            packed_token.encode()
-        )
+                packed_token = await eth_client.release_access_token(
+                    ds_eth_address, nonce
+                )
+
+                # Fetch wallet from context
+                wallet: IndyWallet = await self.context.inject(BaseWallet)
+
+                # Unpack the token.
+                (token, from_verkey, to_verkey) = await wallet.unpack_message(
+                    packed_token.encode()
+                )
+
+                # Cache the token till expiry
+                ttl = decode_jwt_claims(token).get("exp", 0) - int(time.time())
+                if ttl > 0:
+                    await entry.set_result(
+                        {"packed_token": packed_token, "token": token}, ttl
+                    )
 
         # Update pull data record.
 
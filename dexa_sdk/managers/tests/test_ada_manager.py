@@ -1,8 +1,23 @@
+import hashlib
+
 from asynctest import TestCase as AsyncTestCase
+from asynctest import mock as async_mock
 from aries_cloudagent.config.injection_context import InjectionContext
+from aries_cloudagent.messaging.responder import BaseResponder, MockResponder
 from aries_cloudagent.storage.base import BaseStorage
 from aries_cloudagent.storage.basic import BasicStorage
-from ..ada_manager import V2ADAManager
+from dexa_sdk.agreements.da.v1_0.records.da_instance_record import (
+    DataAgreementInstanceRecord,
+)
+from dexa_sdk.did_mydata.core import DidMyData
+from dexa_sdk.ledgers.ethereum.records.anchor_outbox_record import AnchorOutboxRecord
+from dexa_sdk.ledgers.indy import core as indy_core
+from .. import ada_manager as test_module
+from ..ada_manager import (
+    DA_TEMPLATE_BULK_PUBLISH_WEBHOOK_TOPIC,
+    V2ADAManager,
+    V2ADAManagerError,
+)
 
 
 class TestPersonalDataRecord(AsyncTestCase):
@@ -65,3 +80,143 @@ class TestPersonalDataRecord(AsyncTestCase):
         pd_records = await record.fetch_personal_data_records(self.context)
 
         assert len(pd_records) == 1
+
+    async def test_resolve_mydata_did(self):
+        """Test resolve did:mydata identifier to instance record"""
+
+        mydata_did = DidMyData(
+            agreement_type=hashlib.sha256(b"DataAgreement").hexdigest(),
+            agreement_merkle_root=hashlib.sha256(b"merkle root").hexdigest(),
+        ).did
+
+        record = DataAgreementInstanceRecord(
+            instance_id="instance-1",
+            template_id="template-1",
+            template_version="1.0.0",
+            state=DataAgreementInstanceRecord.STATE_CAPTURE,
+            data_agreement={},
+            mydata_did=mydata_did,
+        )
+        await record.save(self.context)
+
+        resolved = await self.manager.resolve_mydata_did(mydata_did)
+
+        assert resolved.instance_id == record.instance_id
+
+        with self.assertRaises(V2ADAManagerError):
+            await self.manager.resolve_mydata_did("did:sov:WgWxqztrNooG92RXvxSTWv")
+
+    async def test_anchor_da_instance_fails_before_submission(self):
+        """Test outbox entry is released if anchoring fails before submission"""
+
+        await DataAgreementInstanceRecord(
+            instance_id="instance-1",
+            template_id="template-1",
+            template_version="1.0.0",
+            state=DataAgreementInstanceRecord.STATE_CAPTURE,
+            data_agreement={},
+        ).save(self.context)
+
+        outbox_record = await AnchorOutboxRecord.create_entry(
+            self.context, AnchorOutboxRecord.KIND_DA_INSTANCE, "instance-1"
+        )
+        assert outbox_record.in_flight
+
+        with async_mock.patch.object(
+            test_module, "inject_ethereum_client", async_mock.CoroutineMock()
+        ), async_mock.patch.object(
+            test_module, "DataAgreementInstanceModel", async_mock.MagicMock()
+        ), async_mock.patch.object(
+            test_module,
+            "run_in_pool",
+            async_mock.CoroutineMock(side_effect=ConnectionError("unreachable")),
+        ):
+            with self.assertRaises(ConnectionError):
+                await self.manager.anchor_da_instance_to_blockchain(
+                    "instance-1", outbox_record
+                )
+
+        # Left pending for recovery, and not claimed by this process anymore
+        assert not outbox_record.in_flight
+        fetched = await AnchorOutboxRecord.retrieve_by_id(
+            self.context, outbox_record.outbox_id
+        )
+        assert fetched.state == AnchorOutboxRecord.STATE_PENDING
+
+    async def test_bulk_publish_da_templates_in_wallet(self):
+        """Test bulk publish reuses ledger payloads and reports progress
+        """
+
+        responder = MockResponder()
+        self.context.injector.bind_instance(BaseResponder, responder)
+
+        da = {
+            "language": "en",
+            "dataControllerName": "Happy Shopping AB",
+            "dataControllerUrl": "https://www.happyshopping.com",
+            "dataPolicy": {
+                "policyUrl": "https://happyshoping.com/privacy-policy/",
+                "jurisdiction": "Sweden",
+                "industrySector": "Retail",
+                "dataRetentionPeriod": 30,
+                "geographicRestriction": "Europe",
+                "storageLocation": "Europe",
+                "thirdPartyDataSharing": False
+            },
+            "purpose": "Issue loyalty card",
+            "purposeDescription": "Issue loyalty card to the customer.",
+            "lawfulBasis": "consent",
+            "methodOfUse": "data-source",
+            "personalData": [
+                {
+                    "attributeName": "Name",
+                    "attributeSensitive": True,
+                    "attributeCategory": "Name",
+                    "attributeDescription": "Name of the individual"
+                }
+            ],
+            "dpia": {
+                "dpiaDate": "2021-05-08T08:41:59+0000",
+                "dpiaSummaryUrl": "https://org.com/dpia_results.html"
+            }
+        }
+
+        # Templates with same purpose, version and attributes
+        template_ids = []
+        for _ in range(2):
+            record = await self.manager.create_and_store_da_template_in_wallet(
+                data_agreement=dict(da),
+                publish_flag=False
+            )
+            template_ids.append(record.template_id)
+
+        with async_mock.patch.object(
+            indy_core,
+            "create_schema_def_and_anchor_to_ledger",
+            async_mock.CoroutineMock(return_value=("schema-1", {}))
+        ) as create_schema, async_mock.patch.object(
+            indy_core,
+            "create_cred_def_and_anchor_to_ledger",
+            async_mock.CoroutineMock(return_value=("cred-def-1", {}, True))
+        ) as create_cred_def:
+
+            results = await self.manager.bulk_publish_da_templates_in_wallet(
+                template_ids + ["template-missing"],
+                bulk_id="bulk-1"
+            )
+
+        states = {result["template_id"]: result["state"] for result in results}
+
+        assert [states[template_id] for template_id in template_ids] == [
+            "published", "published"
+        ]
+        assert states["template-missing"] == "failed"
+
+        # Ledger payloads are written once for the group
+        assert create_schema.call_count == 1
+        assert create_cred_def.call_count == 1
+
+        # Progress reported per template
+        topics = {topic for (topic, _) in responder.webhooks}
+        assert topics == {DA_TEMPLATE_BULK_PUBLISH_WEBHOOK_TOPIC}
+        assert responder.webhooks[-1][1]["completed"] == 3
@@ -1,9 +1,10 @@
 from aries_cloudagent.config.injection_context import InjectionContext
 from aries_cloudagent.messaging.models.base_record import BaseRecord, BaseRecordSchema
+from dexa_sdk.storage.record_versions import VersionedRecordMixin
 from marshmallow import fields
 
 
-class PublishDDARecord(BaseRecord):
+class PublishDDARecord(VersionedRecordMixin, BaseRecord):
     """Publish DDA record."""
 
     class Meta:
@@ -1,10 +1,11 @@
 from aries_cloudagent.config.injection_context import InjectionContext
 from aries_cloudagent.messaging.models.base_record import BaseRecord, BaseRecordSchema
 from dexa_sdk.agreements.dda.v1_0.models.dda_models import DataDisclosureAgreementModel
+from dexa_sdk.storage.record_versions import VersionedRecordMixin
 from marshmallow import fields
 
 
-class PublishedDDATemplateRecord(BaseRecord):
+class PublishedDDATemplateRecord(VersionedRecordMixin, BaseRecord):
     """Published DDA template record."""
 
     class Meta:
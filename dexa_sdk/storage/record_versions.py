@@ -0,0 +1,123 @@
+"""Version counters of the record types, bumped when a record is saved or deleted."""
+
+import hashlib
+import logging
+import typing
+import uuid
+
+from aries_cloudagent.config.injection_context import InjectionContext
+
+LOGGER = logging.getLogger(__name__)
+
+
+class RecordVersions:
+    """Version counter per record type.
+
+    Counters start afresh in every process, an epoch unique to the process
+    is part of the tags so that tags computed before a restart never match.
+    """
+
+    def __init__(self) -> None:
+        """Initialise record versions"""
+
+        # Unique to this process
+        self._epoch = uuid.uuid4().hex
+
+        # Version by record type
+        self._versions: typing.Dict[str, int] = {}
+
+        # Coroutine functions called with the record type on a local bump
+        self._listeners: typing.List[typing.Callable] = []
+
+    def get(self, record_type: str) -> int:
+        """Returns version of the record type
+
+        Args:
+            record_type (str): Record type
+
+        Returns:
+            int: version, 0 if no record of the type was saved yet
+        """
+        return self._versions.get(record_type, 0)
+
+    def add_listener(self, listener: typing.Callable) -> None:
+        """Call the listener on changes made in this process
+
+        Args:
+            listener (typing.Callable): Coroutine function called with the record type
+        """
+        self._listeners.append(listener)
+
+    async def bump(self, record_type: str, notify: bool = True) -> int:
+        """Bump version of the record type
+
+        Args:
+            record_type (str): Record type
+            notify (bool, optional): Notify the listeners. Defaults to True.
+
+        Returns:
+            int: new version
+        """
+        self._versions[record_type] = self.get(record_type) + 1
+
+        if notify:
+            for listener in self._listeners:
+                try:
+                    await listener(record_type)
+                except Exception:
+                    LOGGER.exception("Error notifying change of %s", record_type)
+
+        return self._versions[record_type]
+
+    def tag(self, record_types: typing.Sequence[str], key: str = "") -> str:
+        """Entity tag of a response built from records of the types
+
+        Args:
+            record_types (typing.Sequence[str]): Record types
+            key (str, optional): Response key, for e.g. path and query string
+
+        Returns:
+            str: quoted entity tag
+        """
+        versions = ",".join(
+            f"{record_type}:{self.get(record_type)}" for record_type in record_types
+        )
+        digest = hashlib.sha1(f"{self._epoch}|{versions}|{key}".encode()).hexdigest()
+
+        return f'"{digest}"'
+
+
+class VersionedRecordMixin:
+    """Bumps version of the record type when a record is saved or deleted.
+
+    Mixed into the records listed by the admin API, for e.g. templates, so
+    that the cached list responses are invalidated.
+    """
+
+    async def post_save(self, context: InjectionContext, *args, **kwargs):
+        """Perform post-save actions, bumping the record type version
+
+        Args:
+            context (InjectionContext): The injection context to use
+        """
+        await super().post_save(context, *args, **kwargs)
+        await self.bump_record_version(context)
+
+    async def delete_record(self, context: InjectionContext, *args, **kwargs):
+        """Remove the stored record, bumping the record type version
+
+        Args:
+            context (InjectionContext): The injection context to use
+        """
+        await super().delete_record(context, *args, **kwargs)
+        await self.bump_record_version(context)
+
+    async def bump_record_version(self, context: InjectionContext) -> None:
+        """Bump version of the record type, if versions are tracked
+
+        Args:
+            context (InjectionContext): The injection context to use
+        """
+        versions: RecordVersions = await context.inject(RecordVersions, required=False)
+        if versions:
+            await versions.bump(self.RECORD_TYPE)
@@ -0,0 +1,231 @@
+import asyncio
+import functools
+import threading
+import typing
+from concurrent.futures import ThreadPoolExecutor
+
+from aries_cloudagent.config.injection_context import InjectionContext
+from loguru import logger
+
+# Named pools for blocking work
+POOL_ETHEREUM = "ethereum"
+POOL_CANONICALISATION = "canonicalisation"
+POOL_HTTP_SYNC = "http-sync"
+
+# Default number of threads per pool
+DEFAULT_POOL_WORKERS = {
+    POOL_ETHEREUM: 4,
+    POOL_CANONICALISATION: 2,
+    POOL_HTTP_SYNC: 4,
+}
+
+
+class BoundedExecutor:
+    """Thread pool with a bounded queue.
+
+    Callers beyond the threads and queue slots wait on the event loop,
+    hence a stalled pool doesn't accumulate unbounded work.
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queue: int = None) -> None:
+        """Initialise bounded executor
+
+        Args:
+            name (str): Pool name, used as thread name prefix
+            max_workers (int): Number of threads
+            max_queue (int, optional): Queued calls beyond busy threads.
+                Defaults to 4 times the number of threads.
+        """
+
+        # Pool name
+        self._name = name
+
+        # Number of threads
+        self._max_workers = max_workers
+
+        # Queue slots
+        self._max_queue = max_workers * 4 if max_queue is None else max_queue
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"dexa-{name}"
+        )
+
+        # Bounds calls submitted to the executor, created on first use
+        # so it is bound to the running event loop.
+        self._slots: typing.Optional[asyncio.Semaphore] = None
+
+        # Counters, updated from the pool threads
+        self._lock = threading.Lock()
+        self._waiting = 0
+        self._queued = 0
+        self._busy = 0
+        self._completed = 0
+        self._failed = 0
+
+    @property
+    def name(self) -> str:
+        """Accessor for pool name
+
+        Returns:
+            str: pool name
+        """
+        return self._name
+
+    def _call(self, fn: typing.Callable, *args, **kwargs) -> typing.Any:
+        """Execute the call in pool thread and update counters"""
+        with self._lock:
+            self._queued -= 1
+            self._busy += 1
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException:
+            with self._lock:
+                self._failed += 1
+            raise
+        else:
+            with self._lock:
+                self._completed += 1
+            return result
+        finally:
+            with self._lock:
+                self._busy -= 1
+
+    async def run(self, fn: typing.Callable, *args, **kwargs) -> typing.Any:
+        """Run blocking call in the pool
+
+        Args:
+            fn (typing.Callable): Blocking function
+
+        Returns:
+            typing.Any: return value of the function
+        """
+        if not self._slots:
+            self._slots = asyncio.Semaphore(self._max_workers + self._max_queue)
+
+        # Wait for a free slot if the pool is saturated
+        self._waiting += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self._waiting -= 1
+
+        try:
+            with self._lock:
+                self._queued += 1
+
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(
+                self._executor, functools.partial(self._call, fn, *args, **kwargs)
+            )
+        finally:
+            self._slots.release()
+
+    def metrics(self) -> dict:
+        """Returns pool metrics
+
+        Returns:
+            dict: threads, busy threads, queue depth and call counters
+        """
+        with self._lock:
+            return {
+                "max_workers": self._max_workers,
+                "max_queue": self._max_queue,
+                "busy": self._busy,
+                "queued": self._queued,
+                "waiting": self._waiting,
+                "completed": self._completed,
+                "failed": self._failed,
+            }
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Shutdown the pool
+
+        Args:
+            wait (bool, optional): Wait for running calls. Defaults to False.
+        """
+        self._executor.shutdown(wait=wait)
+
+
+class ExecutorPools:
+    """Named, separately sized executor pools for blocking calls.
+
+    Blocking work is isolated per kind, for e.g. a stalled ethereum node
+    occupies only the ethereum pool.
+    """
+
+    def __init__(self, workers: typing.Dict[str, int] = None) -> None:
+        """Initialise executor pools
+
+        Args:
+            workers (typing.Dict[str, int], optional): Number of threads by pool name.
+                Pools not specified use the defaults.
+        """
+        workers = {**DEFAULT_POOL_WORKERS, **(workers or {})}
+
+        self._pools: typing.Dict[str, BoundedExecutor] = {
+            name: BoundedExecutor(name, max_workers)
+            for name, max_workers in workers.items()
+        }
+
+    def get(self, name: str) -> BoundedExecutor:
+        """Returns pool by name
+
+        Args:
+            name (str): Pool name
+
+        Returns:
+            BoundedExecutor: pool
+        """
+        assert name in self._pools, f"Executor pool '{name}' not found."
+
+        return self._pools[name]
+
+    async def run(self, name: str, fn: typing.Callable, *args, **kwargs) -> typing.Any:
+        """Run blocking call in the named pool
+
+        Args:
+            name (str): Pool name
+            fn (typing.Callable): Blocking function
+
+        Returns:
+            typing.Any: return value of the function
+        """
+        return await self.get(name).run(fn, *args, **kwargs)
+
+    def metrics(self) -> typing.Dict[str, dict]:
+        """Returns metrics of all the pools
+
+        Returns:
+            typing.Dict[str, dict]: pool metrics by name
+        """
+        return {name: pool.metrics() for name, pool in self._pools.items()}
+
+    def shutdown(self) -> None:
+        """Shutdown all the pools"""
+        for pool in self._pools.values():
+            pool.shutdown()
+
+        logger.info("Executor pools shutdown")
+
+
+async def run_in_pool(
+    context: InjectionContext, name: str, fn: typing.Callable, *args, **kwargs
+) -> typing.Any:
+    """Run blocking call in the named pool bound to the injection context.
+
+    Falls back to calling the function directly if pools are not bound.
+
+    Args:
+        context (InjectionContext): Injection context
+        name (str): Pool name
+        fn (typing.Callable): Blocking function
+
+    Returns:
+        typing.Any: return value of the function
+    """
+    pools: ExecutorPools = await context.inject(ExecutorPools, required=False)
+
+    if not pools:
+        return fn(*args, **kwargs)
+
+    return await pools.run(name, fn, *args, **kwargs)
@@ -0,0 +1,126 @@
+"""Import time profile of the agent startup.
+
+Imports the module in a fresh interpreter with `-X importtime`, so that
+modules imported by earlier code are not missed.
+
+Usage:
+    python -m dexa_sdk.utils.import_profile --top 40 > docs/import-profile.txt
+"""
+import argparse
+import subprocess
+import sys
+import typing
+from collections import namedtuple
+
+# Module imported by the agent start command
+STARTUP_MODULE = "dexa_sdk.agent.commands.start"
+
+# Ledger, JSON-LD and Merkle backends, imported on first use
+LAZY_MODULES = ("web3", "eth_account", "pyld", "rdflib", "merklelib")
+
+# Cumulative import time budget of the startup module, in seconds
+STARTUP_IMPORT_BUDGET = 2.5
+
+ImportTiming = namedtuple("ImportTiming", "module self_us cumulative_us depth")
+
+
+def profile_imports(module: str = STARTUP_MODULE) -> typing.List[ImportTiming]:
+    """Import the module in a fresh interpreter and parse the import times
+
+    Args:
+        module (str, optional): Module to import. Defaults to STARTUP_MODULE.
+
+    Returns:
+        typing.List[ImportTiming]: import times, in the order reported
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+
+    timings = []
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line.split(":", 1)[1].split("|")
+        if not self_us.strip().isdigit():
+            continue
+        depth = (len(name) - len(name.lstrip())) // 2
+        timings.append(
+            ImportTiming(name.strip(), int(self_us), int(cumulative_us), depth)
+        )
+
+    return timings
+
+
+def cumulative_time(timings: typing.List[ImportTiming], module: str) -> float:
+    """Cumulative import time of the module
+
+    Args:
+        timings (typing.List[ImportTiming]): import times
+        module (str): Module name
+
+    Returns:
+        float: import time in seconds, 0 if the module was not imported
+    """
+    for timing in timings:
+        if timing.module == module:
+            return timing.cumulative_us / 1e6
+    return 0.0
+
+
+def format_profile(
+    timings: typing.List[ImportTiming], module: str = STARTUP_MODULE, top: int = 30
+) -> str:
+    """Format the slowest top level packages and lazily imported backends
+
+    Args:
+        timings (typing.List[ImportTiming]): import times
+        module (str, optional): Profiled module. Defaults to STARTUP_MODULE.
+        top (int, optional): Number of packages listed. Defaults to 30.
+
+    Returns:
+        str: profile report
+    """
+    # Cumulative time per top level package, of its first import
+    packages = {}
+    for timing in timings:
+        package = timing.module.split(".")[0]
+        if timing.module == package:
+            packages.setdefault(package, timing.cumulative_us)
+
+    lines = [
+        f"Import profile of {module}",
+        f"Total: {cumulative_time(timings, module):.3f} s "
+        f"(budget {STARTUP_IMPORT_BUDGET:.1f} s), {len(timings)} modules",
+        "",
+        "Slowest top level packages (cumulative ms):",
+    ]
+    for package, cumulative_us in sorted(
+        packages.items(), key=lambda item: item[1], reverse=True
+    )[:top]:
+        lines.append(f"  {cumulative_us / 1000:9.1f}  {package}")
+
+    lines.extend(["", "Backends imported on first use:"])
+    for package in LAZY_MODULES:
+        status = "imported on startup" if package in packages else "not imported"
+        lines.append(f"  {package}: {status}")
+
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import time profile")
+    parser.add_argument("--module", default=STARTUP_MODULE, help="Module to import")
+    parser.add_argument("--top", type=int, default=30, help="Packages listed")
+    args = parser.parse_args()
+
+    print(format_profile(profile_imports(args.module), args.module, args.top))
+
+
+if __name__ == "__main__":
+    main()
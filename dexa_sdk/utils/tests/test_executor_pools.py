@@ -0,0 +1,80 @@
+import asyncio
+import threading
+
+from aries_cloudagent.config.injection_context import InjectionContext
+from asynctest import TestCase as AsyncTestCase
+from dexa_sdk.utils.executor_pools import (
+    POOL_CANONICALISATION,
+    POOL_ETHEREUM,
+    BoundedExecutor,
+    ExecutorPools,
+    run_in_pool,
+)
+
+
+class TestExecutorPools(AsyncTestCase):
+    """Test executor pools"""
+
+    async def test_bounded_executor_metrics(self):
+        """Test busy threads and queue depth of the pool"""
+
+        pool = BoundedExecutor("test", max_workers=1, max_queue=1)
+        release = threading.Event()
+
+        calls = [
+            asyncio.ensure_future(pool.run(release.wait)),
+            asyncio.ensure_future(pool.run(release.wait)),
+            asyncio.ensure_future(pool.run(release.wait)),
+        ]
+        await asyncio.sleep(0.1)
+
+        metrics = pool.metrics()
+        assert metrics["busy"] == 1
+        assert metrics["queued"] == 1
+        assert metrics["waiting"] == 1
+
+        release.set()
+        await asyncio.gather(*calls)
+
+        metrics = pool.metrics()
+        assert metrics["busy"] == 0
+        assert metrics["completed"] == 3
+
+        pool.shutdown()
+
+    async def test_pools_are_isolated(self):
+        """Test stalled pool doesn't block other pools"""
+
+        pools = ExecutorPools({POOL_ETHEREUM: 1})
+        release = threading.Event()
+
+        stalled = asyncio.ensure_future(pools.run(POOL_ETHEREUM, release.wait))
+
+        result = await asyncio.wait_for(
+            pools.run(POOL_CANONICALISATION, sum, [1, 2]), timeout=1
+        )
+        assert result == 3
+
+        release.set()
+        await stalled
+
+        pools.shutdown()
+
+    async def test_run_in_pool(self):
+        """Test running in pool bound to context and without pools"""
+
+        context = InjectionContext()
+
+        # Called directly if pools are not bound
+        assert await run_in_pool(context, POOL_ETHEREUM, max, 1, 2) == 2
+
+        pools = ExecutorPools()
+        context.injector.bind_instance(ExecutorPools, pools)
+
+        thread_name = await run_in_pool(
+            context, POOL_ETHEREUM, lambda: threading.current_thread().name
+        )
+        assert thread_name.startswith("dexa-ethereum")
+        assert pools.metrics()[POOL_ETHEREUM]["completed"] == 1
+
+        pools.shutdown()
@@ -0,0 +1,23 @@
+from asynctest import TestCase as AsyncTestCase
+from dexa_sdk.utils.import_profile import (
+    LAZY_MODULES,
+    STARTUP_IMPORT_BUDGET,
+    STARTUP_MODULE,
+    cumulative_time,
+    profile_imports,
+)
+
+
+class TestImportProfile(AsyncTestCase):
+    """Test startup import budget"""
+
+    async def test_startup_import_budget(self):
+        """Test backends are not imported on startup and imports are within budget"""
+
+        timings = profile_imports(STARTUP_MODULE)
+        imported = {timing.module for timing in timings}
+
+        for module in LAZY_MODULES:
+            assert module not in imported, f"{module} is imported on startup"
+
+        assert cumulative_time(timings, STARTUP_MODULE) < STARTUP_IMPORT_BUDGET
@@ -1,6 +1,12 @@
 import semver
 from asynctest import TestCase as AsyncTestCase
-from dexa_sdk.utils.utils import bump_major_for_semver_string, paginate
+from aries_cloudagent.wallet.basic import BasicWallet
+from dexa_sdk.utils.utils import (
+    bump_major_for_semver_string,
+    create_jwt,
+    decode_jwt_claims,
+    paginate,
+)
 
 
 class TestUtils(AsyncTestCase):
@@ -37,3 +43,14 @@ class TestUtils(AsyncTestCase):
         paginate_res = paginate(items, page, 1)
 
         assert paginate_res.results == [5]
+
+    async def test_decode_jwt_claims(self):
+        """Test decode jwt claims"""
+
+        wallet = BasicWallet()
+        did_info = await wallet.create_local_did()
+
+        claims = {"nonce": "abc", "exp": 1700007200}
+        token = await create_jwt(claims, did_info.verkey, wallet)
+
+        assert decode_jwt_claims(token) == claims
@@ -9,12 +9,28 @@ import aiohttp
 import jcs
 import semver
 from aries_cloudagent.config.injection_context import InjectionContext
-from aries_cloudagent.messaging.jsonld.credential import (
+from aries_cloudagent.messaging.models.base_record import BaseRecord
+from aries_cloudagent.storage.base import BaseStorage
+from aries_cloudagent.wallet.util import (
     b64_to_bytes,
-    b64encode,
+    b64_to_str,
     bytes_to_b64,
+    str_to_b64,
 )
-from aries_cloudagent.messaging.models.base_record import BaseRecord
+
+
+def b64encode(str):
+    """Url Safe B64 Encode.
+
+    Same as the aries JSON-LD credential helper, which is not imported
+    here as it loads PyLD.
+    """
+    return str_to_b64(str, urlsafe=True, pad=False)
+
+
+def b64decode(bytes):
+    """Url Safe B64 Decode."""
+    return b64_to_str(bytes, urlsafe=True)
 
 
 def jcs_rfc8785(data: typing.Union[list, dict]) -> bytes:
@@ -206,6 +222,41 @@ def paginate_records(
     return res
 
 
+async def iter_records(
+    context: InjectionContext,
+    record_cls: typing.Type[BaseRecord],
+    tag_filter: dict = None,
+    page_size: int = 100,
+) -> typing.AsyncIterator[BaseRecord]:
+    """Iterate records in storage order, fetching a page at a time
+
+    Unlike `BaseRecord.query`, records are not collected in a list, so that
+    memory stays flat regardless of the number of records.
+
+    Args:
+        context (InjectionContext): Injection context to be used.
+        record_cls (typing.Type[BaseRecord]): Record class
+        tag_filter (dict, optional): Tag filter. Defaults to None.
+        page_size (int, optional): Records fetched at a time. Defaults to 100.
+
+    Returns:
+        typing.AsyncIterator[BaseRecord]: records
+    """
+    storage: BaseStorage = await context.inject(BaseStorage)
+    search = storage.search_records(
+        record_cls.RECORD_TYPE,
+        record_cls.prefix_tag_filter(tag_filter),
+        page_size,
+        {"retrieveTags": False},
+    )
+    try:
+        async for record in search:
+            yield record_cls.from_storage(record.id, json.loads(record.value))
+    finally:
+        # Search is left open if the iteration stops early
+        await search.close()
+
+
 def clean_and_get_field_from_dict(
     input: dict, key: str
 ) -> typing.Union[None, typing.Any]:
@@ -384,3 +435,18 @@ async def verify_jwt(token: str, public_key, wallet) -> bool:
     verified = await wallet.verify_message(tbv, decoded_signature, public_key)
 
     return verified
+
+
+def decode_jwt_claims(token: str) -> dict:
+    """Decode JWT claims without verifying the signature
+
+    Args:
+        token (str): JWT
+
+    Returns:
+        dict: claims
+    """
+
+    _, encoded_payload, _ = token.split(".")
+
+    return json.loads(b64decode(encoded_payload))